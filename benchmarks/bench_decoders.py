@@ -0,0 +1,81 @@
+"""Objects per second built by the generated ``from_dict`` methods and by the compiled decoders.
+
+Run with ``python benchmarks/bench_decoders.py``.
+"""
+
+import timeit
+from typing import Any
+
+from hevy_api_client.decoders import compile_all, decode
+from hevy_api_client.models import GetV1WorkoutsResponse200
+
+
+def workouts_page(n_workouts: int = 10, n_exercises: int = 6, n_sets: int = 4) -> dict[str, Any]:
+    return {
+        "page": 1,
+        "page_count": 1,
+        "workouts": [
+            {
+                "id": f"workout-{w}",
+                "title": "Morning Workout",
+                "description": "",
+                "start_time": "2024-01-01T08:00:00Z",
+                "end_time": "2024-01-01T09:00:00Z",
+                "updated_at": "2024-01-01T09:00:00Z",
+                "created_at": "2024-01-01T09:00:00Z",
+                "exercises": [
+                    {
+                        "index": e,
+                        "title": "Bench Press (Barbell)",
+                        "notes": "",
+                        "exercise_template_id": "79D0BB3A",
+                        "supersets_id": None,
+                        "sets": [
+                            {
+                                "index": s,
+                                "type": "normal",
+                                "weight_kg": 100,
+                                "reps": 10,
+                                "distance_meters": None,
+                                "duration_seconds": None,
+                                "rpe": None,
+                                "custom_metric": None,
+                            }
+                            for s in range(n_sets)
+                        ],
+                    }
+                    for e in range(n_exercises)
+                ],
+            }
+            for w in range(n_workouts)
+        ],
+    }
+
+
+def count_objects(page: dict[str, Any]) -> int:
+    """The page itself, plus every workout, exercise and set"""
+    total = 1
+    for workout in page["workouts"]:
+        total += 1
+        for exercise in workout["exercises"]:
+            total += 1 + len(exercise["sets"])
+    return total
+
+
+def main() -> None:
+    page = workouts_page()
+    n_objects = count_objects(page)
+    number = 200
+
+    compile_all()
+    assert decode(GetV1WorkoutsResponse200, page) == GetV1WorkoutsResponse200.from_dict(page)
+
+    before = timeit.timeit(lambda: GetV1WorkoutsResponse200.from_dict(page), number=number)
+    after = timeit.timeit(lambda: decode(GetV1WorkoutsResponse200, page), number=number)
+
+    print(f"from_dict: {n_objects * number / before:>12,.0f} objects/s")
+    print(f"compiled:  {n_objects * number / after:>12,.0f} objects/s  speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Routine bodies per second serialised by ``to_dict`` + ``json.dumps`` (what httpx did with ``json=``) and by the
+compiled encoders.
+
+Run with ``python benchmarks/bench_encoders.py``.
+"""
+
+import json
+import timeit
+
+from hevy_api_client.encoders import get_encoder, to_json_bytes
+from hevy_api_client.jsonlib import get_json_backend
+from hevy_api_client.models import (
+    PostRoutinesRequestBody,
+    PostRoutinesRequestBodyRoutine,
+    PostRoutinesRequestExercise,
+    PostRoutinesRequestSet,
+    PostRoutinesRequestSetType,
+)
+
+
+def routine_body(n_exercises: int = 8, n_sets: int = 4) -> PostRoutinesRequestBody:
+    return PostRoutinesRequestBody(
+        routine=PostRoutinesRequestBodyRoutine(
+            title="April Leg Day",
+            folder_id=None,
+            notes="Focus on form over weight.",
+            exercises=[
+                PostRoutinesRequestExercise(
+                    exercise_template_id="D04AC939",
+                    superset_id=None,
+                    rest_seconds=90,
+                    notes="Stay slow and controlled.",
+                    sets=[
+                        PostRoutinesRequestSet(type_=PostRoutinesRequestSetType.NORMAL, weight_kg=100, reps=10)
+                        for _ in range(n_sets)
+                    ],
+                )
+                for _ in range(n_exercises)
+            ],
+        )
+    )
+
+
+def main() -> None:
+    body = routine_body()
+    number = 2_000
+    backend = get_json_backend()
+
+    assert get_encoder(PostRoutinesRequestBody)(body) == body.to_dict()
+
+    before = timeit.timeit(lambda: json.dumps(body.to_dict()).encode(), number=number)
+    encoder_only = timeit.timeit(lambda: json.dumps(get_encoder(PostRoutinesRequestBody)(body)).encode(), number=number)
+    after = timeit.timeit(lambda: to_json_bytes(body), number=number)
+
+    print(f"to_dict + json.dumps:   {number / before:>10,.0f} bodies/s")
+    print(f"encoder + json.dumps:   {number / encoder_only:>10,.0f} bodies/s  speedup: {before / encoder_only:.2f}x")
+    print(f"to_json_bytes ({backend.name}): {number / after:>10,.0f} bodies/s  speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
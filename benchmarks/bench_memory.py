@@ -0,0 +1,49 @@
+"""Bytes allocated per set, exercise and workout by ``from_dict`` and by the compact compiled decoders.
+
+Each workout of the sample page has 6 exercises of 4 sets; the exercise and workout figures include everything they
+contain. Measured with tracemalloc, so the source JSON (whose strings the models share) is not counted.
+
+Run with ``python benchmarks/bench_memory.py``.
+"""
+
+import gc
+import tracemalloc
+from collections.abc import Mapping
+from typing import Any, Callable
+
+from bench_decoders import workouts_page
+
+from hevy_api_client.decoders import compile_all, decode
+from hevy_api_client.models import Workout, WorkoutExercisesItem, WorkoutExercisesItemSetsItem
+
+
+def bytes_per_object(build: Callable[[Mapping[str, Any]], Any], items: list[dict[str, Any]]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    built = [build(item) for item in items]
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    del built
+    return size / len(items)
+
+
+def main() -> None:
+    workouts = workouts_page(n_workouts=2_000)["workouts"]
+    exercises = [exercise for workout in workouts for exercise in workout["exercises"]]
+    sets = [set_ for exercise in exercises for set_ in exercise["sets"]]
+
+    compile_all()
+    for label, cls, items in (
+        ("set", WorkoutExercisesItemSetsItem, sets),
+        ("exercise", WorkoutExercisesItem, exercises),
+        ("workout", Workout, workouts),
+    ):
+        before = bytes_per_object(cls.from_dict, items)
+        after = bytes_per_object(lambda item, cls=cls: decode(cls, item, compact=True), items)
+        print(f"{label:<9} from_dict: {before:>8,.0f} B   compact: {after:>8,.0f} B   saved: {1 - after / before:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Startup cost of ``hevy --help``, checked against a budget.
+
+Reports the wall time of ``hevy --help`` (best of a few runs) and, from ``python -X importtime``, the cumulative
+import time of ``hevy_api_client.cli`` and the slowest modules it imports. Typer alone takes most of both (well over
+100 ms on a typical machine), so the budgets apply to what the CLI adds on top of it: the import time of
+``hevy_api_client.cli`` minus that of ``typer``, and the wall time of ``hevy --help`` minus that of a process that
+only imports ``typer``. Exits with status 1 when either is over budget, so it can run in CI.
+
+Run with ``python benchmarks/bench_startup.py``.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+# budgets for what the CLI adds to the import of typer (about 10 ms when measured) and to a process that only
+# imports typer (about 45 ms)
+IMPORT_BUDGET_MS = 30
+HELP_BUDGET_MS = 100
+
+HELP = "import sys; sys.argv = ['hevy', '--help']; from hevy_api_client.cli import cli_entrypoint; cli_entrypoint()"
+BASELINE = "import typer"
+
+
+def wall_time(code: str, runs: int = 5) -> float:
+    env = {k: v for k, v in os.environ.items() if k != "HEVY_API_TOKEN"}
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], env=env, stdout=subprocess.DEVNULL, check=False)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def import_times() -> list[tuple[str, int, int]]:
+    """(module, self us, cumulative us) of every module imported by ``import hevy_api_client.cli``"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import hevy_api_client.cli"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    times = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        times.append((module.strip(), int(self_us), int(cumulative_us)))
+    return times
+
+
+def main() -> None:
+    times = import_times()
+    cumulative = {module: us / 1000 for module, _, us in times}
+    cli_ms, help_ms = cumulative["hevy_api_client.cli"], wall_time(HELP)
+    import_over, help_over = cli_ms - cumulative["typer"], help_ms - wall_time(BASELINE)
+
+    print("slowest imports (self time):")
+    for module, self_us, _ in sorted(times, key=lambda t: t[1], reverse=True)[:10]:
+        print(f"  {self_us / 1000:>7.1f} ms  {module}")
+    print(f"import hevy_api_client.cli: {cli_ms:>7.1f} ms, {import_over:>5.1f} over typer (budget {IMPORT_BUDGET_MS})")
+    print(f"hevy --help:                {help_ms:>7.1f} ms, {help_over:>5.1f} over typer (budget {HELP_BUDGET_MS})")
+
+    if import_over > IMPORT_BUDGET_MS or help_over > HELP_BUDGET_MS:
+        print("over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
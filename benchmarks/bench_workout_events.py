@@ -0,0 +1,79 @@
+"""Event-page parse throughput of PaginatedWorkoutEvents.from_dict, compared with the previous try/except parser.
+
+Run with ``python benchmarks/bench_workout_events.py``.
+"""
+
+import timeit
+from typing import Any, Union
+
+from hevy_api_client.models import DeletedWorkout, PaginatedWorkoutEvents, UpdatedWorkout
+
+
+def _workout(i: int) -> dict[str, Any]:
+    return {
+        "id": f"workout-{i}",
+        "title": "Morning Workout",
+        "start_time": "2024-01-01T08:00:00Z",
+        "end_time": "2024-01-01T09:00:00Z",
+        "updated_at": "2024-01-01T09:00:00Z",
+        "created_at": "2024-01-01T09:00:00Z",
+        "exercises": [
+            {
+                "index": e,
+                "title": "Bench Press (Barbell)",
+                "exercise_template_id": "79D0BB3A",
+                "sets": [{"index": s, "type": "normal", "weight_kg": 100, "reps": 10} for s in range(4)],
+            }
+            for e in range(5)
+        ],
+    }
+
+
+def event_page(size: int = 100, deleted_ratio: float = 0.5) -> dict[str, Any]:
+    n_deleted = int(size * deleted_ratio)
+    events: list[dict[str, Any]] = [
+        {"type": "deleted", "id": f"deleted-{i}", "deleted_at": "2024-01-02T00:00:00Z"} for i in range(n_deleted)
+    ]
+    events += [{"type": "updated", "workout": _workout(i)} for i in range(size - n_deleted)]
+    return {"page": 1, "page_count": 1, "events": events}
+
+
+def legacy_parse_events(src_dict: dict[str, Any]) -> list[Union[DeletedWorkout, UpdatedWorkout]]:
+    """The parser generated before the discriminator dispatch, kept for comparison"""
+    events = []
+    for events_item_data in src_dict["events"]:
+
+        def _parse_events_item(data: object) -> Union[DeletedWorkout, UpdatedWorkout]:
+            try:
+                if not isinstance(data, dict):
+                    raise TypeError()
+                return UpdatedWorkout.from_dict(data)
+            except:  # noqa: E722
+                pass
+            if not isinstance(data, dict):
+                raise TypeError()
+            return DeletedWorkout.from_dict(data)
+
+        events.append(_parse_events_item(events_item_data))
+    return events
+
+
+def main() -> None:
+    for deleted_ratio in (0.0, 0.5, 1.0):
+        page = event_page(deleted_ratio=deleted_ratio)
+        n_events = len(page["events"])
+        number = 50
+
+        before = timeit.timeit(lambda: legacy_parse_events(page), number=number)
+        after = timeit.timeit(lambda: PaginatedWorkoutEvents.from_dict(page), number=number)
+
+        print(
+            f"deleted={deleted_ratio:>4.0%}  "
+            f"before: {n_events * number / before:>10,.0f} events/s  "
+            f"after: {n_events * number / after:>10,.0f} events/s  "
+            f"speedup: {before / after:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
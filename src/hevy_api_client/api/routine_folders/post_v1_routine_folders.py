@@ -1,11 +1,12 @@
 from http import HTTPStatus
-from typing import Any, Optional, Union
+from typing import Any, Literal, Optional, Union, overload
 from uuid import UUID
 
 import httpx
 
-from ... import errors
+from ... import caching, decoders, errors
 from ...client import AuthenticatedClient, Client
+from ...jsonlib import JsonBackend
 from ...models.post_routine_folder_request_body import PostRoutineFolderRequestBody
 from ...models.post_v1_routine_folders_response_400 import PostV1RoutineFoldersResponse400
 from ...models.routine_folder import RoutineFolder
@@ -16,6 +17,7 @@ def _get_kwargs(
     *,
     body: PostRoutineFolderRequestBody,
     api_key: UUID,
+    json_backend: Optional[JsonBackend] = None,
 ) -> dict[str, Any]:
     headers: dict[str, Any] = {}
     headers["api-key"] = api_key
@@ -25,9 +27,7 @@ def _get_kwargs(
         "url": "/v1/routine_folders",
     }
 
-    _body = body.to_dict()
-
-    _kwargs["json"] = _body
+    _kwargs["content"] = body.to_json_bytes(json_backend)
     headers["Content-Type"] = "application/json"
 
     _kwargs["headers"] = headers
@@ -35,14 +35,14 @@ def _get_kwargs(
 
 
 def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[PostV1RoutineFoldersResponse400, RoutineFolder]]:
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response, parse: bool = True
+) -> Optional[Union[Any, PostV1RoutineFoldersResponse400, RoutineFolder]]:
     if response.status_code == 201:
-        response_201 = RoutineFolder.from_dict(response.json())
+        response_201 = decoders.from_response(client, RoutineFolder, response, parse=parse)
 
         return response_201
     if response.status_code == 400:
-        response_400 = PostV1RoutineFoldersResponse400.from_dict(response.json())
+        response_400 = decoders.from_response(client, PostV1RoutineFoldersResponse400, response, parse=parse)
 
         return response_400
     if client.raise_on_unexpected_status:
@@ -52,28 +52,65 @@ def _parse_response(
 
 
 def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[PostV1RoutineFoldersResponse400, RoutineFolder]]:
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response, parse: bool = True
+) -> Response[Union[Any, PostV1RoutineFoldersResponse400, RoutineFolder]]:
+    parsed = _parse_response(client=client, response=response, parse=parse)
+    if response.status_code == 201:
+        caching.write_through(client, "/v1/routine_folders", "routine_folder", parsed)
+
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
+        parsed=parsed,
     )
 
 
+@overload
+def sync_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutineFolderRequestBody,
+    api_key: UUID,
+    parse: Literal[True] = True,
+) -> Response[Union[PostV1RoutineFoldersResponse400, RoutineFolder]]: ...
+
+
+@overload
+def sync_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutineFolderRequestBody,
+    api_key: UUID,
+    parse: Literal[False],
+) -> Response[Any]: ...
+
+
+@overload
+def sync_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutineFolderRequestBody,
+    api_key: UUID,
+    parse: bool = ...,
+) -> Response[Union[Any, PostV1RoutineFoldersResponse400, RoutineFolder]]: ...
+
+
 def sync_detailed(
     *,
     client: Union[AuthenticatedClient, Client],
     body: PostRoutineFolderRequestBody,
     api_key: UUID,
-) -> Response[Union[PostV1RoutineFoldersResponse400, RoutineFolder]]:
+    parse: bool = True,
+) -> Response[Union[Any, PostV1RoutineFoldersResponse400, RoutineFolder]]:
     """Create a new routine folder. The folder will be created at index 0, and all other folders will have
     their indexes incremented.
 
     Args:
         api_key (UUID):
         body (PostRoutineFolderRequestBody):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -86,13 +123,42 @@ def sync_detailed(
     kwargs = _get_kwargs(
         body=body,
         api_key=api_key,
+        json_backend=client.json_backend,
     )
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+    response = caching.request(client, **kwargs)
+
+    return _build_response(client=client, response=response, parse=parse)
+
+
+@overload
+def sync(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutineFolderRequestBody,
+    api_key: UUID,
+    parse: Literal[True] = True,
+) -> Optional[Union[PostV1RoutineFoldersResponse400, RoutineFolder]]: ...
 
-    return _build_response(client=client, response=response)
+
+@overload
+def sync(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutineFolderRequestBody,
+    api_key: UUID,
+    parse: Literal[False],
+) -> Any: ...
+
+
+@overload
+def sync(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutineFolderRequestBody,
+    api_key: UUID,
+    parse: bool = ...,
+) -> Optional[Union[Any, PostV1RoutineFoldersResponse400, RoutineFolder]]: ...
 
 
 def sync(
@@ -100,13 +166,16 @@ def sync(
     client: Union[AuthenticatedClient, Client],
     body: PostRoutineFolderRequestBody,
     api_key: UUID,
-) -> Optional[Union[PostV1RoutineFoldersResponse400, RoutineFolder]]:
+    parse: bool = True,
+) -> Optional[Union[Any, PostV1RoutineFoldersResponse400, RoutineFolder]]:
     """Create a new routine folder. The folder will be created at index 0, and all other folders will have
     their indexes incremented.
 
     Args:
         api_key (UUID):
         body (PostRoutineFolderRequestBody):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -120,21 +189,55 @@ def sync(
         client=client,
         body=body,
         api_key=api_key,
+        parse=parse,
     ).parsed
 
 
+@overload
+async def asyncio_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutineFolderRequestBody,
+    api_key: UUID,
+    parse: Literal[True] = True,
+) -> Response[Union[PostV1RoutineFoldersResponse400, RoutineFolder]]: ...
+
+
+@overload
+async def asyncio_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutineFolderRequestBody,
+    api_key: UUID,
+    parse: Literal[False],
+) -> Response[Any]: ...
+
+
+@overload
+async def asyncio_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutineFolderRequestBody,
+    api_key: UUID,
+    parse: bool = ...,
+) -> Response[Union[Any, PostV1RoutineFoldersResponse400, RoutineFolder]]: ...
+
+
 async def asyncio_detailed(
     *,
     client: Union[AuthenticatedClient, Client],
     body: PostRoutineFolderRequestBody,
     api_key: UUID,
-) -> Response[Union[PostV1RoutineFoldersResponse400, RoutineFolder]]:
+    parse: bool = True,
+) -> Response[Union[Any, PostV1RoutineFoldersResponse400, RoutineFolder]]:
     """Create a new routine folder. The folder will be created at index 0, and all other folders will have
     their indexes incremented.
 
     Args:
         api_key (UUID):
         body (PostRoutineFolderRequestBody):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -147,11 +250,42 @@ async def asyncio_detailed(
     kwargs = _get_kwargs(
         body=body,
         api_key=api_key,
+        json_backend=client.json_backend,
     )
 
-    response = await client.get_async_httpx_client().request(**kwargs)
+    response = await caching.arequest(client, **kwargs)
+
+    return _build_response(client=client, response=response, parse=parse)
+
+
+@overload
+async def asyncio(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutineFolderRequestBody,
+    api_key: UUID,
+    parse: Literal[True] = True,
+) -> Optional[Union[PostV1RoutineFoldersResponse400, RoutineFolder]]: ...
+
+
+@overload
+async def asyncio(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutineFolderRequestBody,
+    api_key: UUID,
+    parse: Literal[False],
+) -> Any: ...
+
 
-    return _build_response(client=client, response=response)
+@overload
+async def asyncio(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutineFolderRequestBody,
+    api_key: UUID,
+    parse: bool = ...,
+) -> Optional[Union[Any, PostV1RoutineFoldersResponse400, RoutineFolder]]: ...
 
 
 async def asyncio(
@@ -159,13 +293,16 @@ async def asyncio(
     client: Union[AuthenticatedClient, Client],
     body: PostRoutineFolderRequestBody,
     api_key: UUID,
-) -> Optional[Union[PostV1RoutineFoldersResponse400, RoutineFolder]]:
+    parse: bool = True,
+) -> Optional[Union[Any, PostV1RoutineFoldersResponse400, RoutineFolder]]:
     """Create a new routine folder. The folder will be created at index 0, and all other folders will have
     their indexes incremented.
 
     Args:
         api_key (UUID):
         body (PostRoutineFolderRequestBody):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -180,5 +317,6 @@ async def asyncio(
             client=client,
             body=body,
             api_key=api_key,
+            parse=parse,
         )
     ).parsed
@@ -1,10 +1,10 @@
 from http import HTTPStatus
-from typing import Any, Optional, Union, cast
+from typing import Any, Literal, Optional, Union, cast, overload
 from uuid import UUID
 
 import httpx
 
-from ... import errors
+from ... import caching, decoders, errors
 from ...client import AuthenticatedClient, Client
 from ...models.get_v1_routines_response_200 import GetV1RoutinesResponse200
 from ...types import UNSET, Response, Unset
@@ -38,10 +38,10 @@ def _get_kwargs(
 
 
 def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response, parse: bool = True
 ) -> Optional[Union[Any, GetV1RoutinesResponse200]]:
     if response.status_code == 200:
-        response_200 = GetV1RoutinesResponse200.from_dict(response.json())
+        response_200 = decoders.from_response(client, GetV1RoutinesResponse200, response, parse=parse)
 
         return response_200
     if response.status_code == 400:
@@ -54,22 +54,56 @@ def _parse_response(
 
 
 def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response, parse: bool = True
 ) -> Response[Union[Any, GetV1RoutinesResponse200]]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
+        parsed=_parse_response(client=client, response=response, parse=parse),
     )
 
 
+@overload
 def sync_detailed(
     *,
     client: Union[AuthenticatedClient, Client],
     page: Union[Unset, int] = 1,
     page_size: Union[Unset, int] = 5,
     api_key: UUID,
+    parse: Literal[True] = True,
+) -> Response[Union[Any, GetV1RoutinesResponse200]]: ...
+
+
+@overload
+def sync_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    api_key: UUID,
+    parse: Literal[False],
+) -> Response[Any]: ...
+
+
+@overload
+def sync_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    api_key: UUID,
+    parse: bool = ...,
+) -> Response[Union[Any, GetV1RoutinesResponse200]]: ...
+
+
+def sync_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    api_key: UUID,
+    parse: bool = True,
 ) -> Response[Union[Any, GetV1RoutinesResponse200]]:
     """Get a paginated list of routines
 
@@ -77,6 +111,8 @@ def sync_detailed(
         page (Union[Unset, int]):  Default: 1.
         page_size (Union[Unset, int]):  Default: 5.
         api_key (UUID):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -92,11 +128,42 @@ def sync_detailed(
         api_key=api_key,
     )
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+    response = caching.request(client, **kwargs)
 
-    return _build_response(client=client, response=response)
+    return _build_response(client=client, response=response, parse=parse)
+
+
+@overload
+def sync(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    api_key: UUID,
+    parse: Literal[True] = True,
+) -> Optional[Union[Any, GetV1RoutinesResponse200]]: ...
+
+
+@overload
+def sync(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    api_key: UUID,
+    parse: Literal[False],
+) -> Any: ...
+
+
+@overload
+def sync(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    api_key: UUID,
+    parse: bool = ...,
+) -> Optional[Union[Any, GetV1RoutinesResponse200]]: ...
 
 
 def sync(
@@ -105,6 +172,7 @@ def sync(
     page: Union[Unset, int] = 1,
     page_size: Union[Unset, int] = 5,
     api_key: UUID,
+    parse: bool = True,
 ) -> Optional[Union[Any, GetV1RoutinesResponse200]]:
     """Get a paginated list of routines
 
@@ -112,6 +180,8 @@ def sync(
         page (Union[Unset, int]):  Default: 1.
         page_size (Union[Unset, int]):  Default: 5.
         api_key (UUID):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -126,15 +196,50 @@ def sync(
         page=page,
         page_size=page_size,
         api_key=api_key,
+        parse=parse,
     ).parsed
 
 
+@overload
 async def asyncio_detailed(
     *,
     client: Union[AuthenticatedClient, Client],
     page: Union[Unset, int] = 1,
     page_size: Union[Unset, int] = 5,
     api_key: UUID,
+    parse: Literal[True] = True,
+) -> Response[Union[Any, GetV1RoutinesResponse200]]: ...
+
+
+@overload
+async def asyncio_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    api_key: UUID,
+    parse: Literal[False],
+) -> Response[Any]: ...
+
+
+@overload
+async def asyncio_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    api_key: UUID,
+    parse: bool = ...,
+) -> Response[Union[Any, GetV1RoutinesResponse200]]: ...
+
+
+async def asyncio_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    api_key: UUID,
+    parse: bool = True,
 ) -> Response[Union[Any, GetV1RoutinesResponse200]]:
     """Get a paginated list of routines
 
@@ -142,6 +247,8 @@ async def asyncio_detailed(
         page (Union[Unset, int]):  Default: 1.
         page_size (Union[Unset, int]):  Default: 5.
         api_key (UUID):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -157,9 +264,42 @@ async def asyncio_detailed(
         api_key=api_key,
     )
 
-    response = await client.get_async_httpx_client().request(**kwargs)
+    response = await caching.arequest(client, **kwargs)
 
-    return _build_response(client=client, response=response)
+    return _build_response(client=client, response=response, parse=parse)
+
+
+@overload
+async def asyncio(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    api_key: UUID,
+    parse: Literal[True] = True,
+) -> Optional[Union[Any, GetV1RoutinesResponse200]]: ...
+
+
+@overload
+async def asyncio(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    api_key: UUID,
+    parse: Literal[False],
+) -> Any: ...
+
+
+@overload
+async def asyncio(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    api_key: UUID,
+    parse: bool = ...,
+) -> Optional[Union[Any, GetV1RoutinesResponse200]]: ...
 
 
 async def asyncio(
@@ -168,6 +308,7 @@ async def asyncio(
     page: Union[Unset, int] = 1,
     page_size: Union[Unset, int] = 5,
     api_key: UUID,
+    parse: bool = True,
 ) -> Optional[Union[Any, GetV1RoutinesResponse200]]:
     """Get a paginated list of routines
 
@@ -175,6 +316,8 @@ async def asyncio(
         page (Union[Unset, int]):  Default: 1.
         page_size (Union[Unset, int]):  Default: 5.
         api_key (UUID):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -190,5 +333,6 @@ async def asyncio(
             page=page,
             page_size=page_size,
             api_key=api_key,
+            parse=parse,
         )
     ).parsed
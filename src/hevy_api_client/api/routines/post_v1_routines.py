@@ -1,11 +1,12 @@
 from http import HTTPStatus
-from typing import Any, Optional, Union
+from typing import Any, Literal, Optional, Union, overload
 from uuid import UUID
 
 import httpx
 
-from ... import errors
+from ... import caching, decoders, errors
 from ...client import AuthenticatedClient, Client
+from ...jsonlib import JsonBackend
 from ...models.post_routines_request_body import PostRoutinesRequestBody
 from ...models.post_v1_routines_response_400 import PostV1RoutinesResponse400
 from ...models.post_v1_routines_response_403 import PostV1RoutinesResponse403
@@ -17,6 +18,7 @@ def _get_kwargs(
     *,
     body: PostRoutinesRequestBody,
     api_key: UUID,
+    json_backend: Optional[JsonBackend] = None,
 ) -> dict[str, Any]:
     headers: dict[str, Any] = {}
     headers["api-key"] = api_key
@@ -26,9 +28,7 @@ def _get_kwargs(
         "url": "/v1/routines",
     }
 
-    _body = body.to_dict()
-
-    _kwargs["json"] = _body
+    _kwargs["content"] = body.to_json_bytes(json_backend)
     headers["Content-Type"] = "application/json"
 
     _kwargs["headers"] = headers
@@ -36,18 +36,18 @@ def _get_kwargs(
 
 
 def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[Union[PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]:
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response, parse: bool = True
+) -> Optional[Union[Any, PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]:
     if response.status_code == 201:
-        response_201 = Routine.from_dict(response.json())
+        response_201 = decoders.from_response(client, Routine, response, parse=parse)
 
         return response_201
     if response.status_code == 400:
-        response_400 = PostV1RoutinesResponse400.from_dict(response.json())
+        response_400 = decoders.from_response(client, PostV1RoutinesResponse400, response, parse=parse)
 
         return response_400
     if response.status_code == 403:
-        response_403 = PostV1RoutinesResponse403.from_dict(response.json())
+        response_403 = decoders.from_response(client, PostV1RoutinesResponse403, response, parse=parse)
 
         return response_403
     if client.raise_on_unexpected_status:
@@ -57,27 +57,64 @@ def _parse_response(
 
 
 def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[Union[PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]:
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response, parse: bool = True
+) -> Response[Union[Any, PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]:
+    parsed = _parse_response(client=client, response=response, parse=parse)
+    if response.status_code == 201:
+        caching.write_through(client, "/v1/routines", "routine", parsed)
+
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
+        parsed=parsed,
     )
 
 
+@overload
+def sync_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutinesRequestBody,
+    api_key: UUID,
+    parse: Literal[True] = True,
+) -> Response[Union[PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]: ...
+
+
+@overload
+def sync_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutinesRequestBody,
+    api_key: UUID,
+    parse: Literal[False],
+) -> Response[Any]: ...
+
+
+@overload
+def sync_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutinesRequestBody,
+    api_key: UUID,
+    parse: bool = ...,
+) -> Response[Union[Any, PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]: ...
+
+
 def sync_detailed(
     *,
     client: Union[AuthenticatedClient, Client],
     body: PostRoutinesRequestBody,
     api_key: UUID,
-) -> Response[Union[PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]:
+    parse: bool = True,
+) -> Response[Union[Any, PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]:
     """Create a new routine
 
     Args:
         api_key (UUID):
         body (PostRoutinesRequestBody):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -90,13 +127,42 @@ def sync_detailed(
     kwargs = _get_kwargs(
         body=body,
         api_key=api_key,
+        json_backend=client.json_backend,
     )
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+    response = caching.request(client, **kwargs)
+
+    return _build_response(client=client, response=response, parse=parse)
+
+
+@overload
+def sync(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutinesRequestBody,
+    api_key: UUID,
+    parse: Literal[True] = True,
+) -> Optional[Union[PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]: ...
 
-    return _build_response(client=client, response=response)
+
+@overload
+def sync(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutinesRequestBody,
+    api_key: UUID,
+    parse: Literal[False],
+) -> Any: ...
+
+
+@overload
+def sync(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutinesRequestBody,
+    api_key: UUID,
+    parse: bool = ...,
+) -> Optional[Union[Any, PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]: ...
 
 
 def sync(
@@ -104,12 +170,15 @@ def sync(
     client: Union[AuthenticatedClient, Client],
     body: PostRoutinesRequestBody,
     api_key: UUID,
-) -> Optional[Union[PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]:
+    parse: bool = True,
+) -> Optional[Union[Any, PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]:
     """Create a new routine
 
     Args:
         api_key (UUID):
         body (PostRoutinesRequestBody):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -123,20 +192,54 @@ def sync(
         client=client,
         body=body,
         api_key=api_key,
+        parse=parse,
     ).parsed
 
 
+@overload
+async def asyncio_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutinesRequestBody,
+    api_key: UUID,
+    parse: Literal[True] = True,
+) -> Response[Union[PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]: ...
+
+
+@overload
+async def asyncio_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutinesRequestBody,
+    api_key: UUID,
+    parse: Literal[False],
+) -> Response[Any]: ...
+
+
+@overload
+async def asyncio_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutinesRequestBody,
+    api_key: UUID,
+    parse: bool = ...,
+) -> Response[Union[Any, PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]: ...
+
+
 async def asyncio_detailed(
     *,
     client: Union[AuthenticatedClient, Client],
     body: PostRoutinesRequestBody,
     api_key: UUID,
-) -> Response[Union[PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]:
+    parse: bool = True,
+) -> Response[Union[Any, PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]:
     """Create a new routine
 
     Args:
         api_key (UUID):
         body (PostRoutinesRequestBody):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -149,11 +252,42 @@ async def asyncio_detailed(
     kwargs = _get_kwargs(
         body=body,
         api_key=api_key,
+        json_backend=client.json_backend,
     )
 
-    response = await client.get_async_httpx_client().request(**kwargs)
+    response = await caching.arequest(client, **kwargs)
+
+    return _build_response(client=client, response=response, parse=parse)
+
+
+@overload
+async def asyncio(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutinesRequestBody,
+    api_key: UUID,
+    parse: Literal[True] = True,
+) -> Optional[Union[PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]: ...
+
+
+@overload
+async def asyncio(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutinesRequestBody,
+    api_key: UUID,
+    parse: Literal[False],
+) -> Any: ...
+
 
-    return _build_response(client=client, response=response)
+@overload
+async def asyncio(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    body: PostRoutinesRequestBody,
+    api_key: UUID,
+    parse: bool = ...,
+) -> Optional[Union[Any, PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]: ...
 
 
 async def asyncio(
@@ -161,12 +295,15 @@ async def asyncio(
     client: Union[AuthenticatedClient, Client],
     body: PostRoutinesRequestBody,
     api_key: UUID,
-) -> Optional[Union[PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]:
+    parse: bool = True,
+) -> Optional[Union[Any, PostV1RoutinesResponse400, PostV1RoutinesResponse403, Routine]]:
     """Create a new routine
 
     Args:
         api_key (UUID):
         body (PostRoutinesRequestBody):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -181,5 +318,6 @@ async def asyncio(
             client=client,
             body=body,
             api_key=api_key,
+            parse=parse,
         )
     ).parsed
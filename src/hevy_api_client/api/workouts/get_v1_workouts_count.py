@@ -1,10 +1,10 @@
 from http import HTTPStatus
-from typing import Any, Optional, Union
+from typing import Any, Literal, Optional, Union, overload
 from uuid import UUID
 
 import httpx
 
-from ... import errors
+from ... import caching, decoders, errors
 from ...client import AuthenticatedClient, Client
 from ...models.get_v1_workouts_count_response_200 import GetV1WorkoutsCountResponse200
 from ...types import Response
@@ -27,10 +27,10 @@ def _get_kwargs(
 
 
 def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Optional[GetV1WorkoutsCountResponse200]:
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response, parse: bool = True
+) -> Optional[Union[Any, GetV1WorkoutsCountResponse200]]:
     if response.status_code == 200:
-        response_200 = GetV1WorkoutsCountResponse200.from_dict(response.json())
+        response_200 = decoders.from_response(client, GetV1WorkoutsCountResponse200, response, parse=parse)
 
         return response_200
     if client.raise_on_unexpected_status:
@@ -40,25 +40,55 @@ def _parse_response(
 
 
 def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
-) -> Response[GetV1WorkoutsCountResponse200]:
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response, parse: bool = True
+) -> Response[Union[Any, GetV1WorkoutsCountResponse200]]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
+        parsed=_parse_response(client=client, response=response, parse=parse),
     )
 
 
+@overload
 def sync_detailed(
     *,
     client: Union[AuthenticatedClient, Client],
     api_key: UUID,
-) -> Response[GetV1WorkoutsCountResponse200]:
+    parse: Literal[True] = True,
+) -> Response[GetV1WorkoutsCountResponse200]: ...
+
+
+@overload
+def sync_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    parse: Literal[False],
+) -> Response[Any]: ...
+
+
+@overload
+def sync_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    parse: bool = ...,
+) -> Response[Union[Any, GetV1WorkoutsCountResponse200]]: ...
+
+
+def sync_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    parse: bool = True,
+) -> Response[Union[Any, GetV1WorkoutsCountResponse200]]:
     """Get the total number of workouts on the account
 
     Args:
         api_key (UUID):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -72,22 +102,50 @@ def sync_detailed(
         api_key=api_key,
     )
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+    response = caching.request(client, **kwargs)
 
-    return _build_response(client=client, response=response)
+    return _build_response(client=client, response=response, parse=parse)
+
+
+@overload
+def sync(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    parse: Literal[True] = True,
+) -> Optional[GetV1WorkoutsCountResponse200]: ...
+
+
+@overload
+def sync(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    parse: Literal[False],
+) -> Any: ...
+
+
+@overload
+def sync(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    parse: bool = ...,
+) -> Optional[Union[Any, GetV1WorkoutsCountResponse200]]: ...
 
 
 def sync(
     *,
     client: Union[AuthenticatedClient, Client],
     api_key: UUID,
-) -> Optional[GetV1WorkoutsCountResponse200]:
+    parse: bool = True,
+) -> Optional[Union[Any, GetV1WorkoutsCountResponse200]]:
     """Get the total number of workouts on the account
 
     Args:
         api_key (UUID):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -100,18 +158,49 @@ def sync(
     return sync_detailed(
         client=client,
         api_key=api_key,
+        parse=parse,
     ).parsed
 
 
+@overload
 async def asyncio_detailed(
     *,
     client: Union[AuthenticatedClient, Client],
     api_key: UUID,
-) -> Response[GetV1WorkoutsCountResponse200]:
+    parse: Literal[True] = True,
+) -> Response[GetV1WorkoutsCountResponse200]: ...
+
+
+@overload
+async def asyncio_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    parse: Literal[False],
+) -> Response[Any]: ...
+
+
+@overload
+async def asyncio_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    parse: bool = ...,
+) -> Response[Union[Any, GetV1WorkoutsCountResponse200]]: ...
+
+
+async def asyncio_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    parse: bool = True,
+) -> Response[Union[Any, GetV1WorkoutsCountResponse200]]:
     """Get the total number of workouts on the account
 
     Args:
         api_key (UUID):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -125,20 +214,50 @@ async def asyncio_detailed(
         api_key=api_key,
     )
 
-    response = await client.get_async_httpx_client().request(**kwargs)
+    response = await caching.arequest(client, **kwargs)
 
-    return _build_response(client=client, response=response)
+    return _build_response(client=client, response=response, parse=parse)
+
+
+@overload
+async def asyncio(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    parse: Literal[True] = True,
+) -> Optional[GetV1WorkoutsCountResponse200]: ...
+
+
+@overload
+async def asyncio(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    parse: Literal[False],
+) -> Any: ...
+
+
+@overload
+async def asyncio(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    parse: bool = ...,
+) -> Optional[Union[Any, GetV1WorkoutsCountResponse200]]: ...
 
 
 async def asyncio(
     *,
     client: Union[AuthenticatedClient, Client],
     api_key: UUID,
-) -> Optional[GetV1WorkoutsCountResponse200]:
+    parse: bool = True,
+) -> Optional[Union[Any, GetV1WorkoutsCountResponse200]]:
     """Get the total number of workouts on the account
 
     Args:
         api_key (UUID):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -152,5 +271,6 @@ async def asyncio(
         await asyncio_detailed(
             client=client,
             api_key=api_key,
+            parse=parse,
         )
     ).parsed
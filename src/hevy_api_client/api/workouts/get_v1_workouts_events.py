@@ -1,10 +1,10 @@
 from http import HTTPStatus
-from typing import Any, Optional, Union, cast
+from typing import Any, Literal, Optional, Union, cast, overload
 from uuid import UUID
 
 import httpx
 
-from ... import errors
+from ... import caching, decoders, errors
 from ...client import AuthenticatedClient, Client
 from ...models.paginated_workout_events import PaginatedWorkoutEvents
 from ...types import UNSET, Response, Unset
@@ -41,10 +41,10 @@ def _get_kwargs(
 
 
 def _parse_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response, parse: bool = True
 ) -> Optional[Union[Any, PaginatedWorkoutEvents]]:
     if response.status_code == 200:
-        response_200 = PaginatedWorkoutEvents.from_dict(response.json())
+        response_200 = decoders.from_response(client, PaginatedWorkoutEvents, response, parse=parse)
 
         return response_200
     if response.status_code == 500:
@@ -57,16 +57,17 @@ def _parse_response(
 
 
 def _build_response(
-    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response, parse: bool = True
 ) -> Response[Union[Any, PaginatedWorkoutEvents]]:
     return Response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
+        parsed=_parse_response(client=client, response=response, parse=parse),
     )
 
 
+@overload
 def sync_detailed(
     *,
     client: Union[AuthenticatedClient, Client],
@@ -74,6 +75,42 @@ def sync_detailed(
     page_size: Union[Unset, int] = 5,
     since: Union[Unset, str] = "1970-01-01T00:00:00Z",
     api_key: UUID,
+    parse: Literal[True] = True,
+) -> Response[Union[Any, PaginatedWorkoutEvents]]: ...
+
+
+@overload
+def sync_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    since: Union[Unset, str] = "1970-01-01T00:00:00Z",
+    api_key: UUID,
+    parse: Literal[False],
+) -> Response[Any]: ...
+
+
+@overload
+def sync_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    since: Union[Unset, str] = "1970-01-01T00:00:00Z",
+    api_key: UUID,
+    parse: bool = ...,
+) -> Response[Union[Any, PaginatedWorkoutEvents]]: ...
+
+
+def sync_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    since: Union[Unset, str] = "1970-01-01T00:00:00Z",
+    api_key: UUID,
+    parse: bool = True,
 ) -> Response[Union[Any, PaginatedWorkoutEvents]]:
     """Retrieve a paged list of workout events (updates or deletes) since a given date. Events are ordered
     from newest to oldest. The intention is to allow clients to keep their local cache of workouts up to
@@ -86,6 +123,8 @@ def sync_detailed(
         page_size (Union[Unset, int]):  Default: 5.
         since (Union[Unset, str]):  Default: '1970-01-01T00:00:00Z'.
         api_key (UUID):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -102,11 +141,45 @@ def sync_detailed(
         api_key=api_key,
     )
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
+    response = caching.request(client, **kwargs)
 
-    return _build_response(client=client, response=response)
+    return _build_response(client=client, response=response, parse=parse)
+
+
+@overload
+def sync(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    since: Union[Unset, str] = "1970-01-01T00:00:00Z",
+    api_key: UUID,
+    parse: Literal[True] = True,
+) -> Optional[Union[Any, PaginatedWorkoutEvents]]: ...
+
+
+@overload
+def sync(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    since: Union[Unset, str] = "1970-01-01T00:00:00Z",
+    api_key: UUID,
+    parse: Literal[False],
+) -> Any: ...
+
+
+@overload
+def sync(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    since: Union[Unset, str] = "1970-01-01T00:00:00Z",
+    api_key: UUID,
+    parse: bool = ...,
+) -> Optional[Union[Any, PaginatedWorkoutEvents]]: ...
 
 
 def sync(
@@ -116,6 +189,7 @@ def sync(
     page_size: Union[Unset, int] = 5,
     since: Union[Unset, str] = "1970-01-01T00:00:00Z",
     api_key: UUID,
+    parse: bool = True,
 ) -> Optional[Union[Any, PaginatedWorkoutEvents]]:
     """Retrieve a paged list of workout events (updates or deletes) since a given date. Events are ordered
     from newest to oldest. The intention is to allow clients to keep their local cache of workouts up to
@@ -128,6 +202,8 @@ def sync(
         page_size (Union[Unset, int]):  Default: 5.
         since (Union[Unset, str]):  Default: '1970-01-01T00:00:00Z'.
         api_key (UUID):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -143,9 +219,11 @@ def sync(
         page_size=page_size,
         since=since,
         api_key=api_key,
+        parse=parse,
     ).parsed
 
 
+@overload
 async def asyncio_detailed(
     *,
     client: Union[AuthenticatedClient, Client],
@@ -153,6 +231,42 @@ async def asyncio_detailed(
     page_size: Union[Unset, int] = 5,
     since: Union[Unset, str] = "1970-01-01T00:00:00Z",
     api_key: UUID,
+    parse: Literal[True] = True,
+) -> Response[Union[Any, PaginatedWorkoutEvents]]: ...
+
+
+@overload
+async def asyncio_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    since: Union[Unset, str] = "1970-01-01T00:00:00Z",
+    api_key: UUID,
+    parse: Literal[False],
+) -> Response[Any]: ...
+
+
+@overload
+async def asyncio_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    since: Union[Unset, str] = "1970-01-01T00:00:00Z",
+    api_key: UUID,
+    parse: bool = ...,
+) -> Response[Union[Any, PaginatedWorkoutEvents]]: ...
+
+
+async def asyncio_detailed(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    since: Union[Unset, str] = "1970-01-01T00:00:00Z",
+    api_key: UUID,
+    parse: bool = True,
 ) -> Response[Union[Any, PaginatedWorkoutEvents]]:
     """Retrieve a paged list of workout events (updates or deletes) since a given date. Events are ordered
     from newest to oldest. The intention is to allow clients to keep their local cache of workouts up to
@@ -165,6 +279,8 @@ async def asyncio_detailed(
         page_size (Union[Unset, int]):  Default: 5.
         since (Union[Unset, str]):  Default: '1970-01-01T00:00:00Z'.
         api_key (UUID):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -181,9 +297,45 @@ async def asyncio_detailed(
         api_key=api_key,
     )
 
-    response = await client.get_async_httpx_client().request(**kwargs)
+    response = await caching.arequest(client, **kwargs)
 
-    return _build_response(client=client, response=response)
+    return _build_response(client=client, response=response, parse=parse)
+
+
+@overload
+async def asyncio(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    since: Union[Unset, str] = "1970-01-01T00:00:00Z",
+    api_key: UUID,
+    parse: Literal[True] = True,
+) -> Optional[Union[Any, PaginatedWorkoutEvents]]: ...
+
+
+@overload
+async def asyncio(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    since: Union[Unset, str] = "1970-01-01T00:00:00Z",
+    api_key: UUID,
+    parse: Literal[False],
+) -> Any: ...
+
+
+@overload
+async def asyncio(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    page: Union[Unset, int] = 1,
+    page_size: Union[Unset, int] = 5,
+    since: Union[Unset, str] = "1970-01-01T00:00:00Z",
+    api_key: UUID,
+    parse: bool = ...,
+) -> Optional[Union[Any, PaginatedWorkoutEvents]]: ...
 
 
 async def asyncio(
@@ -193,6 +345,7 @@ async def asyncio(
     page_size: Union[Unset, int] = 5,
     since: Union[Unset, str] = "1970-01-01T00:00:00Z",
     api_key: UUID,
+    parse: bool = True,
 ) -> Optional[Union[Any, PaginatedWorkoutEvents]]:
     """Retrieve a paged list of workout events (updates or deletes) since a given date. Events are ordered
     from newest to oldest. The intention is to allow clients to keep their local cache of workouts up to
@@ -205,6 +358,8 @@ async def asyncio(
         page_size (Union[Unset, int]):  Default: 5.
         since (Union[Unset, str]):  Default: '1970-01-01T00:00:00Z'.
         api_key (UUID):
+        parse (bool): Whether to build the response models. If False, ``parsed`` holds the decoded JSON.
+            Default: True.
 
     Raises:
         errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
@@ -221,5 +376,6 @@ async def asyncio(
             page_size=page_size,
             since=since,
             api_key=api_key,
+            parse=parse,
         )
     ).parsed
@@ -0,0 +1,317 @@
+"""Contains a small persistent cache for responses of the read-only endpoints"""
+
+import hashlib
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Optional, Union
+from urllib.parse import urlencode
+
+import httpx
+from attrs import define, evolve, field
+
+from . import errors
+
+if TYPE_CHECKING:
+    from .client import AuthenticatedClient, Client
+
+logger = logging.getLogger(__name__)
+
+
+@define
+class CachedResponse:
+    """A response body previously stored in a ResponseCache"""
+
+    status_code: int
+    content: bytes
+    fetched_at: float
+
+    @property
+    def age(self) -> float:
+        """Seconds elapsed since the response was fetched from the API"""
+        return max(0.0, time.time() - self.fetched_at)
+
+    def to_httpx(self) -> httpx.Response:
+        return httpx.Response(
+            self.status_code,
+            content=self.content,
+            headers={"Content-Type": "application/json", "Age": str(int(self.age))},
+        )
+
+
+@define
+class ResponseCache:
+    """Caches successful GET responses, keyed by credentials, endpoint path and query params.
+
+    Mutating endpoints (e.g. ``post_v1_routines``) invalidate the cached pages of the collection they write to, so
+    reads issued after a write never see a listing older than the write. A cache can be shared between threads,
+    which take turns on its connection.
+
+    Attributes:
+        path: SQLite database file used for storage. The default, ``":memory:"``, keeps the cache in process.
+        ttl: Seconds a cached response is served without hitting the API.
+        hits: Responses served by this cache (views made by with_ttl count their own).
+    """
+
+    path: str = ":memory:"
+    ttl: float = 300.0
+    hits: int = field(default=0, init=False)
+    _conn: Optional[sqlite3.Connection] = field(default=None, init=False)
+    _lock: threading.RLock = field(factory=threading.RLock, init=False)
+
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]] = None, account: str = "") -> str:
+        key = f"{account}:{url}" if account else url
+        if not params:
+            return key
+        return f"{key}?{urlencode(sorted((k, str(v)) for k, v in params.items()))}"
+
+    def with_ttl(self, ttl: float) -> "ResponseCache":
+        """A view of this cache trusting responses for ``ttl`` seconds, sharing its connection (and its content, even
+        in memory)"""
+        view = evolve(self, ttl=ttl)
+        with self._lock:
+            view._conn = self._get_conn()
+        view._lock = self._lock
+        return view
+
+    def _get_conn(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._conn is None:
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, url TEXT NOT NULL, status_code INTEGER NOT NULL, "
+                    "content BLOB NOT NULL, fetched_at REAL NOT NULL)"
+                )
+                self._conn = conn
+            return self._conn
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        *,
+        account: str = "",
+        max_age: Optional[float] = None,
+    ) -> Optional[CachedResponse]:
+        """Return the cached response for ``url`` and ``params`` if it is younger than ``max_age`` (default: ttl).
+
+        ``account`` identifies the credentials the response was fetched with (see set).
+        """
+        with self._lock:
+            row = (
+                self._get_conn()
+                .execute(
+                    "SELECT status_code, content, fetched_at FROM responses WHERE key = ?",
+                    (self.key(url, params, account),),
+                )
+                .fetchone()
+            )
+            if row is None:
+                return None
+
+            cached = CachedResponse(status_code=row[0], content=row[1], fetched_at=row[2])
+            if cached.age > (self.ttl if max_age is None else max_age):
+                return None
+            self.hits += 1
+            return cached
+
+    def set(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        response: httpx.Response,
+        *,
+        account: str = "",
+    ) -> None:
+        """Store ``response`` for ``url`` and ``params``, only served back to requests made with the same ``account``"""
+        with self._lock, self._get_conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, url, status_code, content, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.key(url, params, account), url, response.status_code, response.content, time.time()),
+            )
+
+    def invalidate(self, url: str) -> int:
+        """Drop every cached page of ``url`` (whatever its params). Returns the number of entries removed."""
+        with self._lock, self._get_conn() as conn:
+            return conn.execute("DELETE FROM responses WHERE url = ?", (url,)).rowcount
+
+    def clear(self) -> None:
+        with self._lock, self._get_conn() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# read-only endpoints that LocalStore can answer, mapped to their table (also the key each page lists entities under)
+_STORE_TABLES = {
+    "/v1/workouts": "workouts",
+    "/v1/routines": "routines",
+    "/v1/routine_folders": "routine_folders",
+    "/v1/exercise_templates": "exercise_templates",
+}
+
+
+def data_age(response: Any) -> float:
+    """Seconds since the data of a (httpx or api) response was fetched from the API, 0 for live responses"""
+    age = response.headers.get("Age")
+    return float(age) if age is not None else 0.0
+
+
+# read-only endpoints whose answer changes with every write: never served from the cache, however recent
+_UNCACHED = frozenset({"/v1/workouts/events", "/v1/workouts/count"})
+
+
+def _account(client: Union["AuthenticatedClient", "Client"], kwargs: dict[str, Any]) -> str:
+    """A hash of the credentials of a request, so that a cache shared by several accounts keeps them apart"""
+    headers = kwargs.get("headers") or {}
+    credentials = f"{headers.get('api-key', '')}:{getattr(client, 'token', '')}"
+    return hashlib.sha256(credentials.encode()).hexdigest()[:16]
+
+
+def _cacheable(client: Union["AuthenticatedClient", "Client"], kwargs: dict[str, Any]) -> bool:
+    return client.cache is not None and kwargs["method"] == "get" and kwargs["url"] not in _UNCACHED
+
+
+def _lookup(client: Union["AuthenticatedClient", "Client"], kwargs: dict[str, Any]) -> Optional[httpx.Response]:
+    if client.cache is None or not _cacheable(client, kwargs):
+        return None
+    cached = client.cache.get(kwargs["url"], kwargs.get("params"), account=_account(client, kwargs))
+    return cached.to_httpx() if cached is not None else None
+
+
+def _store(client: Union["AuthenticatedClient", "Client"], kwargs: dict[str, Any], response: httpx.Response) -> None:
+    if client.cache is not None and _cacheable(client, kwargs) and response.status_code == 200:
+        client.cache.set(kwargs["url"], kwargs.get("params"), response, account=_account(client, kwargs))
+
+
+def write_through(client: Union["AuthenticatedClient", "Client"], url: str, key: str, created: Any) -> None:
+    """Apply an entity created by a POST to ``url`` to the client's cache and store.
+
+    The new entry shifts every cached page of the listing, so they are dropped rather than served stale. The entity,
+    a model or (with ``parse=False``) the decoded JSON, listed by the API under ``key`` (e.g. ``"routine"``), is
+    written into the store table of ``url``.
+    """
+    if client.cache is not None:
+        client.cache.invalidate(url)
+
+    data = created.to_dict() if hasattr(created, "to_dict") else created
+    item = data.get(key, data) if isinstance(data, dict) else None
+    if client.store is not None and isinstance(item, dict):
+        client.store.put(_STORE_TABLES[url], item)
+
+
+def _page_response(url: str, page: int, page_count: int, items: list[Any], age: float) -> httpx.Response:
+    return httpx.Response(
+        200,
+        content=json.dumps({"page": page, "page_count": page_count, _STORE_TABLES[url]: items}).encode(),
+        headers={"Content-Type": "application/json", "Age": str(int(age))},
+    )
+
+
+def _offline_response(
+    client: Union["AuthenticatedClient", "Client"], kwargs: dict[str, Any]
+) -> Optional[httpx.Response]:
+    """Answer a GET from the cache (regardless of its age) or else from the local store"""
+    if kwargs["method"] != "get":
+        return None
+
+    url = kwargs["url"]
+    params = kwargs.get("params") or {}
+    page = int(params.get("page", 1))
+    table = _STORE_TABLES.get(url)
+    if client.cache is not None and _cacheable(client, kwargs):
+        account = _account(client, kwargs)
+        if (cached := client.cache.get(url, params, account=account, max_age=math.inf)) is not None:
+            logger.warning("Serving %s from the cache, %.0fs old", url, cached.age)
+            return cached.to_httpx()
+
+        # pages past the end are never cached, answer them as empty if the first page says they don't exist
+        first = (
+            client.cache.get(url, {**params, "page": 1}, account=account, max_age=math.inf)
+            if table is not None
+            else None
+        )
+        if first is not None and page > (page_count := json.loads(first.content).get("page_count", page)):
+            return _page_response(url, page, page_count, [], first.age)
+
+    if client.store is None or table is None or client.store.count(table) == 0:
+        return None
+
+    items, page_count, synced_at = client.store.page(table, page, int(params.get("pageSize", 5)))
+    age = max(0.0, time.time() - synced_at) if synced_at is not None else 0.0
+    logger.warning("Serving %s from the local store, %.0fs old", url, age)
+    return _page_response(url, page, page_count, items, age)
+
+
+def _offline_or_raise(
+    client: Union["AuthenticatedClient", "Client"], kwargs: dict[str, Any]
+) -> httpx.Response:
+    if (response := _offline_response(client, kwargs)) is None:
+        raise errors.OfflineDataUnavailable(kwargs["method"], kwargs["url"])
+    return response
+
+
+def _fall_back(client: Union["AuthenticatedClient", "Client"], kwargs: dict[str, Any]) -> Optional[httpx.Response]:
+    return _offline_response(client, kwargs) if client.offline_fallback else None
+
+
+def request(client: Union["AuthenticatedClient", "Client"], **kwargs: Any) -> httpx.Response:
+    """Send a request through the client's httpx.Client, serving GETs from ``client.cache`` when possible.
+
+    With ``client.offline`` GETs are answered from the cache or the local store only. With
+    ``client.offline_fallback`` they are when the API is unreachable or rate limits the client.
+    """
+    if client.offline:
+        return _offline_or_raise(client, kwargs)
+
+    if (response := _lookup(client, kwargs)) is not None:
+        return response
+
+    try:
+        response = client.get_httpx_client().request(**kwargs)
+    except httpx.TransportError:
+        if (stale := _fall_back(client, kwargs)) is not None:
+            return stale
+        raise
+
+    if response.status_code == 429 and (stale := _fall_back(client, kwargs)) is not None:
+        return stale
+
+    _store(client, kwargs, response)
+    return response
+
+
+async def arequest(client: Union["AuthenticatedClient", "Client"], **kwargs: Any) -> httpx.Response:
+    """Like ``request`` but through the client's httpx.AsyncClient"""
+    if client.offline:
+        return _offline_or_raise(client, kwargs)
+
+    if (response := _lookup(client, kwargs)) is not None:
+        return response
+
+    try:
+        response = await client.get_async_httpx_client().request(**kwargs)
+    except httpx.TransportError:
+        if (stale := _fall_back(client, kwargs)) is not None:
+            return stale
+        raise
+
+    if response.status_code == 429 and (stale := _fall_back(client, kwargs)) is not None:
+        return stale
+
+    _store(client, kwargs, response)
+    return response
+
+
+__all__ = ["CachedResponse", "ResponseCache", "arequest", "data_age", "request", "write_through"]
@@ -0,0 +1,117 @@
+"""Contains inverted indexes over the exercise template catalogue.
+
+``TemplateIndex`` maps every primary muscle group, secondary muscle group, equipment, type and custom flag to the
+positions of the templates that have it, so a query with several filters is an intersection of a few sets instead of
+a scan of the catalogue. The index of the latest catalogue version is kept in memory, so the queries of a process
+only build it again when the catalogue changes:
+
+    >>> from hevy_api_client.catalogue import index_store
+    >>> index_store(store).query(muscle_group="chest", equipment="barbell")
+"""
+
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from typing import Any, Optional
+
+from attrs import define, field
+
+from .store import LocalStore, content_hash
+
+# the JSON keys that are indexed, list values (secondary muscle groups) are indexed per item
+INDEXED_KEYS = ("primary_muscle_group", "secondary_muscle_groups", "equipment", "type", "is_custom")
+
+_EMPTY: frozenset[int] = frozenset()
+
+
+@define
+class TemplateIndex:
+    """Inverted indexes over a catalogue of exercise templates
+
+    Attributes:
+        version: Identifies the catalogue the indexes were built from.
+        templates: The templates as returned by the API, in catalogue order.
+    """
+
+    version: str
+    templates: list[dict[str, Any]]
+    _postings: dict[str, dict[Any, frozenset[int]]] = field(init=False)
+
+    def __attrs_post_init__(self) -> None:
+        postings: dict[str, defaultdict[Any, set[int]]] = {key: defaultdict(set) for key in INDEXED_KEYS}
+        for position, template in enumerate(self.templates):
+            for key in INDEXED_KEYS:
+                value = template.get(key)
+                for item in value if isinstance(value, list) else (value,):
+                    postings[key][item].add(position)
+        self._postings = {key: {v: frozenset(p) for v, p in index.items()} for key, index in postings.items()}
+
+    def values(self, key: str) -> list[Any]:
+        """The distinct values of an indexed key, e.g. every equipment of the catalogue"""
+        return list(self._postings[key])
+
+    def positions(self, key: str, value: Any) -> frozenset[int]:
+        """Positions in ``templates`` of the templates whose ``key`` is (or, for lists, contains) ``value``"""
+        return self._postings[key].get(value, _EMPTY)
+
+    def query(
+        self,
+        *,
+        muscle_group: Optional[str] = None,
+        primary_muscle_group: Optional[str] = None,
+        equipment: Optional[str] = None,
+        type_: Optional[str] = None,
+        is_custom: Optional[bool] = None,
+    ) -> list[dict[str, Any]]:
+        """The templates matching every given filter, in catalogue order.
+
+        ``muscle_group`` matches templates working it as their primary or as one of their secondary muscle groups,
+        ``primary_muscle_group`` only the former.
+        """
+        candidates: list[frozenset[int]] = []
+        if muscle_group is not None:
+            candidates.append(
+                self.positions("primary_muscle_group", muscle_group)
+                | self.positions("secondary_muscle_groups", muscle_group)
+            )
+        for key, value in (
+            ("primary_muscle_group", primary_muscle_group),
+            ("equipment", equipment),
+            ("type", type_),
+            ("is_custom", is_custom),
+        ):
+            if value is not None:
+                candidates.append(self.positions(key, value))
+
+        if not candidates:
+            return list(self.templates)
+        candidates.sort(key=len)
+        return [self.templates[position] for position in sorted(candidates[0].intersection(*candidates[1:]))]
+
+
+# the index of the latest catalogue, by version
+_indexes: dict[str, TemplateIndex] = {}
+
+
+def index_templates(templates: Sequence[Mapping[str, Any]], version: Optional[str] = None) -> TemplateIndex:
+    """The TemplateIndex of a catalogue, only built when ``version`` (by default a hash of the catalogue) changes"""
+    version = version or content_hash(list(templates))
+    if version not in _indexes:
+        _indexes.clear()
+        _indexes[version] = TemplateIndex(version=version, templates=[dict(t) for t in templates])
+    return _indexes[version]
+
+
+def index_store(store: LocalStore) -> TemplateIndex:
+    """The TemplateIndex of the exercise templates of ``store``.
+
+    The version comes from the content hashes the store keeps, the templates themselves are only loaded when it
+    changed since the last call.
+    """
+    entries = store.entries("exercise_templates")
+    version = content_hash(sorted((template_id, entry.hash) for template_id, entry in entries.items()))
+    if version in _indexes:
+        return _indexes[version]
+    return index_templates(list(store.iter("exercise_templates", ordered=True)), version)
+
+
+__all__ = ["INDEXED_KEYS", "TemplateIndex", "index_store", "index_templates"]
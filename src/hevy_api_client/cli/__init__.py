@@ -1,12 +1,108 @@
+import importlib
+import logging
+import os
+import sys
+from typing import TYPE_CHECKING, Annotated, Any
+
 import typer
+from typer.core import TyperGroup
+
+from hevy_api_client import errors
+
+if TYPE_CHECKING:
+    import click
+
+# subcommand groups: name -> (module defining its ``app``, help shown by ``hevy --help``)
+_SUBCOMMANDS = {
+    "routine_folders": ("hevy_api_client.cli.routine_folders", "List and create routine folders"),
+    "routines": ("hevy_api_client.cli.routines", "List routines"),
+    "exercise_templates": ("hevy_api_client.cli.exercise_templates", "List exercise templates"),
+    "workouts": ("hevy_api_client.cli.workouts", "List and count workouts and their events"),
+    "sync": ("hevy_api_client.cli.sync", "Bring the local store up to date with the API"),
+}
+
+
+class _LazyGroup(TyperGroup):
+    """Imports a subcommand group (and with it rich, the models and the API modules) only when it is invoked"""
+
+    def list_commands(self, ctx: "click.Context") -> list[str]:
+        return [*super().list_commands(ctx), *(name for name in _SUBCOMMANDS if name not in self.commands)]
+
+    def get_command(self, ctx: "click.Context", cmd_name: str) -> Any:
+        if cmd_name in self.commands or cmd_name not in _SUBCOMMANDS:
+            return super().get_command(ctx, cmd_name)
+        # listing the commands (e.g. in --help) only needs their name and help
+        return TyperGroup(name=cmd_name, help=_SUBCOMMANDS[cmd_name][1])
+
+    def resolve_command(self, ctx: "click.Context", args: list[str]) -> Any:
+        if args and args[0] in _SUBCOMMANDS and args[0] not in self.commands:
+            self._load(args[0])
+        return super().resolve_command(ctx, args)
+
+    def _load(self, name: str) -> None:
+        module, help = _SUBCOMMANDS[name]
+        command = typer.main.get_group(importlib.import_module(module).app)
+        command.name = name
+        command.help = command.help or help
+        self.add_command(command, name)
+
+
+app = typer.Typer(cls=_LazyGroup, no_args_is_help=True)
+
+
+_logged_endpoints: set[tuple[str, str]] = set()
+
+
+def _once_per_endpoint(record: logging.LogRecord) -> bool:
+    key = (str(record.msg), str(record.args[0] if isinstance(record.args, tuple) and record.args else ""))
+    if key in _logged_endpoints:
+        return False
+    _logged_endpoints.add(key)
+    return True
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    offline: Annotated[
+        bool,
+        typer.Option("--offline", help="Serve data from the local cache and store without reaching the API"),
+    ] = False,
+    timings: Annotated[
+        bool,
+        typer.Option("--timings", "--profile", help="Print the time spent per endpoint and phase on exit"),
+    ] = False,
+) -> None:
+    # offline notices (with the age of the data served) come from hevy_api_client.caching, show one per endpoint
+    logging.basicConfig(format="%(message)s", level=logging.WARNING)
+    logging.getLogger("hevy_api_client.caching").addFilter(_once_per_endpoint)
+
+    from hevy_api_client.cli.utils import close_client, configure_client
+
+    if timings:
+        from hevy_api_client.cli.timings import Timings
 
-from hevy_api_client.cli import exercise_templates, routine_folders, routines
+        recorder = Timings()
+        recorder.instrument()
+        configure_client(**recorder.client_options())
+        # registered first so that it runs last, once background refreshes have been waited for
+        ctx.call_on_close(recorder.print_summary)
 
-app = typer.Typer(no_args_is_help=True)
-app.add_typer(routine_folders.app, name="routine_folders")
-app.add_typer(routines.app, name="routines")
-app.add_typer(exercise_templates.app, name="exercise_templates")
+    # the client itself is only created when a command first needs it
+    configure_client(offline=offline)
+    ctx.call_on_close(close_client)
 
 
 def cli_entrypoint():
-    app()
+    try:
+        app()
+    except errors.OfflineDataUnavailable as e:
+        print(f"{e}, run the command once while online first")
+        raise SystemExit(1)
+    except errors.UnexpectedStatus as e:
+        print(e)
+        raise SystemExit(1)
+    except BrokenPipeError:
+        # the reader of a streamed --format went away (e.g. ``| head``), silence the flush at interpreter exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        raise SystemExit(1)
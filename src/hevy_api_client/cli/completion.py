@@ -0,0 +1,91 @@
+"""Shell completion of ids and titles, answered from the local store or else the response cache, never the API"""
+
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Optional
+
+from hevy_api_client.cli.utils import get_cache_path
+
+# completion runs on every <TAB>: past this budget nothing is offered rather than making the shell wait
+BUDGET_MS = 50
+
+# SQLite virtual machine instructions between two checks of the budget
+_CHECK_EVERY = 1000
+
+
+def _connect(path: str, deadline: float) -> Optional[sqlite3.Connection]:
+    if not os.path.exists(path):
+        return None
+    # read only and without waiting on locks: a sync writing to the database must not stall the shell
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=0)
+    conn.set_progress_handler(lambda: time.perf_counter() > deadline, _CHECK_EVERY)
+    return conn
+
+
+def _from_store(path: str, table: str, deadline: float) -> list[tuple[str, str]]:
+    if (conn := _connect(path, deadline)) is None:
+        return []
+    try:
+        rows = conn.execute(f"SELECT id, json_extract(data, '$.title') FROM {table} ORDER BY rowid").fetchall()
+    finally:
+        conn.close()
+    return [(str(row[0]), row[1] or "") for row in rows]
+
+
+def _from_cache(path: str, table: str, deadline: float) -> list[tuple[str, str]]:
+    if (conn := _connect(path, deadline)) is None:
+        return []
+    try:
+        pages = conn.execute("SELECT content FROM responses WHERE url = ?", (f"/v1/{table}",)).fetchall()
+    finally:
+        conn.close()
+
+    entities: dict[str, str] = {}
+    for (content,) in pages:
+        if time.perf_counter() > deadline:
+            break
+        items: Any = json.loads(content).get(table)
+        for item in items if isinstance(items, list) else []:
+            entities[str(item.get("id"))] = item.get("title") or ""
+    return list(entities.items())
+
+
+def _entities(table: str) -> list[tuple[str, str]]:
+    """(id, title) of every entity of ``table`` known locally, empty when there is no token or over budget"""
+    if not (token := os.getenv("HEVY_API_TOKEN")):
+        return []
+
+    deadline = time.perf_counter() + BUDGET_MS / 1000
+    try:
+        return _from_store(get_cache_path(token, "store"), table, deadline) or _from_cache(
+            get_cache_path(token), table, deadline
+        )
+    except (sqlite3.Error, ValueError):
+        # interrupted by the budget, locked, or a corrupt cache entry
+        return []
+
+
+def _complete(table: str, incomplete: str) -> list[tuple[str, str]]:
+    text = incomplete.casefold()
+    return [
+        (entity_id, title)
+        for entity_id, title in _entities(table)
+        if entity_id.startswith(incomplete) or (text and text in title.casefold())
+    ]
+
+
+def complete_folder_ids(incomplete: str) -> list[tuple[str, str]]:
+    """Routine folder ids, with their title as help, starting with ``incomplete`` or whose title contains it"""
+    return _complete("routine_folders", incomplete)
+
+
+def complete_routine_ids(incomplete: str) -> list[tuple[str, str]]:
+    """Routine ids, with their title as help, starting with ``incomplete`` or whose title contains it"""
+    return _complete("routines", incomplete)
+
+
+def complete_exercise_templates(incomplete: str) -> list[tuple[str, str]]:
+    """Exercise template ids, with their title as help, starting with ``incomplete`` or whose title contains it"""
+    return _complete("exercise_templates", incomplete)
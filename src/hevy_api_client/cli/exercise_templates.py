@@ -2,15 +2,21 @@ from enum import Enum
 from typing import Annotated, Any, Optional
 
 import typer
-from rich import print
 
 from hevy_api_client.api.exercise_templates import get_v1_exercise_templates
-from hevy_api_client.cli.utils import get_client, print_table
-from hevy_api_client.models import GetV1ExerciseTemplatesResponse200
-from hevy_api_client.types import Unset
+from hevy_api_client.catalogue import index_templates
+from hevy_api_client.cli.utils import (
+    TEMPLATES_PAGE_SIZE,
+    Concurrency,
+    Format,
+    OutputFormat,
+    fetch_all,
+    get_client,
+    iter_pages,
+    write_records,
+)
 
 app = typer.Typer(no_args_is_help=True)
-client = get_client()
 
 
 class MuscleGroup(str, Enum):
@@ -48,6 +54,10 @@ class Equipment(str, Enum):
     suspension = "suspension"
 
 
+def _by_muscle_group_and_equipment(exercise: dict[str, Any]) -> tuple[str, str]:
+    return exercise.get("primary_muscle_group") or "", exercise.get("equipment") or ""
+
+
 @app.command(name="list")
 def list_all(
     muscle_group: Annotated[
@@ -66,62 +76,49 @@ def list_all(
             help="Filter to show only exercises for the specified equipment",
         ),
     ] = None,
+    type_: Annotated[
+        Optional[str],
+        typer.Option("-t", "--type", help="Filter to show only exercises of this type (e.g. weight_reps)"),
+    ] = None,
+    custom: Annotated[
+        Optional[bool],
+        typer.Option("--custom/--built-in", help="Filter to show only custom or only built-in exercises"),
+    ] = None,
+    concurrency: Concurrency = 4,
+    output_format: Format = OutputFormat.table,
 ) -> None:
-    """List all existing exercise templates."""
-
-    exercises: list[dict[str, Any]] = []
-
-    has_more = True
-    page = 1
-
-    while has_more:
-        res = get_v1_exercise_templates.sync(
-            client=client,
-            api_key=client.token,  # type: ignore
-            page=page,
+    """List all existing exercise templates. A muscle group matches the primary and the secondary ones."""
+
+    client = get_client()
+    sort_key = _by_muscle_group_and_equipment
+    if muscle_group is None and equipment is None and type_ is None and custom is None:
+        pages = iter_pages(
+            client,
+            get_v1_exercise_templates,
+            "exercise_templates",
+            page_size=TEMPLATES_PAGE_SIZE,
+            concurrency=concurrency,
         )
-
-        if not res or not isinstance(res, GetV1ExerciseTemplatesResponse200):
-            break
-
-        has_more = (
-            not isinstance(res.exercise_templates, Unset)
-            and len(res.exercise_templates) != 0
-        )
-        page += 1
-
-        if not res.exercise_templates:
-            continue
-
-        for exercise in res.exercise_templates:
-            if muscle_group is not None and (
-                exercise.primary_muscle_group != muscle_group
-                or (
-                    exercise.secondary_muscle_groups
-                    and muscle_group not in exercise.secondary_muscle_groups
-                )
-            ):
-                continue
-
-            if (
-                equipment is not None
-                and exercise.additional_properties.get("equipment") != equipment
-            ):
-                continue
-
-            e_dict = exercise.to_dict()
-            exercises.append(e_dict)
-
-    if not exercises:
-        print("No exercises found")
-        raise typer.Exit()
-
-    print_table(
-        sorted(
-            exercises,
-            key=lambda x: (
-                x.get("primary_muscle_group") or "",
-                x.get("equipment") or "",
-            ),
+        write_records(
+            ([exercise.to_dict() for exercise in exercises] for exercises in pages),
+            output_format,
+            sort_key=sort_key,
+            empty="No exercises found",
         )
+        return
+
+    exercises = fetch_all(
+        client,
+        get_v1_exercise_templates,
+        "exercise_templates",
+        page_size=TEMPLATES_PAGE_SIZE,
+        concurrency=concurrency,
+    )
+    index = index_templates([exercise.to_dict() for exercise in exercises])
+    matches = index.query(
+        muscle_group=None if muscle_group is None else muscle_group.value,
+        equipment=None if equipment is None else equipment.value,
+        type_=type_,
+        is_custom=custom,
     )
+    write_records([matches], output_format, sort_key=sort_key, empty="No exercises found")
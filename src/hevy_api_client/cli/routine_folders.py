@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+from functools import partial
 from typing import Annotated
 
 import typer
@@ -6,51 +8,69 @@ from hevy_api_client.api.routine_folders import (
     get_v1_routine_folders,
     post_v1_routine_folders,
 )
-from hevy_api_client.cli.utils import get_client, print_table
+from hevy_api_client.cli.utils import (
+    PAGE_SIZE,
+    Concurrency,
+    Format,
+    OutputFormat,
+    fetch_all,
+    get_client,
+    iter_pages,
+    print_table,
+    stale_while_revalidate,
+    write_records,
+)
+from hevy_api_client.client import AuthenticatedClient
 from hevy_api_client.models import (
     PostRoutineFolderRequestBody,
     PostRoutineFolderRequestBodyRoutineFolder,
     PostV1RoutineFoldersResponse400,
     RoutineFolder,
 )
-from hevy_api_client.types import Unset
 
 app = typer.Typer(no_args_is_help=True)
-client = get_client()
 
 
-@app.command(name="list")
-def list_all() -> None:
-    """Lists all existing routine folders."""
 
-    routine_folders: list[RoutineFolder] = []
+def _fetch_routine_folders(client: AuthenticatedClient, concurrency: int = 4) -> list[RoutineFolder]:
+    return fetch_all(client, get_v1_routine_folders, "routine_folders", page_size=PAGE_SIZE, concurrency=concurrency)
+
+
+def _write_routine_folders(pages: Iterable[list[RoutineFolder]], output_format: OutputFormat) -> None:
+    write_records(
+        ([rf.to_dict() for rf in routine_folders] for routine_folders in pages),
+        output_format,
+        empty="No routine folders found",
+    )
 
-    has_more = True
-    page = 1
 
-    while has_more:
-        if not (
-            res := get_v1_routine_folders.sync(
-                client=client,
-                api_key=client.token,  # type: ignore
-                page=page,
-            )
-        ):
-            break
+@app.command(name="list")
+def list_all(
+    stale: Annotated[
+        bool,
+        typer.Option("--stale", help="Print cached folders right away and refresh the cache in the background"),
+    ] = False,
+    rerender: Annotated[
+        bool,
+        typer.Option("--rerender", help="With --stale, print the folders again if the refresh changed them"),
+    ] = False,
+    concurrency: Concurrency = 4,
+    output_format: Format = OutputFormat.table,
+) -> None:
+    """Lists all existing routine folders."""
 
-        has_more = (
-            not isinstance(res.routine_folders, Unset) and len(res.routine_folders) != 0
-        )
-        page += 1
+    client = get_client()
 
-        if res.routine_folders:
-            routine_folders.extend(res.routine_folders)
+    def render(routine_folders: list[RoutineFolder]) -> None:
+        _write_routine_folders([routine_folders], output_format)
 
-    if not routine_folders:
-        print("No routine folders found")
-        raise typer.Exit()
+    if stale:
+        fetch = partial(_fetch_routine_folders, concurrency=concurrency)
+        stale_while_revalidate(client, fetch, render, rerender=rerender)
+        return
 
-    print_table([rf.to_dict() for rf in routine_folders])
+    pages = iter_pages(client, get_v1_routine_folders, "routine_folders", page_size=PAGE_SIZE, concurrency=concurrency)
+    _write_routine_folders(pages, output_format)
 
 
 @app.command()
@@ -59,6 +79,7 @@ def create(
 ):
     """Creates a new routine folder with the provided title and prints it."""
 
+    client = get_client()
     res = post_v1_routine_folders.sync(
         client=client,
         api_key=client.token,  # type: ignore
@@ -1,12 +1,25 @@
+from collections.abc import Iterable
+from functools import partial
 from typing import Annotated, Any, Optional
 
 import typer
 from rich import print
 
 from hevy_api_client.api.routines import get_v1_routines, post_v1_routines
-from hevy_api_client.cli.utils import get_client, print_table
+from hevy_api_client.cli.completion import complete_folder_ids, complete_routine_ids
+from hevy_api_client.cli.utils import (
+    PAGE_SIZE,
+    Concurrency,
+    Format,
+    OutputFormat,
+    fetch_all,
+    get_client,
+    iter_pages,
+    stale_while_revalidate,
+    write_records,
+)
+from hevy_api_client.client import AuthenticatedClient
 from hevy_api_client.models import (
-    GetV1RoutinesResponse200,
     PostRoutinesRequestBody,
     PostRoutinesRequestBodyRoutine,
     PostRoutinesRequestExercise,
@@ -14,61 +27,96 @@ from hevy_api_client.models import (
     PostV1RoutinesResponse403,
     Routine,
 )
-from hevy_api_client.types import Unset
 
 app = typer.Typer(no_args_is_help=True)
-client = get_client()
+
+
+
+def _fetch_routines(client: AuthenticatedClient, concurrency: int = 4) -> list[Routine]:
+    return fetch_all(client, get_v1_routines, "routines", page_size=PAGE_SIZE, concurrency=concurrency)
+
+
+def _routine_rows(
+    routines: list[Routine], folder_id: Optional[int], routine_id: Optional[str]
+) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    for routine in routines:
+        if folder_id is not None and routine.folder_id != folder_id:
+            continue
+        if routine_id is not None and routine.id != routine_id:
+            continue
+
+        r_dict = routine.to_dict()
+        del r_dict["exercises"]
+        rows.append(r_dict)
+    return rows
+
+
+def _by_folder_and_title(row: dict[str, Any]) -> tuple[bool, Any, str]:
+    # by folder id as a number (routines outside any folder last), then by title
+    folder_id = row.get("folder_id")
+    return not isinstance(folder_id, (int, float)), folder_id or 0, row.get("title") or ""
+
+
+def _write_routines(
+    pages: Iterable[list[Routine]],
+    folder_id: Optional[int],
+    routine_id: Optional[str],
+    output_format: OutputFormat,
+) -> None:
+    write_records(
+        (_routine_rows(routines, folder_id, routine_id) for routines in pages),
+        output_format,
+        sort_key=_by_folder_and_title,
+        empty="No routines found",
+    )
 
 
 @app.command(name="list")
 def list_all(
     folder_id: Annotated[
         Optional[int],
-        typer.Option("-F", "--folder", help="Filter to show only from this folder id"),
+        typer.Option(
+            "-F",
+            "--folder",
+            help="Filter to show only from this folder id",
+            autocompletion=complete_folder_ids,
+        ),
     ] = None,
+    routine_id: Annotated[
+        Optional[str],
+        typer.Option(
+            "-r",
+            "--routine",
+            help="Filter to show only the routine with this id",
+            autocompletion=complete_routine_ids,
+        ),
+    ] = None,
+    stale: Annotated[
+        bool,
+        typer.Option("--stale", help="Print cached routines right away and refresh the cache in the background"),
+    ] = False,
+    rerender: Annotated[
+        bool,
+        typer.Option("--rerender", help="With --stale, print the routines again if the refresh changed them"),
+    ] = False,
+    concurrency: Concurrency = 4,
+    output_format: Format = OutputFormat.table,
 ):
     """List all existing routines. If -F/--folder is provided
     then only the routines for that folder will be shown"""
 
-    routines: list[dict[str, Any]] = []
-
-    has_more = True
-    page = 1
-
-    while has_more:
-        res = get_v1_routines.sync(
-            client=client,
-            api_key=client.token,  # type: ignore
-            page=page,
-        )
-
-        if not res or not isinstance(res, GetV1RoutinesResponse200):
-            break
+    client = get_client()
 
-        has_more = not isinstance(res.routines, Unset) and len(res.routines) != 0
-        page += 1
+    def render(routines: list[Routine]) -> None:
+        _write_routines([routines], folder_id, routine_id, output_format)
 
-        if not res.routines:
-            continue
-
-        for routine in res.routines:
-            if folder_id is not None and routine.folder_id != folder_id:
-                continue
-
-            r_dict = routine.to_dict()
-            del r_dict["exercises"]
-            routines.append(r_dict)
+    if stale:
+        stale_while_revalidate(client, partial(_fetch_routines, concurrency=concurrency), render, rerender=rerender)
+        return
 
-    if not routines:
-        print("No routines found")
-        raise typer.Exit()
-
-    print_table(
-        sorted(
-            routines,
-            key=lambda x: (str(x.get("folder_id") or ""), x.get("title") or ""),
-        )
-    )
+    pages = iter_pages(client, get_v1_routines, "routines", page_size=PAGE_SIZE, concurrency=concurrency)
+    _write_routines(pages, folder_id, routine_id, output_format)
 
 
 # @app.command()
@@ -76,6 +124,7 @@ def list_all(
 def create(title: str, folder_id: int):
     """Create a new routine"""
 
+    client = get_client()
     res = post_v1_routines.sync(
         client=client,
         api_key=client.token,  # type: ignore
@@ -0,0 +1,39 @@
+import time
+
+import httpx
+import typer
+from rich import print
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from hevy_api_client import errors
+from hevy_api_client.cli.utils import get_client
+from hevy_api_client.sync import sync_store
+
+app = typer.Typer()
+
+
+@app.callback(invoke_without_command=True)
+def sync() -> None:
+    """Bring the local store up to date with the API, for --offline and for when the API cannot be reached."""
+
+    client = get_client()
+    if client.offline or client.store is None:
+        print("Syncing needs the API, run it without --offline")
+        raise typer.Exit(-1)
+
+    start = time.perf_counter()
+    try:
+        results = sync_store(client=client, store=client.store, api_key=client.token)  # type: ignore
+    except (httpx.HTTPError, errors.UnexpectedStatus) as e:
+        print(f"Could not sync the local store: {escape(str(e))}")
+        raise typer.Exit(-1)
+    elapsed = time.perf_counter() - start
+
+    table = Table("table", "added", "updated", "deleted", "unchanged", "requests")
+    for name, result in results.items():
+        counts = (result.added, result.updated, result.deleted, result.unchanged, result.requests)
+        table.add_row(name, *map(str, counts))
+    Console().print(table)
+    print(f"{sum(result.requests for result in results.values())} requests in {elapsed:.2f}s")
@@ -0,0 +1,121 @@
+"""Per endpoint and per phase timings of a CLI run, enabled with ``hevy --timings``.
+
+The phases of every request are taken from httpx (its event hooks and the httpcore ``trace`` extension), the decoding
+and model building from ``decoders.on_parse`` and the rendering from ``utils.on_render``:
+
+- connect: DNS resolution and TCP connection (only for requests opening a new connection)
+- tls: TLS handshake (idem)
+- send: sending the request
+- server: waiting for the response headers
+- headers: from sending the request to the response headers, the sum of the phases above
+- download: reading the response body
+- decode: JSON decoding
+- models: building the models
+- render: ``print_table``
+"""
+
+import math
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable
+
+import httpx
+from attrs import define, field
+from rich.console import Console
+from rich.table import Table
+
+from hevy_api_client import decoders
+from hevy_api_client.cli import utils
+
+# httpcore trace events (``<prefix>.<name>.started/complete``) and the phase they time
+_TRACE_PHASES = {
+    "connect_tcp": "connect",
+    "start_tls": "tls",
+    "send_request_headers": "send",
+    "send_request_body": "send",
+    "receive_response_headers": "server",
+    "receive_response_body": "download",
+}
+
+# events followed by another one of the same phase: the request body is sent right after its headers
+_CONTINUED = {"send_request_headers"}
+
+_START = "hevy_timings_start"
+
+
+def _percentile(samples: list[float], p: float) -> float:
+    """Nearest-rank percentile of sorted ``samples``"""
+    return samples[max(0, math.ceil(p * len(samples)) - 1)]
+
+
+def _label(request: httpx.Request) -> str:
+    return f"{request.method} {request.url.path}"
+
+
+@define
+class Timings:
+    """Samples, in seconds, by (endpoint, phase)"""
+
+    samples: defaultdict[tuple[str, str], list[float]] = field(factory=lambda: defaultdict(list))
+    _lock: threading.Lock = field(factory=threading.Lock)
+
+    def record(self, endpoint: str, phase: str, seconds: float) -> None:
+        with self._lock:
+            self.samples[(endpoint, phase)].append(seconds)
+
+    def _trace(self, endpoint: str) -> Callable[[str, dict[str, Any]], None]:
+        started: dict[str, float] = {}
+
+        def trace(event: str, info: dict[str, Any]) -> None:
+            name, _, stage = event.rpartition(".")
+            name = name.rpartition(".")[2]
+            if (phase := _TRACE_PHASES.get(name)) is None:
+                return
+            if stage == "started":
+                started.setdefault(phase, time.perf_counter())
+            elif phase in started and (stage == "failed" or (stage == "complete" and name not in _CONTINUED)):
+                self.record(endpoint, phase, time.perf_counter() - started.pop(phase))
+
+        return trace
+
+    def on_request(self, request: httpx.Request) -> None:
+        request.extensions[_START] = time.perf_counter()
+        request.extensions["trace"] = self._trace(_label(request))
+
+    def on_response(self, response: httpx.Response) -> None:
+        request = response.request
+        if (start := request.extensions.get(_START)) is not None:
+            self.record(_label(request), "headers", time.perf_counter() - start)
+
+    def client_options(self) -> dict[str, Any]:
+        """AuthenticatedClient options (see utils.configure_client) that report the phases of every request"""
+        return {"httpx_args": {"event_hooks": {"request": [self.on_request], "response": [self.on_response]}}}
+
+    def on_parse(self, response: httpx.Response, cls: type, decode_seconds: float, models_seconds: float) -> None:
+        try:
+            endpoint = _label(response.request)
+        except RuntimeError:
+            # responses served from the cache or the store were not sent
+            endpoint = f"{cls.__name__} (local)"
+        self.record(endpoint, "decode", decode_seconds)
+        self.record(endpoint, "models", models_seconds)
+
+    def instrument(self) -> None:
+        """Time the decoding of every response and every ``print_table``"""
+        decoders.on_parse(self.on_parse)
+        utils.on_render(lambda seconds: self.record("print_table", "render", seconds))
+
+    def print_summary(self) -> None:
+        """Print count, total, p50 and p95 (in milliseconds) of every endpoint and phase on stderr"""
+        if not self.samples:
+            return
+
+        table = Table("endpoint", "phase", "count", "total", "p50", "p95", title="Timings (ms)")
+        for column in table.columns[2:]:
+            column.justify = "right"
+        for (endpoint, phase), samples in sorted(self.samples.items()):
+            samples = sorted(samples)
+            stats = (sum(samples), _percentile(samples, 0.5), _percentile(samples, 0.95))
+            table.add_row(endpoint, phase, str(len(samples)), *(f"{seconds * 1000:.1f}" for seconds in stats))
+        Console(stderr=True).print(table)
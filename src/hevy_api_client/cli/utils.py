@@ -1,23 +1,329 @@
+import csv
+import hashlib
+import io
+import math
 import os
-from typing import Any
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from http import HTTPStatus
+from itertools import islice
+from typing import Annotated, Any, Callable, Optional, TypeVar
 
+import httpx
 import typer
+from attrs import evolve
 from rich import print
 from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
 from rich.table import Table
 
+from hevy_api_client import errors
+from hevy_api_client.caching import ResponseCache
 from hevy_api_client.client import AuthenticatedClient
+from hevy_api_client.jsonlib import get_json_backend
+from hevy_api_client.store import LocalStore
+
+T = TypeVar("T")
+
+# the process-wide client, created by the first command that reaches the API (see get_client)
+_client: Optional[AuthenticatedClient] = None
+_client_options: dict[str, Any] = {}
+_background: list[threading.Thread] = []
+# called with the seconds every print_table took (see on_render)
+_render_hooks: list[Callable[[float], None]] = []
+
+
+def get_cache_path(token: str, name: str = "cache") -> str:
+    """One database of each kind per account, under $XDG_CACHE_HOME/hevy"""
+    cache_dir = os.path.join(os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "hevy")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, f"{name}-{hashlib.sha256(token.encode()).hexdigest()[:12]}.db")
+
+
+def configure_client(**options: Any) -> None:
+    """Set AuthenticatedClient options (e.g. ``offline=True``) for the shared client, before it is created.
+
+    ``httpx_args`` are added to those set before rather than replacing them.
+    """
+    if "httpx_args" in options:
+        options["httpx_args"] = {**_client_options.get("httpx_args", {}), **options["httpx_args"]}
+    _client_options.update(options)
 
 
 def get_client() -> AuthenticatedClient:
+    """The client shared by every command of the process, created on first use and closed by close_client"""
+    global _client
+    if _client is not None:
+        return _client
+
     if not (token := os.getenv("HEVY_API_TOKEN")):
         print("Token cannot be missing")
         raise typer.Exit(-1)
 
-    return AuthenticatedClient(token)
+    # ttl=0: regular commands always hit the API, the cache only backs --stale
+    # offline_fallback: the store (see ``hevy sync``) or the cache answer listings when the API cannot be reached
+    # lazy_models: listings only show top-level fields, exercises are never parsed unless a command reads them
+    options = {"offline_fallback": True, "lazy_models": True, **_client_options}
+    _client = AuthenticatedClient(
+        token,
+        cache=ResponseCache(path=get_cache_path(token), ttl=0),
+        store=LocalStore(path=get_cache_path(token, "store")),
+        **options,
+    )
+    return _client
+
+
+def close_client() -> None:
+    """Wait for background refreshes, then close the shared client (if one was created) and its databases"""
+    global _client
+    for thread in _background:
+        thread.join()
+    _background.clear()
+
+    if _client is None:
+        return
+    _client.close()
+    if _client.cache is not None:
+        _client.cache.close()
+    if _client.store is not None:
+        _client.store.close()
+    _client = None
+
+
+def iter_pages(
+    client: AuthenticatedClient,
+    endpoint: Any,
+    key: str,
+    *,
+    page_size: int,
+    concurrency: int = 4,
+    stop: Optional[Callable[[list[Any]], bool]] = None,
+    **params: Any,
+) -> Iterator[list[Any]]:
+    """Yield, in order, the items listed under ``key`` by each page of a paginated ``get_v1_*`` endpoint module.
+
+    The first page gives ``page_count``; the other pages are then fetched ``concurrency`` at a time. A progress bar
+    is shown on stderr when it is a terminal. Responses without ``page_count`` are paginated one by one until an
+    empty page. No page is requested after one for which ``stop(items)`` is true (e.g. the first page of workouts
+    older than a date); ``params`` are passed on to the endpoint (e.g. ``since``).
+
+    Raises:
+        errors.UnexpectedStatus: A page was answered with a status other than 200, or 404 past the last page.
+    """
+
+    def fetch(page: int) -> tuple[Any, list[Any]]:
+        res = endpoint.sync_detailed(client=client, api_key=client.token, page=page, page_size=page_size, **params)
+        if res.status_code == HTTPStatus.NOT_FOUND:
+            return None, []
+        items = getattr(res.parsed, key, None)
+        if res.status_code != HTTPStatus.OK or not isinstance(items, list):
+            raise errors.UnexpectedStatus(res.status_code, res.content)
+        return res.parsed, items
+
+    first, items = fetch(1)
+    yield items
+    page_count = getattr(first, "page_count", None)
+    if stop is not None and stop(items):
+        return
+
+    if not isinstance(page_count, int):
+        page = 2
+        while items:
+            _, items = fetch(page)
+            yield items
+            if stop is not None and stop(items):
+                return
+            page += 1
+        return
+
+    console = Console(stderr=True)
+    progress = Progress(
+        TextColumn(f"Fetching {key}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=console,
+        transient=True,
+        # records streamed to a pipe (e.g. --format ndjson | jq) must not be redirected to the progress console
+        redirect_stdout=sys.stdout.isatty(),
+        disable=not console.is_terminal or page_count < 2,
+    )
+    pages = iter(range(2, page_count + 1))
+    with progress, ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        task = progress.add_task(key, total=page_count, completed=1)
+        # a window of ``concurrency`` requests in flight, refilled as the oldest one is yielded
+        in_flight = deque(pool.submit(fetch, page) for page in islice(pages, concurrency))
+        while in_flight:
+            _, items = in_flight.popleft().result()
+            progress.advance(task)
+            yield items
+            if stop is not None and stop(items):
+                return
+            for page in islice(pages, 1):
+                in_flight.append(pool.submit(fetch, page))
+
+
+def fetch_all(
+    client: AuthenticatedClient,
+    endpoint: Any,
+    key: str,
+    *,
+    page_size: int,
+    concurrency: int = 4,
+) -> list[Any]:
+    """Every item of a paginated endpoint, see iter_pages"""
+    pages = iter_pages(client, endpoint, key, page_size=page_size, concurrency=concurrency)
+    return [item for items in pages for item in items]
+
+
+# the largest pages the API serves: exercise templates come 100 at a time, every other listing 10
+PAGE_SIZE = 10
+TEMPLATES_PAGE_SIZE = 100
+
+# the --concurrency option of the list commands
+Concurrency = Annotated[int, typer.Option("-j", "--concurrency", min=1, help="Number of pages fetched in parallel")]
+
+
+def with_cache_ttl(client: AuthenticatedClient, ttl: float) -> AuthenticatedClient:
+    """A copy of ``client`` that trusts cached responses for ``ttl`` seconds (see ResponseCache.with_ttl).
+
+    The copy sends its requests through the httpx.Client of ``client``, which stays the one to close.
+    """
+    if client.cache is None:
+        return client
+    # evolve only copies the constructor arguments, not the httpx client and its connection pool
+    return evolve(client, cache=client.cache.with_ttl(ttl)).set_httpx_client(client.get_httpx_client())
+
+
+def stale_while_revalidate(
+    client: AuthenticatedClient,
+    fetch: Callable[[AuthenticatedClient], T],
+    render: Callable[[T], None],
+    *,
+    rerender: bool = False,
+) -> None:
+    """Render whatever is cached right away, then refresh the cache from the API in the background.
+
+    When ``rerender`` is set the fresh data is rendered again if it differs from the cached one. Nothing is refreshed
+    when nothing came from the cache (e.g. on first use): what was rendered has just been fetched from the API.
+    """
+    stale_client = with_cache_ttl(client, math.inf)
+    stale = fetch(stale_client)
+    render(stale)
+    if stale_client.cache is None or not stale_client.cache.hits:
+        return
+
+    def _revalidate() -> None:
+        try:
+            fresh = fetch(with_cache_ttl(client, 0))
+        except (httpx.HTTPError, errors.UnexpectedStatus) as e:
+            Console(stderr=True).print(f"[dim]Could not refresh the cache: {e}[/dim]")
+            return
+
+        if rerender and fresh != stale:
+            Console(stderr=True).print("[yellow]Data changed since the cached copy, refreshed results:[/yellow]")
+            render(fresh)
+
+    # close_client waits for the refresh to land in the cache before closing the client
+    thread = threading.Thread(target=_revalidate, name="hevy-revalidate")
+    thread.start()
+    _background.append(thread)
+
+
+# above this many rows, or when stdout is not a terminal, tables skip rich's layout engine (see print_plain_table)
+PLAIN_TABLE_ROWS = 500
+
+# rows sampled to size the columns of a plain table, and the widest a column gets
+_SAMPLE_ROWS = 200
+_MAX_COLUMN_WIDTH = 40
+
+_PAGER = "less -FRSX"
+
+
+def _cell(value: Any) -> str:
+    return str(value).replace("\n", " ")
+
+
+def _page(lines: Iterable[str]) -> None:
+    """Stream ``lines`` through $PAGER (``less`` by default), or straight to stdout when it cannot be started"""
+    try:
+        pager = subprocess.Popen(shlex.split(os.getenv("PAGER") or _PAGER), stdin=subprocess.PIPE, text=True)
+    except OSError:
+        sys.stdout.writelines(lines)
+        return
+
+    assert pager.stdin is not None
+    try:
+        pager.stdin.writelines(lines)
+        pager.stdin.close()
+    except BrokenPipeError:
+        # quit before the end of the table
+        pass
+    pager.wait()
+
+
+def print_plain_table(data: list[dict[str, Any]]) -> None:
+    """Print rows as aligned plain text, one line at a time.
+
+    Column widths come from the header and the first rows; longer values, in the later rows too, are cut with an
+    ellipsis and counted in the footer. The lines go through a pager when stdout is a terminal.
+    """
+    columns = list(data[0])
+    sample = data[:_SAMPLE_ROWS]
+    widths = [
+        min(max(len(column), *(len(_cell(row.get(column, ""))) for row in sample)), _MAX_COLUMN_WIDTH)
+        for column in columns
+    ]
+    truncated = 0
+
+    def line(cells: list[str]) -> str:
+        nonlocal truncated
+        for i, cell in enumerate(cells):
+            if len(cell) > widths[i]:
+                cells[i] = cell[: widths[i] - 1] + "…"
+                truncated += 1
+        # no padding after the last column
+        return "  ".join([cell.ljust(width) for cell, width in zip(cells[:-1], widths)] + cells[-1:]) + "\n"
+
+    def lines() -> Iterator[str]:
+        yield line(list(columns))
+        yield line(["-" * width for width in widths])
+        for row in data:
+            yield line([_cell(row.get(column, "")) for column in columns])
+        yield f"Total: {len(data)}" + (f" ({truncated} values shortened, see --format)" if truncated else "") + "\n"
+
+    if sys.stdout.isatty():
+        _page(lines())
+    else:
+        sys.stdout.writelines(lines())
+    sys.stdout.flush()
+
+
+def on_render(hook: Callable[[float], None]) -> None:
+    """Call ``hook`` with the seconds taken by every print_table from now on (e.g. for ``hevy --timings``)"""
+    _render_hooks.append(hook)
 
 
 def print_table(data: list[dict[str, Any]]) -> None:
+    start = time.perf_counter()
+    try:
+        _print_table(data)
+    finally:
+        for hook in _render_hooks:
+            hook(time.perf_counter() - start)
+
+
+def _print_table(data: list[dict[str, Any]]) -> None:
+    if len(data) > PLAIN_TABLE_ROWS or not sys.stdout.isatty():
+        print_plain_table(data)
+        return
+
     console = Console()
 
     table = Table(*data[0].keys())
@@ -30,3 +336,78 @@ def print_table(data: list[dict[str, Any]]) -> None:
 
     console.print(table)
     print(f"Total: {len(data)}")
+
+
+class OutputFormat(str, Enum):
+    table = "table"
+    json = "json"
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+# the --format option of the list commands
+Format = Annotated[
+    OutputFormat,
+    typer.Option(
+        "-o",
+        "--format",
+        case_sensitive=False,
+        help="table, or json, ndjson or csv written as each page arrives (in API order)",
+    ),
+]
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return get_json_backend().dumps(value).decode()
+    return "" if value is None else value
+
+
+def write_records(
+    pages: Iterable[Iterable[dict[str, Any]]],
+    output_format: OutputFormat,
+    *,
+    sort_key: Optional[Callable[[dict[str, Any]], Any]] = None,
+    empty: str = "No results found",
+) -> None:
+    """Print the records of each page (e.g. the ``to_dict()`` of the models listed by ``iter_pages``) to stdout.
+
+    ``table`` collects every record, sorts them by ``sort_key`` and prints them with print_table, or ``empty`` when
+    there are none. The other formats write (and flush) each page as soon as it is iterated, so memory stays constant
+    however many pages there are: ``ndjson`` one JSON object per line, ``json`` a single array and ``csv`` a header
+    taken from the keys of the first record, then one row per record (keys missing from the header are dropped).
+    """
+    if output_format is OutputFormat.table:
+        rows = [row for page in pages for row in page]
+        if not rows:
+            print(empty)
+            return
+        print_table(sorted(rows, key=sort_key) if sort_key is not None else rows)
+        return
+
+    dumps = get_json_backend().dumps
+    header: Optional[list[str]] = None
+    count = 0
+    for page in pages:
+        # one write per page, looked up on sys.stdout every time (the progress bar of iter_pages may redirect it)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        for row in page:
+            if output_format is OutputFormat.ndjson:
+                buffer.write(dumps(row).decode())
+                buffer.write("\n")
+            elif output_format is OutputFormat.json:
+                buffer.write(",\n" if count else "[\n")
+                buffer.write(dumps(row).decode())
+            else:
+                if header is None:
+                    header = list(row)
+                    writer.writerow(header)
+                writer.writerow([_csv_value(row.get(key)) for key in header])
+            count += 1
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+    if output_format is OutputFormat.json:
+        sys.stdout.write("\n]\n" if count else "[]\n")
+        sys.stdout.flush()
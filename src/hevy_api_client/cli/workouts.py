@@ -0,0 +1,182 @@
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from typing import Annotated, Any, Optional
+
+import typer
+from rich import print
+
+from hevy_api_client.api.workouts import get_v1_workouts, get_v1_workouts_count, get_v1_workouts_events
+from hevy_api_client.cli.completion import complete_exercise_templates
+from hevy_api_client.cli.utils import (
+    PAGE_SIZE,
+    Concurrency,
+    Format,
+    OutputFormat,
+    get_client,
+    iter_pages,
+    write_records,
+)
+from hevy_api_client.client import AuthenticatedClient
+from hevy_api_client.models import GetV1WorkoutsCountResponse200
+from hevy_api_client.timestamps import MIN_DATETIME, to_datetime
+
+app = typer.Typer(no_args_is_help=True)
+
+# accepted by --since and --until, a date alone means midnight (UTC unless an offset is given)
+_DATE_FORMATS = ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%d %H:%M:%S"]
+
+Since = Annotated[
+    Optional[datetime],
+    typer.Option("--since", formats=_DATE_FORMATS, help="Only workouts started at or after this date"),
+]
+Until = Annotated[
+    Optional[datetime],
+    typer.Option("--until", formats=_DATE_FORMATS, help="Only workouts started before this date"),
+]
+Exercise = Annotated[
+    Optional[str],
+    typer.Option(
+        "-e",
+        "--exercise",
+        help="Only workouts with an exercise of this template id or whose title contains this text",
+        autocompletion=complete_exercise_templates,
+    ),
+]
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+def _has_exercise(workout: dict[str, Any], exercise: str) -> bool:
+    text = exercise.casefold()
+    return any(
+        e.get("exercise_template_id") == exercise or text in (e.get("title") or "").casefold()
+        for e in workout.get("exercises") or []
+    )
+
+
+def _filter(
+    workouts: Iterable[dict[str, Any]],
+    since: Optional[datetime],
+    until: Optional[datetime],
+    exercise: Optional[str],
+) -> list[dict[str, Any]]:
+    matches: list[dict[str, Any]] = []
+    for workout in workouts:
+        start = to_datetime(workout.get("start_time")) or MIN_DATETIME
+        if (since is not None and start < since) or (until is not None and start >= until):
+            continue
+        if exercise is not None and not _has_exercise(workout, exercise):
+            continue
+        matches.append(workout)
+    return matches
+
+
+def _workout_pages(
+    client: AuthenticatedClient,
+    since: Optional[datetime],
+    until: Optional[datetime],
+    exercise: Optional[str],
+    concurrency: int,
+) -> Iterator[list[dict[str, Any]]]:
+    """The workouts matching the filters, newest first, as JSON dicts, one list per page.
+
+    The workouts are paginated from the API (offline, from the cache or the store), which lists them newest first:
+    with ``since``, no page is fetched after the first one reaching back before it.
+    """
+    since, until = _utc(since), _utc(until)
+    filtered = since is not None or until is not None or exercise is not None
+
+    def reaches_since(workouts: list[Any]) -> bool:
+        if since is None or not workouts:
+            return False
+        return (to_datetime(workouts[-1].start_time) or MIN_DATETIME) < since
+
+    pages = iter_pages(
+        client, get_v1_workouts, "workouts", page_size=PAGE_SIZE, concurrency=concurrency, stop=reaches_since
+    )
+    for workouts in pages:
+        rows = [workout.to_dict() for workout in workouts]
+        yield _filter(rows, since, until, exercise) if filtered else rows
+
+
+def _table_row(workout: dict[str, Any]) -> dict[str, Any]:
+    # the sets would not fit in a table, only show how many exercises there are
+    return {**workout, "exercises": len(workout.get("exercises") or [])}
+
+
+@app.command(name="list")
+def list_all(
+    since: Since = None,
+    until: Until = None,
+    exercise: Exercise = None,
+    concurrency: Concurrency = 4,
+    output_format: Format = OutputFormat.table,
+) -> None:
+    """List workouts, newest first."""
+
+    client = get_client()
+    pages = _workout_pages(client, since, until, exercise, concurrency)
+    if output_format is OutputFormat.table:
+        pages = ([_table_row(workout) for workout in workouts] for workouts in pages)
+    write_records(pages, output_format, empty="No workouts found")
+
+
+@app.command()
+def count(
+    since: Since = None,
+    until: Until = None,
+    exercise: Exercise = None,
+    concurrency: Concurrency = 4,
+) -> None:
+    """Print the number of workouts, or of those matching the filters."""
+
+    client = get_client()
+    if since is None and until is None and exercise is None:
+        res = get_v1_workouts_count.sync(client=client, api_key=client.token)  # type: ignore
+        if not isinstance(res, GetV1WorkoutsCountResponse200):
+            print("Could not get a valid response")
+            raise typer.Exit(-1)
+        print(res.workout_count)
+        return
+
+    print(sum(len(workouts) for workouts in _workout_pages(client, since, until, exercise, concurrency)))
+
+
+def _event_row(event: dict[str, Any]) -> dict[str, Any]:
+    workout = event.get("workout") or {}
+    return {
+        "type": event.get("type"),
+        "id": workout.get("id", event.get("id")),
+        "title": workout.get("title", ""),
+        "at": workout.get("updated_at", event.get("deleted_at")),
+    }
+
+
+@app.command()
+def events(
+    since: Annotated[
+        datetime,
+        typer.Option("--since", formats=_DATE_FORMATS, help="Only events after this date"),
+    ] = datetime(1970, 1, 1),
+    concurrency: Concurrency = 4,
+    output_format: Format = OutputFormat.table,
+) -> None:
+    """List the workouts updated or deleted since a date, newest first."""
+
+    client = get_client()
+    pages = iter_pages(
+        client,
+        get_v1_workouts_events,
+        "events",
+        page_size=PAGE_SIZE,
+        concurrency=concurrency,
+        since=_utc(since).astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),  # type: ignore
+    )
+    rows = ([event.to_dict() for event in page] for page in pages)
+    if output_format is OutputFormat.table:
+        rows = ([_event_row(event) for event in page] for page in rows)
+    write_records(rows, output_format, empty="No workout events found")
@@ -1,9 +1,16 @@
 import ssl
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import httpx
 from attrs import define, evolve, field
 
+from .caching import ResponseCache
+from .jsonlib import JsonBackend, get_json_backend
+from .store import LocalStore
+
+if TYPE_CHECKING:
+    from .interning import InternTable
+
 HEVY_API_URL = "https://api.hevy.com/"
 
 
@@ -34,9 +41,36 @@ class Client:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document. Can also be provided as a keyword
             argument to the constructor.
+        cache: An optional ResponseCache used by the read-only endpoints. Mutating endpoints invalidate the
+            cached listings they affect. Can also be provided as a keyword argument to the constructor.
+        store: An optional LocalStore. Mutating endpoints write the entities they return into it. Can also be
+            provided as a keyword argument to the constructor.
+        offline: Whether to answer the read-only endpoints from ``cache`` or ``store`` without reaching the API.
+            Responses carry an ``Age`` header with the age of the data in seconds (see caching.data_age).
+        offline_fallback: Whether to answer the read-only endpoints from ``cache`` or ``store`` when the API is
+            unreachable or rate limits the client.
+        json_backend: The JsonBackend responses are decoded with. Defaults to the fastest one installed (orjson,
+            msgspec, then the standard library), see jsonlib.get_json_backend.
+        compiled_decoders: Whether to build response models with the decoders compiled by decoders.get_decoder
+            instead of the generated ``from_dict`` methods. Both give identical results.
+        lazy_models: Whether to build workouts and routines as LazyWorkout and LazyRoutine (see lazy), whose
+            exercises are only parsed when first accessed. Implies the compiled decoders.
+        compact_models: Whether models without unknown keys share one read-only ``additional_properties``
+            mapping instead of an empty dict each (see decoders). Implies the compiled decoders.
+        interner: An optional InternTable that deduplicates repeated strings of the responses (exercise titles,
+            template ids, set types...), see interning. Implies the compiled decoders.
     """
 
     raise_on_unexpected_status: bool = field(default=False, kw_only=True)
+    cache: Optional[ResponseCache] = field(default=None, kw_only=True)
+    store: Optional[LocalStore] = field(default=None, kw_only=True)
+    offline: bool = field(default=False, kw_only=True)
+    offline_fallback: bool = field(default=False, kw_only=True)
+    json_backend: JsonBackend = field(factory=get_json_backend, kw_only=True)
+    compiled_decoders: bool = field(default=False, kw_only=True)
+    lazy_models: bool = field(default=False, kw_only=True)
+    compact_models: bool = field(default=False, kw_only=True)
+    interner: Optional["InternTable"] = field(default=None, kw_only=True)
     _base_url: str = field(alias="base_url", default=HEVY_API_URL)
     _cookies: dict[str, str] = field(factory=dict, kw_only=True, alias="cookies")
     _headers: dict[str, str] = field(factory=dict, kw_only=True, alias="headers")
@@ -108,6 +142,22 @@ class Client:
         """Exit a context manager for internal httpx.Client (see httpx docs)"""
         self.get_httpx_client().__exit__(*args, **kwargs)
 
+    def close(self) -> None:
+        """Close the internal httpx.Client, if one was created.
+
+        An httpx.AsyncClient can only be closed from an event loop: use ``aclose`` when one was created.
+        """
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        """Close the internal httpx.Client and httpx.AsyncClient, if they were created"""
+        self.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
     def set_async_httpx_client(self, async_client: httpx.AsyncClient) -> "Client":
         """Manually the underlying httpx.AsyncClient
 
@@ -167,6 +217,24 @@ class AuthenticatedClient:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document. Can also be provided as a keyword
             argument to the constructor.
+        cache: An optional ResponseCache used by the read-only endpoints. Mutating endpoints invalidate the
+            cached listings they affect. Can also be provided as a keyword argument to the constructor.
+        store: An optional LocalStore. Mutating endpoints write the entities they return into it. Can also be
+            provided as a keyword argument to the constructor.
+        offline: Whether to answer the read-only endpoints from ``cache`` or ``store`` without reaching the API.
+            Responses carry an ``Age`` header with the age of the data in seconds (see caching.data_age).
+        offline_fallback: Whether to answer the read-only endpoints from ``cache`` or ``store`` when the API is
+            unreachable or rate limits the client.
+        json_backend: The JsonBackend responses are decoded with. Defaults to the fastest one installed (orjson,
+            msgspec, then the standard library), see jsonlib.get_json_backend.
+        compiled_decoders: Whether to build response models with the decoders compiled by decoders.get_decoder
+            instead of the generated ``from_dict`` methods. Both give identical results.
+        lazy_models: Whether to build workouts and routines as LazyWorkout and LazyRoutine (see lazy), whose
+            exercises are only parsed when first accessed. Implies the compiled decoders.
+        compact_models: Whether models without unknown keys share one read-only ``additional_properties``
+            mapping instead of an empty dict each (see decoders). Implies the compiled decoders.
+        interner: An optional InternTable that deduplicates repeated strings of the responses (exercise titles,
+            template ids, set types...), see interning. Implies the compiled decoders.
         token: The token to use for authentication
         prefix: The prefix to use for the Authorization header
         auth_header_name: The name of the Authorization header
@@ -174,6 +242,15 @@ class AuthenticatedClient:
 
     token: str
     raise_on_unexpected_status: bool = field(default=False, kw_only=True)
+    cache: Optional[ResponseCache] = field(default=None, kw_only=True)
+    store: Optional[LocalStore] = field(default=None, kw_only=True)
+    offline: bool = field(default=False, kw_only=True)
+    offline_fallback: bool = field(default=False, kw_only=True)
+    json_backend: JsonBackend = field(factory=get_json_backend, kw_only=True)
+    compiled_decoders: bool = field(default=False, kw_only=True)
+    lazy_models: bool = field(default=False, kw_only=True)
+    compact_models: bool = field(default=False, kw_only=True)
+    interner: Optional["InternTable"] = field(default=None, kw_only=True)
     _base_url: str = field(alias="base_url", default=HEVY_API_URL)
     _cookies: dict[str, str] = field(factory=dict, kw_only=True, alias="cookies")
     _headers: dict[str, str] = field(factory=dict, kw_only=True, alias="headers")
@@ -251,6 +328,22 @@ class AuthenticatedClient:
         """Exit a context manager for internal httpx.Client (see httpx docs)"""
         self.get_httpx_client().__exit__(*args, **kwargs)
 
+    def close(self) -> None:
+        """Close the internal httpx.Client, if one was created.
+
+        An httpx.AsyncClient can only be closed from an event loop: use ``aclose`` when one was created.
+        """
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        """Close the internal httpx.Client and httpx.AsyncClient, if they were created"""
+        self.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
     def set_async_httpx_client(
         self, async_client: httpx.AsyncClient
     ) -> "AuthenticatedClient":
@@ -0,0 +1,186 @@
+"""Contains a columnar, array-backed view of the sets of a workout history.
+
+Walking ``Workout`` -> ``WorkoutExercisesItem`` -> ``WorkoutExercisesItemSetsItem`` objects costs an attribute lookup
+per value. ``SetsTable`` copies every set once into contiguous ``array('d')`` columns (``NaN`` for missing values),
+with parallel index columns pointing to the workout, the exercise template and the set type of each row:
+
+    >>> table = SetsTable.from_store(store)
+    >>> table.total("reps")
+    >>> table.totals_by_template("weight_kg")
+
+With NumPy installed (``pip install hevy-api-client[analytics]``) ``table.numpy("weight_kg")`` returns the column as an
+ndarray without copying it, and ``total`` and ``totals_by_template`` run on NumPy.
+"""
+
+import math
+from array import array
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from attrs import define, field
+
+from .models.workout import Workout
+from .store import LocalStore
+from .timestamps import to_datetime
+from .types import Unset
+
+if TYPE_CHECKING:
+    import numpy  # type: ignore[import-not-found]
+
+NAN = math.nan
+
+METRICS = ("weight_kg", "reps", "rpe", "distance_meters", "duration_seconds", "custom_metric")
+
+
+def _float(value: Any) -> float:
+    return NAN if value is None or isinstance(value, Unset) else float(value)
+
+
+def _timestamp(value: Any) -> float:
+    parsed = to_datetime(value)
+    return NAN if parsed is None else parsed.timestamp()
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@define
+class _Categories:
+    """Distinct values of a column, each stored once and referenced by its position"""
+
+    values: list[Optional[str]] = field(factory=list)
+    _positions: dict[Optional[str], int] = field(factory=dict)
+
+    def code(self, value: Optional[str]) -> int:
+        if (position := self._positions.get(value)) is None:
+            position = self._positions[value] = len(self.values)
+            self.values.append(value)
+        return position
+
+
+@define
+class SetsTable:
+    """One row per set of a workout history, stored column by column.
+
+    Attributes:
+        columns: One ``array('d')`` per name of ``METRICS``, ``NaN`` where the set has no value.
+        workout_ids: The distinct workout ids, referenced by ``workout``.
+        workout: For every row, the position of its workout id in ``workout_ids``.
+        start_time: For every row, the start time of its workout as a POSIX timestamp (``NaN`` if unknown).
+        exercise_template_ids: The distinct exercise template ids, referenced by ``template``.
+        template: For every row, the position of its exercise template id in ``exercise_template_ids``.
+        set_types: The distinct set types (``"normal"``, ``"warmup"``...), referenced by ``set_type``.
+        set_type: For every row, the position of its set type in ``set_types``.
+    """
+
+    columns: dict[str, array] = field(factory=lambda: {name: array("d") for name in METRICS})
+    workout: array = field(factory=lambda: array("l"))
+    start_time: array = field(factory=lambda: array("d"))
+    template: array = field(factory=lambda: array("l"))
+    set_type: array = field(factory=lambda: array("l"))
+    _workouts: _Categories = field(factory=_Categories, init=False)
+    _templates: _Categories = field(factory=_Categories, init=False)
+    _set_types: _Categories = field(factory=_Categories, init=False)
+
+    @property
+    def workout_ids(self) -> list[Optional[str]]:
+        return self._workouts.values
+
+    @property
+    def exercise_template_ids(self) -> list[Optional[str]]:
+        return self._templates.values
+
+    @property
+    def set_types(self) -> list[Optional[str]]:
+        return self._set_types.values
+
+    def __len__(self) -> int:
+        return len(self.workout)
+
+    def _append(self, workout_id: Any, start_time: float, template_id: Any, set_type: Any, values: list[float]) -> None:
+        self.workout.append(self._workouts.code(workout_id or None))
+        self.start_time.append(start_time)
+        self.template.append(self._templates.code(template_id or None))
+        self.set_type.append(self._set_types.code(set_type or None))
+        for name, value in zip(METRICS, values):
+            self.columns[name].append(value)
+
+    def add_json(self, workout: Mapping[str, Any]) -> None:
+        """Append the sets of a workout given as returned by the API"""
+        start_time = _timestamp(workout.get("start_time"))
+        for exercise in workout.get("exercises") or []:
+            for set_ in exercise.get("sets") or []:
+                self._append(
+                    workout.get("id"),
+                    start_time,
+                    exercise.get("exercise_template_id"),
+                    set_.get("type"),
+                    [_float(set_.get(name)) for name in METRICS],
+                )
+
+    def add_workout(self, workout: Workout) -> None:
+        """Append the sets of a Workout model"""
+        start_time = _timestamp(workout.start_time)
+        for exercise in workout.exercises or []:
+            for set_ in exercise.sets or []:
+                self._append(
+                    workout.id,
+                    start_time,
+                    exercise.exercise_template_id,
+                    set_.type_,
+                    [_float(getattr(set_, name)) for name in METRICS],
+                )
+
+    @classmethod
+    def from_workouts(cls, workouts: Iterable[Union[Workout, Mapping[str, Any]]]) -> "SetsTable":
+        """Build a table from Workout models or from workouts as returned by the API"""
+        table = cls()
+        for workout in workouts:
+            if isinstance(workout, Workout):
+                table.add_workout(workout)
+            else:
+                table.add_json(workout)
+        return table
+
+    @classmethod
+    def from_store(cls, store: LocalStore) -> "SetsTable":
+        """Build a table from the workouts of a LocalStore, without creating any model"""
+        return cls.from_workouts(store.iter("workouts"))
+
+    def numpy(self, name: str) -> "numpy.ndarray":
+        """A column (``workout``, ``start_time``, ``template``, ``set_type`` or a metric) as a zero-copy NumPy array"""
+        np = _numpy()
+        if np is None:
+            raise ImportError("SetsTable.numpy requires NumPy: pip install hevy-api-client[analytics]")
+        column = self.columns[name] if name in self.columns else getattr(self, name)
+        return np.frombuffer(column, dtype=np.float64 if column.typecode == "d" else np.dtype(f"i{column.itemsize}"))
+
+    def total(self, name: str) -> float:
+        """Sum of a metric column, ignoring missing values"""
+        if (np := _numpy()) is not None:
+            return float(np.nansum(self.numpy(name)))
+        return math.fsum(value for value in self.columns[name] if value == value)
+
+    def totals_by_template(self, name: str) -> dict[Optional[str], float]:
+        """Sum of a metric column per exercise template id, ignoring missing values"""
+        if (np := _numpy()) is not None:
+            values = self.numpy(name)
+            present = ~np.isnan(values)
+            sums = np.bincount(
+                self.numpy("template")[present], weights=values[present], minlength=len(self.exercise_template_ids)
+            )
+            return dict(zip(self.exercise_template_ids, sums.tolist()))
+
+        totals = [0.0] * len(self.exercise_template_ids)
+        for position, value in zip(self.template, self.columns[name]):
+            if value == value:
+                totals[position] += value
+        return dict(zip(self.exercise_template_ids, totals))
+
+
+__all__ = ["METRICS", "SetsTable"]
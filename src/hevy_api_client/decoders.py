@@ -0,0 +1,255 @@
+"""Contains an alternative decoding engine: one specialised decoder function per model class.
+
+The generated ``from_dict`` methods copy the source dict, import their nested models and ``pop`` every field on each
+call. The decoders built here are compiled once per class from its attrs fields and type hints: they read fields with
+``dict.get``, only build ``additional_properties`` when the source has unknown keys and call the decoders of nested
+models directly. Their results are identical to ``from_dict``.
+
+    >>> from hevy_api_client.decoders import decode
+    >>> from hevy_api_client.models import GetV1WorkoutsResponse200
+    >>> page = decode(GetV1WorkoutsResponse200, data)
+
+Endpoints use them instead of ``from_dict`` when the client is created with ``compiled_decoders=True``. With
+``lazy=True`` (``lazy_models=True`` on the client) workouts and routines are built as their ``hevy_api_client.lazy``
+variants, whose exercises are only parsed when first accessed, by their own decoder built with the same options. With
+``compact=True`` (``compact_models=True`` on the client) models without unknown keys share one read-only
+``types.EMPTY_PROPERTIES`` instead of each allocating an empty ``additional_properties`` dict; it is swapped for a
+dict of their own on the first ``model[key] = value`` or ``del model[key]``. With an ``interner`` (``interner=`` on
+the client) the fields of ``interning.INTERNED_FIELDS`` go through that InternTable.
+"""
+
+import time
+import typing
+from collections.abc import Mapping
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
+
+import attrs
+import httpx
+
+from . import models
+from .interning import INTERNED_FIELDS, InternTable
+from .lazy import LAZY_MODELS
+from .models.paginated_workout_events import _EVENT_PARSERS, PaginatedWorkoutEvents
+from .types import EMPTY_PROPERTIES, UNSET, Unset
+
+if TYPE_CHECKING:
+    from .client import AuthenticatedClient, Client
+
+T = TypeVar("T")
+
+Decoder = Callable[[Mapping[str, Any]], Any]
+
+# list fields holding a union of models, dispatched on the value of the item "type" property
+_DISCRIMINATED_LISTS: dict[tuple[type, str], dict[str, type]] = {
+    (PaginatedWorkoutEvents, "events"): {
+        event_type: parser.__self__  # type: ignore[attr-defined]
+        for event_type, parser in _EVENT_PARSERS.items()
+    },
+}
+
+_decoders: dict[tuple[type, bool, bool], Decoder] = {}
+
+# called with (response, cls, JSON decoding seconds, model building seconds) by from_response (see on_parse)
+_parse_hooks: list[Callable[[httpx.Response, type, float, float], None]] = []
+
+
+class _ModelNamespace(dict):  # type: ignore[type-arg]
+    """Resolves the forward references of model annotations (e.g. ``"WorkoutExercisesItem"``), importing models on
+    demand like the ``models`` package does"""
+
+    def __missing__(self, name: str) -> Any:
+        try:
+            return getattr(models, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+
+MODEL_NAMESPACE = _ModelNamespace()
+
+
+def _is_model(tp: Any) -> bool:
+    return isinstance(tp, type) and attrs.has(tp) and hasattr(tp, "from_dict")
+
+
+def _strip_optional(tp: Any) -> list[Any]:
+    """The members of a Union annotation other than Unset and None"""
+    if typing.get_origin(tp) is Union:
+        return [arg for arg in typing.get_args(tp) if arg not in (Unset, type(None))]
+    return [tp]
+
+
+def _json_key(attribute: "attrs.Attribute[Any]") -> str:
+    # the generator appends an underscore to properties that shadow Python names (e.g. "type" -> "type_")
+    return attribute.name[:-1] if attribute.name.endswith("_") else attribute.name
+
+
+def _converter(tp: Any, options: dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+    """How a single (non-list) annotation is built from JSON: a nested decoder, an enum or nothing to do"""
+    members = _strip_optional(tp)
+    if len(members) != 1:
+        return None
+    if _is_model(members[0]):
+        return get_decoder(members[0], **options)
+    if isinstance(members[0], type) and issubclass(members[0], Enum):
+        return members[0]
+    return None
+
+
+def _compile(cls: type, options: dict[str, Any]) -> Decoder:
+    hints = typing.get_type_hints(cls, localns=MODEL_NAMESPACE)
+    fields = [a for a in attrs.fields(cls) if a.name != "additional_properties"]
+    lazy = options["lazy"] and cls in LAZY_MODELS
+
+    namespace: dict[str, Any] = {
+        "_cls": LAZY_MODELS[cls] if lazy else cls,
+        "_new": object.__new__,
+        "UNSET": UNSET,
+        "_EMPTY": EMPTY_PROPERTIES,
+        "_intern": options["interner"],
+    }
+    interned = INTERNED_FIELDS.get(cls, frozenset()) if options["interner"] is not None else frozenset()
+    lines = ["def decode(src):", "    get = src.get", "    obj = _new(_cls)"]
+    known: set[str] = set()
+
+    for attribute in fields:
+        name = attribute.name
+        key = _json_key(attribute)
+        known.add(key)
+        required = attribute.default is attrs.NOTHING
+        read = f"src[{key!r}]" if required else f"get({key!r}, UNSET)"
+        lists = [m for m in _strip_optional(hints[name]) if typing.get_origin(m) is list and typing.get_args(m)]
+        item_converter = _converter(typing.get_args(lists[0])[0], options) if lists else None
+
+        if lazy and name == "exercises":
+            # kept as raw JSON, parsed by the item decoder on first access (see hevy_api_client.lazy)
+            namespace["_parse_exercise"] = item_converter
+            lines.append(f"    obj._raw_exercises = {read}")
+            lines.append("    obj._parse_exercise = _parse_exercise")
+        elif (cls, name) in _DISCRIMINATED_LISTS:
+            dispatch = _DISCRIMINATED_LISTS[(cls, name)]
+            namespace[f"_dispatch_{name}"] = {
+                event_type: get_decoder(model, **options) for event_type, model in dispatch.items()
+            }
+            namespace["_parse_union_item"] = _parse_union_item
+            lines.append(f"    obj.{name} = [_parse_union_item(_dispatch_{name}, item) for item in {read}]")
+        elif item_converter is not None:
+            # from_dict turns a missing or empty list into []
+            namespace[f"_convert_{name}"] = item_converter
+            lines.append(f"    _{name} = {read}")
+            lines.append(f"    obj.{name} = [_convert_{name}(item) for item in _{name}] if _{name} else []")
+        elif (converter := _converter(hints[name], options)) is not None:
+            namespace[f"_convert_{name}"] = converter
+            if required:
+                lines.append(f"    obj.{name} = _convert_{name}({read})")
+            else:
+                lines.append(f"    _{name} = {read}")
+                lines.append(f"    obj.{name} = UNSET if _{name} is UNSET else _convert_{name}(_{name})")
+        elif name in interned and lists:
+            lines.append(f"    _{name} = {read}")
+            lines.append(f"    obj.{name} = [_intern(item) for item in _{name}] if type(_{name}) is list else _{name}")
+        elif name in interned:
+            lines.append(f"    obj.{name} = _intern({read})")
+        else:
+            lines.append(f"    obj.{name} = {read}")
+
+    namespace["_known"] = frozenset(known)
+    lines += [
+        f"    obj.additional_properties = {'_EMPTY' if options['compact'] else '{}'} if src.keys() <= _known else "
+        "{k: v for k, v in src.items() if k not in _known}",
+        "    return obj",
+    ]
+
+    exec(compile("\n".join(lines), f"<decoder {cls.__name__}>", "exec"), namespace)
+    return namespace["decode"]
+
+
+def _parse_union_item(dispatch: dict[str, Decoder], data: Any) -> Any:
+    if not isinstance(data, Mapping):
+        raise TypeError(f"Expected an object, got {type(data).__name__}")
+    try:
+        decoder = dispatch[data["type"]]
+    except KeyError:
+        raise ValueError(f"Unknown type {data.get('type')!r}, expected one of {sorted(dispatch)}") from None
+    return decoder(data)
+
+
+def get_decoder(
+    cls: type[T],
+    *,
+    lazy: bool = False,
+    compact: bool = False,
+    interner: Optional[InternTable] = None,
+) -> Callable[[Mapping[str, Any]], T]:
+    """Return the compiled decoder of a model class, building it (and those of its nested models) on first use.
+
+    Decoders that intern strings are kept by their InternTable, so they go away with it.
+    """
+    cache = _decoders if interner is None else interner.decoders
+    key = (cls, lazy, compact)
+    if key not in cache:
+        cache[key] = _compile(cls, {"lazy": lazy, "compact": compact, "interner": interner})
+    return cache[key]
+
+
+def decode(
+    cls: type[T],
+    src_dict: Mapping[str, Any],
+    *,
+    lazy: bool = False,
+    compact: bool = False,
+    interner: Optional[InternTable] = None,
+) -> T:
+    """Equivalent to ``cls.from_dict(src_dict)`` (see the module docstring for the keyword arguments)"""
+    return get_decoder(cls, lazy=lazy, compact=compact, interner=interner)(src_dict)
+
+
+def from_response(
+    client: Union["AuthenticatedClient", "Client"],
+    cls: type[T],
+    response: httpx.Response,
+    *,
+    parse: bool = True,
+) -> T:
+    """Decode a response body into ``cls`` with the client's JSON backend and decoding engine.
+
+    With ``parse=False`` the decoded JSON is returned as is, without building any model. Clients with
+    ``lazy_models``, ``compact_models`` or an ``interner`` always use the compiled decoders.
+    """
+    if not _parse_hooks:
+        return _build(client, cls, client.json_backend.loads(response.content), parse)
+
+    start = time.perf_counter()
+    data = client.json_backend.loads(response.content)
+    decoded = time.perf_counter()
+    try:
+        return _build(client, cls, data, parse)
+    finally:
+        built = time.perf_counter()
+        for hook in _parse_hooks:
+            hook(response, cls, decoded - start, built - decoded)
+
+
+def _build(client: Union["AuthenticatedClient", "Client"], cls: type[T], data: Any, parse: bool) -> T:
+    if not parse:
+        return data
+    if client.lazy_models or client.compact_models or client.interner is not None:
+        return decode(cls, data, lazy=client.lazy_models, compact=client.compact_models, interner=client.interner)
+    return decode(cls, data) if client.compiled_decoders else cls.from_dict(data)  # type: ignore[attr-defined]
+
+
+def on_parse(hook: Callable[[httpx.Response, type, float, float], None]) -> None:
+    """Call ``hook(response, cls, decode_seconds, models_seconds)`` after every from_response from now on (e.g. for
+    ``hevy --timings``), with the seconds spent decoding the JSON and building the models"""
+    _parse_hooks.append(hook)
+
+
+def compile_all() -> None:
+    """Build the decoders of every model ahead of time"""
+    for name in models.__all__:
+        model = getattr(models, name)
+        if _is_model(model):
+            get_decoder(model)
+
+
+__all__ = ["compile_all", "decode", "from_response", "get_decoder", "on_parse"]
@@ -0,0 +1,90 @@
+"""Contains specialised encoders that serialise request bodies straight to JSON bytes.
+
+The generated ``to_dict`` methods run an ``isinstance(..., Unset)`` check per field and build the dict that httpx then
+serialises a second time. The encoders built here are compiled once per class from its attrs fields and type hints:
+they compare fields against ``UNSET`` by identity, call the encoders of nested models directly and hand the result to
+the fastest JSON backend installed. ``get_encoder(cls)(obj)`` is identical to ``obj.to_dict()``.
+
+    >>> from hevy_api_client.encoders import to_json_bytes
+    >>> content = to_json_bytes(PostRoutinesRequestBody(routine=...))
+
+Mutating endpoints send their body with it, as the request ``content``.
+"""
+
+import typing
+from enum import Enum
+from typing import Any, Callable, Optional
+
+import attrs
+
+from .decoders import MODEL_NAMESPACE, _is_model, _json_key, _strip_optional
+from .jsonlib import JsonBackend, get_json_backend
+from .types import UNSET
+
+Encoder = Callable[[Any], dict[str, Any]]
+
+_encoders: dict[type, Encoder] = {}
+
+
+def _converter(tp: Any) -> Optional[Callable[[Any], Any]]:
+    """How a single (non-list) annotation is turned into JSON: a nested encoder, an enum value or nothing to do"""
+    members = _strip_optional(tp)
+    if len(members) != 1:
+        return None
+    if _is_model(members[0]):
+        return get_encoder(members[0])
+    if isinstance(members[0], type) and issubclass(members[0], Enum):
+        return _enum_value
+    return None
+
+
+def _enum_value(member: Enum) -> Any:
+    return member.value
+
+
+def _compile(cls: type) -> Encoder:
+    hints = typing.get_type_hints(cls, localns=MODEL_NAMESPACE)
+    namespace: dict[str, Any] = {"UNSET": UNSET}
+    # like to_dict: unknown properties first, then the fields in declaration order
+    lines = ["def encode(obj):", "    out = dict(obj.additional_properties) if obj.additional_properties else {}"]
+
+    for attribute in attrs.fields(cls):
+        name = attribute.name
+        if name == "additional_properties":
+            continue
+
+        key = _json_key(attribute)
+        lists = [m for m in _strip_optional(hints[name]) if typing.get_origin(m) is list and typing.get_args(m)]
+        converter = _converter(typing.get_args(lists[0])[0]) if lists else _converter(hints[name])
+        if converter is None:
+            value = "_v"
+        else:
+            namespace[f"_convert_{name}"] = converter
+            value = f"[_convert_{name}(item) for item in _v]" if lists else f"_convert_{name}(_v)"
+            value = f"None if _v is None else {value}"
+
+        lines.append(f"    _v = obj.{name}")
+        if attribute.default is attrs.NOTHING:
+            lines.append(f"    out[{key!r}] = {value}")
+        else:
+            lines.append("    if _v is not UNSET:")
+            lines.append(f"        out[{key!r}] = {value}")
+
+    lines.append("    return out")
+    exec(compile("\n".join(lines), f"<encoder {cls.__name__}>", "exec"), namespace)
+    return namespace["encode"]
+
+
+def get_encoder(cls: type) -> Encoder:
+    """Return the compiled encoder of a model class, building it (and those of its nested models) on first use"""
+    if cls not in _encoders:
+        _encoders[cls] = _compile(cls)
+    return _encoders[cls]
+
+
+def to_json_bytes(obj: Any, json_backend: Optional[JsonBackend] = None) -> bytes:
+    """Serialise a model to JSON, by default with the fastest backend installed (see jsonlib.get_json_backend)"""
+    return (json_backend or get_json_backend()).dumps(get_encoder(type(obj))(obj))
+
+
+__all__ = ["get_encoder", "to_json_bytes"]
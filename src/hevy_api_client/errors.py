@@ -13,4 +13,14 @@ class UnexpectedStatus(Exception):
         )
 
 
-__all__ = ["UnexpectedStatus"]
+class OfflineDataUnavailable(Exception):
+    """Raised by api functions when Client.offline is True and neither Client.cache nor Client.store can answer"""
+
+    def __init__(self, method: str, url: str):
+        self.method = method
+        self.url = url
+
+        super().__init__(f"No offline data available for {method.upper()} {url}")
+
+
+__all__ = ["OfflineDataUnavailable", "UnexpectedStatus"]
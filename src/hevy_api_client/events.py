@@ -0,0 +1,218 @@
+"""Contains helpers to tail the workout events feed"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, Optional, Union
+from uuid import UUID
+
+import httpx
+from attrs import define, field
+
+from . import errors
+from .api.workouts import get_v1_workouts_events
+from .client import AuthenticatedClient, Client
+from .models.deleted_workout import DeletedWorkout
+from .models.paginated_workout_events import PaginatedWorkoutEvents
+from .models.updated_workout import UpdatedWorkout
+from .timestamps import sort_key
+from .types import Response, Unset
+
+WorkoutEvent = Union[UpdatedWorkout, DeletedWorkout]
+
+
+@define
+class AdaptivePolling:
+    """Poll interval that drops to ``min_interval`` after activity and grows by ``backoff`` while idle
+
+    Attributes:
+        min_interval: Seconds to wait after a poll that returned new events.
+        max_interval: Upper bound for the idle interval.
+        backoff: Factor the interval is multiplied by after every idle poll.
+    """
+
+    min_interval: float = 5.0
+    max_interval: float = 300.0
+    backoff: float = 2.0
+    interval: float = field(init=False)
+
+    def __attrs_post_init__(self) -> None:
+        self.interval = self.min_interval
+
+    def next_interval(self, active: bool) -> float:
+        if active:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+        return self.interval
+
+
+def _event_key(event: WorkoutEvent) -> tuple[str, str, str]:
+    if isinstance(event, UpdatedWorkout):
+        workout = event.workout
+        return ("updated", str(workout.id), str(workout.updated_at))
+    return ("deleted", event.id, "" if isinstance(event.deleted_at, Unset) else event.deleted_at)
+
+
+def _event_time(event: WorkoutEvent) -> str:
+    if isinstance(event, UpdatedWorkout):
+        updated_at = event.workout.updated_at
+    else:
+        updated_at = event.deleted_at
+    return "" if isinstance(updated_at, Unset) else updated_at
+
+
+@define
+class _EventCursor:
+    """Tracks the ``since`` of the next poll and the events already delivered at or after it"""
+
+    since: str
+    _delivered: dict[tuple[str, str, str], str] = field(factory=dict)
+
+    def accept(self, events: list[WorkoutEvent]) -> list[WorkoutEvent]:
+        """Return the events not delivered yet, oldest first, and move the cursor past them"""
+        new: list[WorkoutEvent] = []
+        # the API returns newest first
+        for event in reversed(events):
+            key = _event_key(event)
+            if key in self._delivered:
+                continue
+            self._delivered[key] = _event_time(event)
+            new.append(event)
+
+        if new:
+            # compare instants, not strings: the API may format the same instant differently from ``since``
+            self.since = max(self.since, *(_event_time(event) for event in new), key=sort_key)
+            # anything older than the cursor cannot be returned again by the API
+            since = sort_key(self.since)
+            self._delivered = {k: t for k, t in self._delivered.items() if sort_key(t) >= since}
+        return new
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed poll is worth retrying: transport errors, rate limiting and server errors"""
+    if isinstance(error, errors.UnexpectedStatus):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def _page_events(response: Response[Union[Any, PaginatedWorkoutEvents]]) -> PaginatedWorkoutEvents:
+    """The events page of ``response``, or UnexpectedStatus: a partial batch would move the cursor past the events
+    of the pages not read"""
+    if not isinstance(response.parsed, PaginatedWorkoutEvents):
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    return response.parsed
+
+
+def _poll_pages(
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    since: str,
+    page_size: int,
+) -> list[WorkoutEvent]:
+    events: list[WorkoutEvent] = []
+    page = 1
+    page_count = 1
+    while page <= page_count:
+        parsed = _page_events(
+            get_v1_workouts_events.sync_detailed(
+                client=client, page=page, page_size=page_size, since=since, api_key=api_key
+            )
+        )
+        events.extend(parsed.events)
+        page_count = parsed.page_count
+        page += 1
+    return events
+
+
+async def _apoll_pages(
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    since: str,
+    page_size: int,
+) -> list[WorkoutEvent]:
+    events: list[WorkoutEvent] = []
+    page = 1
+    page_count = 1
+    while page <= page_count:
+        parsed = _page_events(
+            await get_v1_workouts_events.asyncio_detailed(
+                client=client, page=page, page_size=page_size, since=since, api_key=api_key
+            )
+        )
+        events.extend(parsed.events)
+        page_count = parsed.page_count
+        page += 1
+    return events
+
+
+def follow_workout_events(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    since: str = "1970-01-01T00:00:00Z",
+    page_size: int = 10,
+    polling: Optional[AdaptivePolling] = None,
+) -> Iterator[WorkoutEvent]:
+    """Poll ``/v1/workouts/events`` forever and yield every new event, oldest first.
+
+    Events already delivered are never yielded twice. The wait between polls follows ``polling`` (an
+    ``AdaptivePolling()`` by default). A poll with a transport error or a page that is rate limited (429) or failed
+    on the server (5xx) counts as an idle poll: its events are dropped and the cursor stays put, so the next poll
+    requests them again. Any other status (e.g. 401 for an invalid ``api_key``) raises errors.UnexpectedStatus.
+    ``/v1/workouts/events`` is never cached; with ``client.offline`` errors.OfflineDataUnavailable is raised.
+
+    Args:
+        since (str): Only events after this ISO 8601 timestamp are returned. Default: '1970-01-01T00:00:00Z'.
+        page_size (int): Default: 10.
+        api_key (UUID):
+        polling (AdaptivePolling):
+
+    Raises:
+        errors.UnexpectedStatus: If a page fails with a status other than 429 or 5xx.
+        errors.OfflineDataUnavailable: If Client.offline is True.
+
+    Yields:
+        Union[UpdatedWorkout, DeletedWorkout]
+    """
+    cursor = _EventCursor(since=since)
+    polling = polling or AdaptivePolling()
+
+    while True:
+        try:
+            new = cursor.accept(_poll_pages(client, api_key, cursor.since, page_size))
+        except (httpx.TransportError, errors.UnexpectedStatus) as e:
+            if not _is_transient(e):
+                raise
+            new = []
+
+        yield from new
+        time.sleep(polling.next_interval(bool(new)))
+
+
+async def afollow_workout_events(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    since: str = "1970-01-01T00:00:00Z",
+    page_size: int = 10,
+    polling: Optional[AdaptivePolling] = None,
+) -> AsyncIterator[WorkoutEvent]:
+    """Like ``follow_workout_events`` but async, through the client's httpx.AsyncClient"""
+    cursor = _EventCursor(since=since)
+    polling = polling or AdaptivePolling()
+
+    while True:
+        try:
+            new = cursor.accept(await _apoll_pages(client, api_key, cursor.since, page_size))
+        except (httpx.TransportError, errors.UnexpectedStatus) as e:
+            if not _is_transient(e):
+                raise
+            new = []
+
+        for event in new:
+            yield event
+        await asyncio.sleep(polling.next_interval(bool(new)))
+
+
+__all__ = ["AdaptivePolling", "WorkoutEvent", "afollow_workout_events", "follow_workout_events"]
@@ -0,0 +1,63 @@
+"""Contains a bounded intern table for the low-cardinality strings of parsed responses.
+
+A workout history repeats the same exercise titles, exercise template ids and set types thousands of times, each one
+a separate ``str`` after decoding. Clients created with ``interner=InternTable()`` make the compiled decoders (see
+``hevy_api_client.decoders``) replace the fields listed in ``INTERNED_FIELDS`` with the first equal string they saw,
+which cuts the memory of in-process mirrors and lets grouping compare strings by identity first.
+
+Timestamps are not interned: they are (nearly) unique per workout, so interning them would only fill the table.
+"""
+
+from typing import Any
+
+from attrs import define, field
+
+from .models.exercise_template import ExerciseTemplate
+from .models.routine_exercises_item import RoutineExercisesItem
+from .models.routine_exercises_item_sets_item import RoutineExercisesItemSetsItem
+from .models.workout_exercises_item import WorkoutExercisesItem
+from .models.workout_exercises_item_sets_item import WorkoutExercisesItemSetsItem
+
+# the string (or list of strings) fields interned by the decoders of each model
+INTERNED_FIELDS: dict[type, frozenset[str]] = {
+    WorkoutExercisesItem: frozenset({"title", "exercise_template_id"}),
+    WorkoutExercisesItemSetsItem: frozenset({"type_"}),
+    RoutineExercisesItem: frozenset({"title", "exercise_template_id"}),
+    RoutineExercisesItemSetsItem: frozenset({"type_"}),
+    ExerciseTemplate: frozenset({"type_", "primary_muscle_group", "secondary_muscle_groups"}),
+}
+
+
+@define
+class InternTable:
+    """Maps each string to its first seen equal instance.
+
+    Once ``max_size`` distinct strings are held the table stops growing: known strings are still deduplicated, new
+    ones are returned as is.
+
+    Attributes:
+        max_size: Maximum number of distinct strings kept.
+        decoders: The compiled decoders bound to this table, filled by decoders.get_decoder.
+    """
+
+    max_size: int = 4096
+    decoders: dict[Any, Any] = field(factory=dict, init=False, repr=False, eq=False)
+    _strings: dict[str, str] = field(factory=dict, init=False, repr=False)
+
+    def __call__(self, value: Any) -> Any:
+        if type(value) is not str:
+            return value
+        if (found := self._strings.get(value)) is not None:
+            return found
+        if len(self._strings) < self.max_size:
+            self._strings[value] = value
+        return value
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def clear(self) -> None:
+        self._strings.clear()
+
+
+__all__ = ["INTERNED_FIELDS", "InternTable"]
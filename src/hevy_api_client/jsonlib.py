@@ -0,0 +1,76 @@
+"""Contains the pluggable JSON backends used to decode responses"""
+
+import json
+import os
+from functools import cache
+from typing import Any, Callable, Optional, Union
+
+from attrs import define
+
+BACKEND_ENV_VAR = "HEVY_JSON_BACKEND"
+
+
+@define(frozen=True)
+class JsonBackend:
+    """A JSON implementation
+
+    Attributes:
+        name: ``"orjson"``, ``"msgspec"`` or ``"json"`` (the standard library).
+        loads: Decodes ``bytes`` or ``str`` into Python objects.
+        dumps: Encodes Python objects into ``bytes``.
+    """
+
+    name: str
+    loads: Callable[[Union[bytes, str]], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _orjson() -> JsonBackend:
+    import orjson
+
+    return JsonBackend(name="orjson", loads=orjson.loads, dumps=orjson.dumps)
+
+
+def _msgspec() -> JsonBackend:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+    return JsonBackend(name="msgspec", loads=decoder.decode, dumps=encoder.encode)
+
+
+def _stdlib() -> JsonBackend:
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    return JsonBackend(name="json", loads=json.loads, dumps=dumps)
+
+
+_BACKENDS: dict[str, Callable[[], JsonBackend]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "json": _stdlib,
+}
+
+
+@cache
+def get_json_backend(name: Optional[str] = None) -> JsonBackend:
+    """Return the named backend, or the fastest one installed (orjson, then msgspec, then the standard library).
+
+    The automatic choice can be overridden with the ``HEVY_JSON_BACKEND`` environment variable.
+    """
+    name = name or os.getenv(BACKEND_ENV_VAR)
+    if name is not None:
+        if name not in _BACKENDS:
+            raise ValueError(f"Unknown JSON backend {name!r}, expected one of {sorted(_BACKENDS)}")
+        return _BACKENDS[name]()
+
+    for factory in (_orjson, _msgspec):
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return _stdlib()
+
+
+__all__ = ["BACKEND_ENV_VAR", "JsonBackend", "get_json_backend"]
@@ -0,0 +1,104 @@
+"""Contains Workout and Routine variants that only build their exercises on first access.
+
+Listings usually need the top-level fields (``id``, ``title``, ``start_time``...) only, yet ``from_dict`` builds
+every exercise and every set. ``LazyWorkout`` and ``LazyRoutine`` keep ``exercises`` as the raw JSON until the
+attribute is read, then parse and memoise it. ``to_dict`` hands back the raw JSON without parsing it.
+
+Clients created with ``lazy_models=True`` build them instead of ``Workout`` and ``Routine``, through the compiled
+decoders (see ``hevy_api_client.decoders``): the exercises are then parsed by the decoder of their item class, with
+the client's ``compact_models`` and ``interner``. ``from_dict`` parses them with the item class's ``from_dict``.
+"""
+
+from collections.abc import Mapping
+from typing import Any, ClassVar, TypeVar
+
+import attrs
+
+from .models.routine import Routine
+from .models.routine_exercises_item import RoutineExercisesItem
+from .models.workout import Workout
+from .models.workout_exercises_item import WorkoutExercisesItem
+from .types import UNSET
+
+T = TypeVar("T", bound="_LazyExercises")
+
+_LOADED: Any = object()
+
+
+class _LazyExercises:
+    _base: ClassVar[type]
+    _item_cls: ClassVar[Any]
+    _raw_exercises: Any
+    # builds one exercise from its JSON
+    _parse_exercise: Any
+
+    __slots__ = ()
+
+    @property
+    def exercises(self) -> Any:
+        if self._raw_exercises is not _LOADED:
+            # from_dict turns a missing list into []
+            parsed = [self._parse_exercise(item) for item in self._raw_exercises or []]
+            self._base.exercises.__set__(self, parsed)  # type: ignore[attr-defined]
+            self._raw_exercises = _LOADED
+        return self._base.exercises.__get__(self)  # type: ignore[attr-defined]
+
+    @exercises.setter
+    def exercises(self, value: Any) -> None:
+        self._base.exercises.__set__(self, value)  # type: ignore[attr-defined]
+        self._raw_exercises = _LOADED
+
+    @property
+    def exercises_loaded(self) -> bool:
+        """Whether ``exercises`` has been parsed (or assigned) already"""
+        return self._raw_exercises is _LOADED
+
+    def to_dict(self) -> dict[str, Any]:
+        if self.exercises_loaded:
+            return super().to_dict()  # type: ignore[misc]
+
+        # serialise a copy of the top-level fields only, then add the untouched raw exercises
+        fields = [a.name for a in attrs.fields(self._base) if a.init]
+        top_level = self._base(**{name: UNSET if name == "exercises" else getattr(self, name) for name in fields})
+        top_level.additional_properties = self.additional_properties  # type: ignore[attr-defined]
+        field_dict = top_level.to_dict()
+        field_dict["exercises"] = list(self._raw_exercises or [])
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = dict(src_dict)
+        raw_exercises = d.pop("exercises", UNSET)
+
+        obj = super().from_dict(d)  # type: ignore[misc]
+        obj._raw_exercises = raw_exercises
+        obj._parse_exercise = cls._item_cls.from_dict
+        return obj
+
+
+class LazyWorkout(_LazyExercises, Workout):
+    """A Workout whose ``exercises`` are parsed on first access"""
+
+    _base = Workout
+    _item_cls = WorkoutExercisesItem
+
+    __slots__ = ("_raw_exercises", "_parse_exercise")
+
+
+class LazyRoutine(_LazyExercises, Routine):
+    """A Routine whose ``exercises`` are parsed on first access"""
+
+    _base = Routine
+    _item_cls = RoutineExercisesItem
+
+    __slots__ = ("_raw_exercises", "_parse_exercise")
+
+
+# the model each lazy variant stands in for
+LAZY_MODELS: dict[type, type] = {
+    Workout: LazyWorkout,
+    Routine: LazyRoutine,
+}
+
+
+__all__ = ["LAZY_MODELS", "LazyRoutine", "LazyWorkout"]
@@ -1,40 +1,87 @@
-"""Contains all the data models used in inputs/outputs"""
+"""Contains all the data models used in inputs/outputs
 
-from .deleted_workout import DeletedWorkout
-from .exercise_template import ExerciseTemplate
-from .get_v1_exercise_templates_response_200 import GetV1ExerciseTemplatesResponse200
-from .get_v1_routine_folders_response_200 import GetV1RoutineFoldersResponse200
-from .get_v1_routines_response_200 import GetV1RoutinesResponse200
-from .get_v1_workouts_count_response_200 import GetV1WorkoutsCountResponse200
-from .get_v1_workouts_response_200 import GetV1WorkoutsResponse200
-from .paginated_workout_events import PaginatedWorkoutEvents
-from .post_routine_folder_request_body import PostRoutineFolderRequestBody
-from .post_routine_folder_request_body_routine_folder import PostRoutineFolderRequestBodyRoutineFolder
-from .post_routines_request_body import PostRoutinesRequestBody
-from .post_routines_request_body_routine import PostRoutinesRequestBodyRoutine
-from .post_routines_request_exercise import PostRoutinesRequestExercise
-from .post_routines_request_set import PostRoutinesRequestSet
-from .post_routines_request_set_type import PostRoutinesRequestSetType
-from .post_v1_routine_folders_response_400 import PostV1RoutineFoldersResponse400
-from .post_v1_routines_response_400 import PostV1RoutinesResponse400
-from .post_v1_routines_response_403 import PostV1RoutinesResponse403
-from .post_v1_workouts_response_400 import PostV1WorkoutsResponse400
-from .put_routines_request_body import PutRoutinesRequestBody
-from .put_routines_request_body_routine import PutRoutinesRequestBodyRoutine
-from .put_routines_request_exercise import PutRoutinesRequestExercise
-from .put_routines_request_set import PutRoutinesRequestSet
-from .put_routines_request_set_type import PutRoutinesRequestSetType
-from .put_v1_routines_routine_id_response_400 import PutV1RoutinesRoutineIdResponse400
-from .put_v1_routines_routine_id_response_404 import PutV1RoutinesRoutineIdResponse404
-from .put_v1_workouts_workout_id_response_400 import PutV1WorkoutsWorkoutIdResponse400
-from .routine import Routine
-from .routine_exercises_item import RoutineExercisesItem
-from .routine_exercises_item_sets_item import RoutineExercisesItemSetsItem
-from .routine_folder import RoutineFolder
-from .updated_workout import UpdatedWorkout
-from .workout import Workout
-from .workout_exercises_item import WorkoutExercisesItem
-from .workout_exercises_item_sets_item import WorkoutExercisesItemSetsItem
+Models are imported on first access (``models.Workout`` or ``from hevy_api_client.models import Workout``), so
+importing the package does not load all of them.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .deleted_workout import DeletedWorkout
+    from .exercise_template import ExerciseTemplate
+    from .get_v1_exercise_templates_response_200 import GetV1ExerciseTemplatesResponse200
+    from .get_v1_routine_folders_response_200 import GetV1RoutineFoldersResponse200
+    from .get_v1_routines_response_200 import GetV1RoutinesResponse200
+    from .get_v1_workouts_count_response_200 import GetV1WorkoutsCountResponse200
+    from .get_v1_workouts_response_200 import GetV1WorkoutsResponse200
+    from .paginated_workout_events import PaginatedWorkoutEvents
+    from .post_routine_folder_request_body import PostRoutineFolderRequestBody
+    from .post_routine_folder_request_body_routine_folder import PostRoutineFolderRequestBodyRoutineFolder
+    from .post_routines_request_body import PostRoutinesRequestBody
+    from .post_routines_request_body_routine import PostRoutinesRequestBodyRoutine
+    from .post_routines_request_exercise import PostRoutinesRequestExercise
+    from .post_routines_request_set import PostRoutinesRequestSet
+    from .post_routines_request_set_type import PostRoutinesRequestSetType
+    from .post_v1_routine_folders_response_400 import PostV1RoutineFoldersResponse400
+    from .post_v1_routines_response_400 import PostV1RoutinesResponse400
+    from .post_v1_routines_response_403 import PostV1RoutinesResponse403
+    from .post_v1_workouts_response_400 import PostV1WorkoutsResponse400
+    from .put_routines_request_body import PutRoutinesRequestBody
+    from .put_routines_request_body_routine import PutRoutinesRequestBodyRoutine
+    from .put_routines_request_exercise import PutRoutinesRequestExercise
+    from .put_routines_request_set import PutRoutinesRequestSet
+    from .put_routines_request_set_type import PutRoutinesRequestSetType
+    from .put_v1_routines_routine_id_response_400 import PutV1RoutinesRoutineIdResponse400
+    from .put_v1_routines_routine_id_response_404 import PutV1RoutinesRoutineIdResponse404
+    from .put_v1_workouts_workout_id_response_400 import PutV1WorkoutsWorkoutIdResponse400
+    from .routine import Routine
+    from .routine_exercises_item import RoutineExercisesItem
+    from .routine_exercises_item_sets_item import RoutineExercisesItemSetsItem
+    from .routine_folder import RoutineFolder
+    from .updated_workout import UpdatedWorkout
+    from .workout import Workout
+    from .workout_exercises_item import WorkoutExercisesItem
+    from .workout_exercises_item_sets_item import WorkoutExercisesItemSetsItem
+
+# exported name -> module defining it
+_MODULES = {
+    "DeletedWorkout": "deleted_workout",
+    "ExerciseTemplate": "exercise_template",
+    "GetV1ExerciseTemplatesResponse200": "get_v1_exercise_templates_response_200",
+    "GetV1RoutineFoldersResponse200": "get_v1_routine_folders_response_200",
+    "GetV1RoutinesResponse200": "get_v1_routines_response_200",
+    "GetV1WorkoutsCountResponse200": "get_v1_workouts_count_response_200",
+    "GetV1WorkoutsResponse200": "get_v1_workouts_response_200",
+    "PaginatedWorkoutEvents": "paginated_workout_events",
+    "PostRoutineFolderRequestBody": "post_routine_folder_request_body",
+    "PostRoutineFolderRequestBodyRoutineFolder": "post_routine_folder_request_body_routine_folder",
+    "PostRoutinesRequestBody": "post_routines_request_body",
+    "PostRoutinesRequestBodyRoutine": "post_routines_request_body_routine",
+    "PostRoutinesRequestExercise": "post_routines_request_exercise",
+    "PostRoutinesRequestSet": "post_routines_request_set",
+    "PostRoutinesRequestSetType": "post_routines_request_set_type",
+    "PostV1RoutineFoldersResponse400": "post_v1_routine_folders_response_400",
+    "PostV1RoutinesResponse400": "post_v1_routines_response_400",
+    "PostV1RoutinesResponse403": "post_v1_routines_response_403",
+    "PostV1WorkoutsResponse400": "post_v1_workouts_response_400",
+    "PutRoutinesRequestBody": "put_routines_request_body",
+    "PutRoutinesRequestBodyRoutine": "put_routines_request_body_routine",
+    "PutRoutinesRequestExercise": "put_routines_request_exercise",
+    "PutRoutinesRequestSet": "put_routines_request_set",
+    "PutRoutinesRequestSetType": "put_routines_request_set_type",
+    "PutV1RoutinesRoutineIdResponse400": "put_v1_routines_routine_id_response_400",
+    "PutV1RoutinesRoutineIdResponse404": "put_v1_routines_routine_id_response_404",
+    "PutV1WorkoutsWorkoutIdResponse400": "put_v1_workouts_workout_id_response_400",
+    "Routine": "routine",
+    "RoutineExercisesItem": "routine_exercises_item",
+    "RoutineExercisesItemSetsItem": "routine_exercises_item_sets_item",
+    "RoutineFolder": "routine_folder",
+    "UpdatedWorkout": "updated_workout",
+    "Workout": "workout",
+    "WorkoutExercisesItem": "workout_exercises_item",
+    "WorkoutExercisesItemSetsItem": "workout_exercises_item_sets_item",
+}
 
 __all__ = (
     "DeletedWorkout",
@@ -73,3 +120,15 @@ __all__ = (
     "WorkoutExercisesItem",
     "WorkoutExercisesItemSetsItem",
 )
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_MODULES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
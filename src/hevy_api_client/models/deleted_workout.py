@@ -1,10 +1,12 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union
+from datetime import datetime
+from typing import Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..timestamps import to_datetime
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="DeletedWorkout")
 
@@ -62,6 +64,11 @@ class DeletedWorkout:
         deleted_workout.additional_properties = d
         return deleted_workout
 
+    @property
+    def deleted_datetime(self) -> Optional[datetime]:
+        """When the workout was deleted, parsed from ``deleted_at`` (None if unset)"""
+        return to_datetime(self.deleted_at)
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -70,9 +77,13 @@ class DeletedWorkout:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.exercise_template import ExerciseTemplate
@@ -84,9 +84,13 @@ class GetV1ExerciseTemplatesResponse200:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
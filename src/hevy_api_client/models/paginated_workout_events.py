@@ -1,16 +1,33 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import Any, Callable, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-if TYPE_CHECKING:
-    from ..models.deleted_workout import DeletedWorkout
-    from ..models.updated_workout import UpdatedWorkout
-
+from ..models.deleted_workout import DeletedWorkout
+from ..models.updated_workout import UpdatedWorkout
+from ..types import EMPTY_PROPERTIES
 
 T = TypeVar("T", bound="PaginatedWorkoutEvents")
 
+# events are discriminated by their "type" property
+_EVENT_PARSERS: dict[str, Callable[[Mapping[str, Any]], Union[DeletedWorkout, UpdatedWorkout]]] = {
+    "updated": UpdatedWorkout.from_dict,
+    "deleted": DeletedWorkout.from_dict,
+}
+
+
+def _parse_events_item(data: object) -> Union[DeletedWorkout, UpdatedWorkout]:
+    if not isinstance(data, Mapping):
+        raise TypeError(f"Expected a workout event object, got {type(data).__name__}")
+    try:
+        parser = _EVENT_PARSERS[data["type"]]
+    except KeyError:
+        raise ValueError(
+            f"Unknown workout event type {data.get('type')!r}, expected one of {sorted(_EVENT_PARSERS)}"
+        ) from None
+    return parser(data)
+
 
 @_attrs_define
 class PaginatedWorkoutEvents:
@@ -23,12 +40,10 @@ class PaginatedWorkoutEvents:
 
     page: int
     page_count: int
-    events: list[Union["DeletedWorkout", "UpdatedWorkout"]]
+    events: list[Union[DeletedWorkout, UpdatedWorkout]]
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.updated_workout import UpdatedWorkout
-
         page = self.page
 
         page_count = self.page_count
@@ -57,36 +72,12 @@ class PaginatedWorkoutEvents:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.deleted_workout import DeletedWorkout
-        from ..models.updated_workout import UpdatedWorkout
-
         d = dict(src_dict)
         page = d.pop("page")
 
         page_count = d.pop("page_count")
 
-        events = []
-        _events = d.pop("events")
-        for events_item_data in _events:
-
-            def _parse_events_item(data: object) -> Union["DeletedWorkout", "UpdatedWorkout"]:
-                try:
-                    if not isinstance(data, dict):
-                        raise TypeError()
-                    events_item_type_0 = UpdatedWorkout.from_dict(data)
-
-                    return events_item_type_0
-                except:  # noqa: E722
-                    pass
-                if not isinstance(data, dict):
-                    raise TypeError()
-                events_item_type_1 = DeletedWorkout.from_dict(data)
-
-                return events_item_type_1
-
-            events_item = _parse_events_item(events_item_data)
-
-            events.append(events_item)
+        events = [_parse_events_item(events_item_data) for events_item_data in d.pop("events")]
 
         paginated_workout_events = cls(
             page=page,
@@ -105,9 +96,13 @@ class PaginatedWorkoutEvents:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
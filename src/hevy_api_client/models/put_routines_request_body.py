@@ -1,12 +1,13 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
+    from ..jsonlib import JsonBackend
     from ..models.put_routines_request_body_routine import PutRoutinesRequestBodyRoutine
 
 
@@ -36,6 +37,13 @@ class PutRoutinesRequestBody:
 
         return field_dict
 
+    def to_json_bytes(self, json_backend: Optional["JsonBackend"] = None) -> bytes:
+        """The JSON body, serialised by the compiled encoder of this class (see hevy_api_client.encoders) with
+        ``json_backend`` (by default the fastest one installed)"""
+        from ..encoders import to_json_bytes
+
+        return to_json_bytes(self, json_backend)
+
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.put_routines_request_body_routine import PutRoutinesRequestBodyRoutine
@@ -63,9 +71,13 @@ class PutRoutinesRequestBody:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
@@ -1,10 +1,12 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..timestamps import to_datetime
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.routine_exercises_item import RoutineExercisesItem
@@ -116,6 +118,16 @@ class Routine:
         routine.additional_properties = d
         return routine
 
+    @property
+    def updated_datetime(self) -> Optional[datetime]:
+        """When the routine was last updated, parsed from ``updated_at`` (None if unset)"""
+        return to_datetime(self.updated_at)
+
+    @property
+    def created_datetime(self) -> Optional[datetime]:
+        """When the routine was created, parsed from ``created_at`` (None if unset)"""
+        return to_datetime(self.created_at)
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -124,9 +136,13 @@ class Routine:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
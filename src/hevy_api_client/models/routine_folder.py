@@ -1,10 +1,12 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union
+from datetime import datetime
+from typing import Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..timestamps import to_datetime
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 T = TypeVar("T", bound="RoutineFolder")
 
@@ -81,6 +83,16 @@ class RoutineFolder:
         routine_folder.additional_properties = d
         return routine_folder
 
+    @property
+    def updated_datetime(self) -> Optional[datetime]:
+        """When the folder was last updated, parsed from ``updated_at`` (None if unset)"""
+        return to_datetime(self.updated_at)
+
+    @property
+    def created_datetime(self) -> Optional[datetime]:
+        """When the folder was created, parsed from ``created_at`` (None if unset)"""
+        return to_datetime(self.created_at)
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -89,9 +101,13 @@ class RoutineFolder:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
@@ -1,10 +1,12 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..timestamps import to_datetime
+from ..types import EMPTY_PROPERTIES, UNSET, Unset
 
 if TYPE_CHECKING:
     from ..models.workout_exercises_item import WorkoutExercisesItem
@@ -20,9 +22,9 @@ class Workout:
         id (Union[Unset, str]): The workout ID. Example: b459cba5-cd6d-463c-abd6-54f8eafcadcb.
         title (Union[Unset, str]): The workout title. Example: Morning Workout 💪.
         description (Union[Unset, str]): The workout description. Example: Pushed myself to the limit today!.
-        start_time (Union[Unset, float]): ISO 8601 timestamp of when the workout was recorded to have started. Example:
+        start_time (Union[Unset, str]): ISO 8601 timestamp of when the workout was recorded to have started. Example:
             2021-09-14T12:00:00Z.
-        end_time (Union[Unset, float]): ISO 8601 timestamp of when the workout was recorded to have ended. Example:
+        end_time (Union[Unset, str]): ISO 8601 timestamp of when the workout was recorded to have ended. Example:
             2021-09-14T12:00:00Z.
         updated_at (Union[Unset, str]): ISO 8601 timestamp of when the workout was last updated. Example:
             2021-09-14T12:00:00Z.
@@ -34,8 +36,8 @@ class Workout:
     id: Union[Unset, str] = UNSET
     title: Union[Unset, str] = UNSET
     description: Union[Unset, str] = UNSET
-    start_time: Union[Unset, float] = UNSET
-    end_time: Union[Unset, float] = UNSET
+    start_time: Union[Unset, str] = UNSET
+    end_time: Union[Unset, str] = UNSET
     updated_at: Union[Unset, str] = UNSET
     created_at: Union[Unset, str] = UNSET
     exercises: Union[Unset, list["WorkoutExercisesItem"]] = UNSET
@@ -125,6 +127,26 @@ class Workout:
         workout.additional_properties = d
         return workout
 
+    @property
+    def start_datetime(self) -> Optional[datetime]:
+        """When the workout started, parsed from ``start_time`` (None if unset)"""
+        return to_datetime(self.start_time)
+
+    @property
+    def end_datetime(self) -> Optional[datetime]:
+        """When the workout ended, parsed from ``end_time`` (None if unset)"""
+        return to_datetime(self.end_time)
+
+    @property
+    def updated_datetime(self) -> Optional[datetime]:
+        """When the workout was last updated, parsed from ``updated_at`` (None if unset)"""
+        return to_datetime(self.updated_at)
+
+    @property
+    def created_datetime(self) -> Optional[datetime]:
+        """When the workout was created, parsed from ``created_at`` (None if unset)"""
+        return to_datetime(self.created_at)
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -133,9 +155,13 @@ class Workout:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
@@ -0,0 +1,204 @@
+"""Contains a local SQLite copy of the account entities"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, Optional
+
+from attrs import define, field
+
+TABLES = ("workouts", "routines", "routine_folders", "exercise_templates")
+
+# rows read from SQLite at a time by LocalStore.iter
+_ITER_BATCH = 100
+
+# mirrors the order the API lists each entity in
+_ORDER_BY = {
+    "workouts": "json_extract(data, '$.start_time') DESC",
+    "routines": "rowid",
+    "routine_folders": "json_extract(data, '$.index')",
+    "exercise_templates": "rowid",
+}
+
+
+def content_hash(data: Any) -> str:
+    """Stable hash of a JSON-compatible value, independent of key order"""
+    return hashlib.sha1(json.dumps(data, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+@define
+class StoredEntry:
+    """Bookkeeping kept for every stored entity, used for change detection"""
+
+    updated_at: Optional[str]
+    hash: str
+
+
+@define
+class SyncState:
+    """When a table of the store was last brought up to date, see sync
+
+    Attributes:
+        synced_at: Unix time of the end of the last sync.
+        cursor: Where the next sync resumes from, e.g. the ``since`` of the next workout events request.
+    """
+
+    synced_at: float
+    cursor: Optional[str] = None
+
+
+@define
+class LocalStore:
+    """Keeps the raw JSON of workouts, routines, routine folders and exercise templates, keyed by id.
+
+    Entities are stored as returned by the API (not as models) so that reading them back goes through the same
+    ``from_dict`` path as a live response. Its methods can be called from several threads at once.
+
+    Attributes:
+        path: SQLite database file used for storage. The default, ``":memory:"``, keeps the store in process.
+    """
+
+    path: str = ":memory:"
+    _conn: Optional[sqlite3.Connection] = field(default=None, init=False)
+    _lock: threading.RLock = field(factory=threading.RLock, init=False)
+
+    def _get_conn(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._conn is None:
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                for table in TABLES:
+                    conn.execute(
+                        f"CREATE TABLE IF NOT EXISTS {table} ("
+                        "id TEXT PRIMARY KEY, updated_at TEXT, hash TEXT NOT NULL, "
+                        "data TEXT NOT NULL, synced_at REAL NOT NULL)"
+                    )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS sync_state "
+                    "(name TEXT PRIMARY KEY, synced_at REAL NOT NULL, cursor TEXT)"
+                )
+                self._conn = conn
+            return self._conn
+
+    @staticmethod
+    def _check_table(table: str) -> None:
+        if table not in TABLES:
+            raise ValueError(f"Unknown table {table!r}, expected one of {TABLES}")
+
+    def entries(self, table: str) -> dict[str, StoredEntry]:
+        """The change detection bookkeeping (``updated_at`` and content hash) of every entity in ``table``"""
+        self._check_table(table)
+        with self._lock:
+            rows = self._get_conn().execute(f"SELECT id, updated_at, hash FROM {table}").fetchall()
+        return {row[0]: StoredEntry(updated_at=row[1], hash=row[2]) for row in rows}
+
+    def put(self, table: str, item: Mapping[str, Any], *, hash: Optional[str] = None) -> bool:
+        """Insert or replace an entity. Items without an ``id`` are ignored; returns whether the item was stored."""
+        return self.put_many(table, [item], hashes=None if hash is None else [hash]) == 1
+
+    def put_many(
+        self,
+        table: str,
+        items: Iterable[Mapping[str, Any]],
+        *,
+        hashes: Optional[Iterable[str]] = None,
+    ) -> int:
+        self._check_table(table)
+        now = time.time()
+        items = list(items)
+        hash_list = list(hashes) if hashes is not None else [content_hash(item) for item in items]
+        rows = [
+            (str(item["id"]), item.get("updated_at"), item_hash, json.dumps(item), now)
+            for item, item_hash in zip(items, hash_list)
+            if item.get("id") is not None
+        ]
+        with self._lock, self._get_conn() as conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table} (id, updated_at, hash, data, synced_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def delete(self, table: str, ids: Iterable[str]) -> int:
+        self._check_table(table)
+        with self._lock, self._get_conn() as conn:
+            return conn.executemany(f"DELETE FROM {table} WHERE id = ?", [(str(i),) for i in ids]).rowcount
+
+    def get(self, table: str, id: str) -> Optional[dict[str, Any]]:
+        self._check_table(table)
+        with self._lock:
+            row = self._get_conn().execute(f"SELECT data FROM {table} WHERE id = ?", (str(id),)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def iter(self, table: str, *, ordered: bool = False) -> Iterator[dict[str, Any]]:
+        """Every entity of ``table``, in API order (see page) when ``ordered`` is set"""
+        self._check_table(table)
+        order_by = f" ORDER BY {_ORDER_BY[table]}" if ordered else ""
+        with self._lock:
+            cursor = self._get_conn().execute(f"SELECT data FROM {table}{order_by}")
+        # rows are fetched in batches, so the lock is never held while the caller consumes them
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(_ITER_BATCH)
+            if not rows:
+                return
+            for row in rows:
+                yield json.loads(row[0])
+
+    def page(self, table: str, page: int, page_size: int) -> tuple[list[dict[str, Any]], int, Optional[float]]:
+        """One page of ``table`` in API order, along with the page count and when its data was last synced.
+
+        That is the end of the last sync of ``table`` (see sync_state): entities left unchanged by a sync are not
+        rewritten, their own ``synced_at`` only tells when they last changed. Tables never synced (filled by writes
+        only) fall back to the oldest ``synced_at`` of the page.
+        """
+        self._check_table(table)
+        page_count = -(-self.count(table) // page_size)
+        with self._lock:
+            rows = (
+                self._get_conn()
+                .execute(
+                    f"SELECT data, synced_at FROM {table} ORDER BY {_ORDER_BY[table]} LIMIT ? OFFSET ?",
+                    (page_size, (page - 1) * page_size),
+                )
+                .fetchall()
+            )
+        state = self.sync_state(table)
+        synced_at = state.synced_at if state is not None else min((row[1] for row in rows), default=None)
+        return [json.loads(row[0]) for row in rows], page_count, synced_at
+
+    def count(self, table: str) -> int:
+        self._check_table(table)
+        with self._lock:
+            return self._get_conn().execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def sync_state(self, table: str) -> Optional[SyncState]:
+        """When ``table`` was last synced with the API (None if it never was)"""
+        self._check_table(table)
+        with self._lock:
+            row = (
+                self._get_conn()
+                .execute("SELECT synced_at, cursor FROM sync_state WHERE name = ?", (table,))
+                .fetchone()
+            )
+        return SyncState(synced_at=row[0], cursor=row[1]) if row is not None else None
+
+    def set_sync_state(self, table: str, cursor: Optional[str] = None) -> None:
+        """Record that ``table`` was just synced, and where the next sync resumes from"""
+        self._check_table(table)
+        with self._lock, self._get_conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (name, synced_at, cursor) VALUES (?, ?, ?)",
+                (table, time.time(), cursor),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+__all__ = ["TABLES", "LocalStore", "StoredEntry", "SyncState", "content_hash"]
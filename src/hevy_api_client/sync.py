@@ -0,0 +1,301 @@
+"""Contains helpers that keep a LocalStore up to date with the API"""
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from typing import Any, Union
+from uuid import UUID
+
+from attrs import define, evolve, field
+
+from . import errors
+from .api.exercise_templates import get_v1_exercise_templates
+from .api.routine_folders import get_v1_routine_folders
+from .api.routines import get_v1_routines
+from .api.workouts import get_v1_workouts, get_v1_workouts_events
+from .client import AuthenticatedClient, Client
+from .store import LocalStore, content_hash
+from .timestamps import sort_key
+
+# how far before the start of a full workout download the next sync requests events from
+_CLOCK_SKEW = timedelta(minutes=5)
+
+
+@define
+class SyncResult:
+    """Summary of a sync run
+
+    Attributes:
+        added: Entities that were not in the store before.
+        updated: Entities whose content (``updated_at`` included) changed.
+        deleted: Entities that are no longer returned by the API.
+        unchanged: Entities skipped because they matched the stored copy.
+        requests: Number of requests sent to the API.
+        changed: The ids of every added or updated entity, read them back from the store.
+    """
+
+    added: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    requests: int = 0
+    changed: list[str] = field(factory=list)
+
+
+def _live(client: Union[AuthenticatedClient, Client]) -> Union[AuthenticatedClient, Client]:
+    """A copy of ``client`` that always asks the API: a store synced from the cache, or from itself, would go stale.
+
+    The responses still refresh the cache. The copy sends its requests through the httpx.Client of ``client``.
+    """
+    cache = client.cache.with_ttl(0) if client.cache is not None else None
+    return evolve(client, cache=cache, offline_fallback=False).set_httpx_client(client.get_httpx_client())
+
+
+def _pages(
+    client: Union[AuthenticatedClient, Client], endpoint: Any, result: SyncResult, **params: Any
+) -> Iterator[dict[str, Any]]:
+    """The JSON of every page of a ``get_v1_*`` endpoint module, each request counted in ``result``.
+
+    Raises:
+        errors.UnexpectedStatus: A page was answered with a status other than 200, or 404 past the last page.
+    """
+    client = _live(client)
+    page = 1
+    page_count = 1
+    while page <= page_count:
+        response = endpoint.sync_detailed(client=client, page=page, parse=False, **params)
+        result.requests += 1
+        # pages past the last one are answered with a 404
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            return
+        if response.status_code != HTTPStatus.OK:
+            raise errors.UnexpectedStatus(response.status_code, response.content)
+
+        page_count = response.parsed.get("page_count") or 0
+        yield response.parsed
+        page += 1
+
+
+def _sync_listing(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    store: LocalStore,
+    api_key: UUID,
+    table: str,
+    endpoint: Any,
+    page_size: int,
+) -> SyncResult:
+    """Download every page of a ``get_v1_*`` endpoint module listing ``table`` and apply the differences to ``store``"""
+    result = SyncResult()
+    known = store.entries(table)
+    seen: set[str] = set()
+    changed_items: list[dict[str, Any]] = []
+    changed_hashes: list[str] = []
+
+    for body in _pages(client, endpoint, result, page_size=page_size, api_key=api_key):
+        for item in body.get(table) or []:
+            item_id = str(item["id"])
+            seen.add(item_id)
+
+            item_hash = content_hash(item)
+            stored = known.get(item_id)
+            # the hash covers ``updated_at`` too
+            if stored is not None and stored.hash == item_hash:
+                result.unchanged += 1
+                continue
+
+            if stored is None:
+                result.added += 1
+            else:
+                result.updated += 1
+            result.changed.append(item_id)
+            changed_items.append(item)
+            changed_hashes.append(item_hash)
+
+    store.put_many(table, changed_items, hashes=changed_hashes)
+    result.deleted = store.delete(table, known.keys() - seen)
+    return result
+
+
+def sync_routines(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    store: LocalStore,
+    api_key: UUID,
+    page_size: int = 10,
+) -> SyncResult:
+    """Bring the routines of ``store`` up to date.
+
+    Routines have no events feed, so every page is still downloaded, but only the routines whose ``updated_at`` or
+    content hash differ from the stored copy are written back. Routines missing from the API
+    are deleted from the store.
+    """
+    result = _sync_listing(
+        client=client,
+        store=store,
+        api_key=api_key,
+        table="routines",
+        endpoint=get_v1_routines,
+        page_size=page_size,
+    )
+    store.set_sync_state("routines")
+    return result
+
+
+def sync_routine_folders(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    store: LocalStore,
+    api_key: UUID,
+    page_size: int = 10,
+) -> SyncResult:
+    """Bring the routine folders of ``store`` up to date, like ``sync_routines``"""
+    result = _sync_listing(
+        client=client,
+        store=store,
+        api_key=api_key,
+        table="routine_folders",
+        endpoint=get_v1_routine_folders,
+        page_size=page_size,
+    )
+    store.set_sync_state("routine_folders")
+    return result
+
+
+def sync_exercise_templates(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    store: LocalStore,
+    api_key: UUID,
+    page_size: int = 100,
+) -> SyncResult:
+    """Bring the exercise templates of ``store`` up to date, like ``sync_routines``.
+
+    Templates have no ``updated_at``, only their content hash is compared.
+    """
+    result = _sync_listing(
+        client=client,
+        store=store,
+        api_key=api_key,
+        table="exercise_templates",
+        endpoint=get_v1_exercise_templates,
+        page_size=page_size,
+    )
+    store.set_sync_state("exercise_templates")
+    return result
+
+
+def _format_timestamp(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _workout_events(
+    client: Union[AuthenticatedClient, Client],
+    api_key: UUID,
+    since: str,
+    page_size: int,
+    result: SyncResult,
+) -> list[dict[str, Any]]:
+    pages = _pages(client, get_v1_workouts_events, result, page_size=page_size, since=since, api_key=api_key)
+    return [event for body in pages for event in body.get("events") or []]
+
+
+def sync_workouts(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    store: LocalStore,
+    api_key: UUID,
+    page_size: int = 10,
+) -> SyncResult:
+    """Bring the workouts of ``store`` up to date.
+
+    The first sync downloads every workout, like ``sync_routines``. Later ones only request the workout events
+    (updates and deletions) since the previous sync and apply the latest event of each workout, so an unchanged
+    account costs a single request. ``unchanged`` counts updated events whose workout matched the stored copy.
+    """
+    state = store.sync_state("workouts")
+    if state is None or state.cursor is None:
+        # events are requested from a little before the start of the download next time, so that the difference
+        # between the local and the API clocks cannot hide a change (replayed events leave the workouts unchanged)
+        cursor = _format_timestamp(datetime.now(timezone.utc) - _CLOCK_SKEW)
+        result = _sync_listing(
+            client=client,
+            store=store,
+            api_key=api_key,
+            table="workouts",
+            endpoint=get_v1_workouts,
+            page_size=page_size,
+        )
+        store.set_sync_state("workouts", cursor=cursor)
+        return result
+
+    result = SyncResult()
+    known = store.entries("workouts")
+    cursor = state.cursor
+    latest: dict[str, dict[str, Any]] = {}
+    # the API returns newest first, only the first event seen for a workout matters
+    for event in _workout_events(client, api_key, cursor, page_size, result):
+        workout = event.get("workout") or {}
+        event_id = str(workout.get("id", event.get("id")))
+        latest.setdefault(event_id, event)
+        event_time = workout.get("updated_at", event.get("deleted_at"))
+        cursor = max(cursor, event_time or cursor, key=sort_key)
+
+    changed_items: list[dict[str, Any]] = []
+    changed_hashes: list[str] = []
+    deleted: list[str] = []
+    for workout_id, event in latest.items():
+        stored = known.get(workout_id)
+        if event.get("type") == "deleted":
+            if stored is not None:
+                deleted.append(workout_id)
+            continue
+
+        item = event["workout"]
+        item_hash = content_hash(item)
+        if stored is not None and stored.hash == item_hash:
+            result.unchanged += 1
+            continue
+
+        if stored is None:
+            result.added += 1
+        else:
+            result.updated += 1
+        result.changed.append(workout_id)
+        changed_items.append(item)
+        changed_hashes.append(item_hash)
+
+    store.put_many("workouts", changed_items, hashes=changed_hashes)
+    result.deleted = store.delete("workouts", deleted)
+    store.set_sync_state("workouts", cursor=cursor)
+    return result
+
+
+def sync_store(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    store: LocalStore,
+    api_key: UUID,
+) -> dict[str, SyncResult]:
+    """Bring every table of ``store`` up to date, returns the result of each by table name
+
+    Raises:
+        errors.UnexpectedStatus: The API answered a page with a status other than 200 (e.g. 401, 429).
+        httpx.HTTPError: The API could not be reached.
+    """
+    return {
+        "workouts": sync_workouts(client=client, store=store, api_key=api_key),
+        "routines": sync_routines(client=client, store=store, api_key=api_key),
+        "routine_folders": sync_routine_folders(client=client, store=store, api_key=api_key),
+        "exercise_templates": sync_exercise_templates(client=client, store=store, api_key=api_key),
+    }
+
+
+__all__ = [
+    "SyncResult",
+    "sync_exercise_templates",
+    "sync_routine_folders",
+    "sync_routines",
+    "sync_store",
+    "sync_workouts",
+]
@@ -0,0 +1,43 @@
+"""Contains a fast, memoised parser for the ISO 8601 timestamps of the API.
+
+Models keep timestamps as the strings the API returns; their ``*_datetime`` properties (e.g. ``Workout.start_datetime``)
+parse them through ``parse_timestamp``. A history holds few distinct timestamps compared with the number of times
+sorting, windowing and sync code compares them, so each string is only parsed once.
+"""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Optional
+
+from dateutil.parser import isoparse
+
+from .types import Unset
+
+# sorts before any timestamp, used where a missing one must still be comparable
+MIN_DATETIME = datetime.min.replace(tzinfo=timezone.utc)
+
+
+@lru_cache(maxsize=65536)
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp into an aware datetime (UTC when it has no offset)"""
+    try:
+        # fromisoformat is implemented in C, but only understands a trailing "Z" from Python 3.11
+        parsed = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError:
+        parsed = isoparse(value)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def to_datetime(value: Any) -> Optional[datetime]:
+    """``parse_timestamp`` for model fields: None when the value is UNSET, None or empty"""
+    if isinstance(value, Unset) or not value:
+        return None
+    return parse_timestamp(value)
+
+
+def sort_key(value: Any) -> datetime:
+    """Like ``to_datetime`` but missing timestamps sort first"""
+    return to_datetime(value) or MIN_DATETIME
+
+
+__all__ = ["MIN_DATETIME", "parse_timestamp", "sort_key", "to_datetime"]
@@ -2,7 +2,8 @@
 
 from collections.abc import MutableMapping
 from http import HTTPStatus
-from typing import BinaryIO, Generic, Literal, Optional, TypeVar
+from types import MappingProxyType
+from typing import Any, BinaryIO, Generic, Literal, Optional, TypeVar
 
 from attrs import define
 
@@ -14,6 +15,9 @@ class Unset:
 
 UNSET: Unset = Unset()
 
+# read-only additional_properties shared by every compact model without unknown keys, replaced on first write
+EMPTY_PROPERTIES: MappingProxyType[str, Any] = MappingProxyType({})
+
 FileJsonType = tuple[Optional[str], BinaryIO, Optional[str]]
 
 
@@ -43,4 +47,4 @@ class Response(Generic[T]):
     parsed: Optional[T]
 
 
-__all__ = ["UNSET", "File", "FileJsonType", "Response", "Unset"]
+__all__ = ["EMPTY_PROPERTIES", "UNSET", "File", "FileJsonType", "Response", "Unset"]
@@ -0,0 +1,28 @@
+from pathlib import Path
+from typing import Callable
+
+import httpx
+import pytest
+from fakes import TOKEN, Handler
+from typer.testing import CliRunner, Result
+
+from hevy_api_client.cli import app, utils
+
+Run = Callable[..., Result]
+Hevy = Callable[[Handler], Run]
+
+
+@pytest.fixture
+def hevy(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Hevy:
+    """Runs ``hevy`` commands against ``handler``, with databases of their own under ``tmp_path``"""
+    monkeypatch.setenv("HEVY_API_TOKEN", TOKEN)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    def with_api(handler: Handler) -> Run:
+        def run(*args: str) -> Result:
+            monkeypatch.setattr(utils, "_client_options", {"httpx_args": {"transport": httpx.MockTransport(handler)}})
+            return CliRunner().invoke(app, list(args), catch_exceptions=False)
+
+        return run
+
+    return with_api
@@ -0,0 +1,119 @@
+"""Payloads shaped like the Hevy API's and a client wired to an in-process fake of it"""
+
+from collections.abc import Sequence
+from typing import Any, Callable, Optional
+
+import httpx
+
+from hevy_api_client import AuthenticatedClient
+
+BASE_URL = "https://api.hevyapp.com"
+TOKEN = "00000000-0000-0000-0000-000000000000"
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def workout(i: int, *, updated_at: Optional[str] = None, title: Optional[str] = None) -> dict[str, Any]:
+    start = f"2024-11-{i % 28 + 1:02d}T12:00:00Z"
+    return {
+        "id": f"w{i}",
+        "title": title or f"Workout {i}",
+        "description": "",
+        "start_time": start,
+        "end_time": start,
+        "updated_at": updated_at or start,
+        "created_at": start,
+        "exercises": [
+            {
+                "index": e,
+                "title": f"Exercise {e}",
+                "notes": "",
+                "exercise_template_id": f"T{e:04d}",
+                "supersets_id": None,
+                "sets": [
+                    {
+                        "index": s,
+                        "type": "warmup" if s == 0 else "normal",
+                        "weight_kg": 60.0 + 10 * s,
+                        "reps": 8,
+                        "distance_meters": None,
+                        "duration_seconds": None,
+                        "rpe": None,
+                        "custom_metric": None,
+                    }
+                    for s in range(3)
+                ],
+            }
+            for e in range(2)
+        ],
+    }
+
+
+def routine(i: int, *, title: Optional[str] = None, updated_at: str = "2024-01-01T12:00:00Z") -> dict[str, Any]:
+    return {
+        "id": f"r{i}",
+        "title": title or f"Routine {i}",
+        "folder_id": None,
+        "updated_at": updated_at,
+        "created_at": "2024-01-01T12:00:00Z",
+        "exercises": [
+            {
+                "index": 0,
+                "title": "Bench Press (Barbell)",
+                "rest_seconds": "90",
+                "notes": "",
+                "exercise_template_id": "79D0BB3A",
+                "supersets_id": None,
+                "sets": [
+                    {
+                        "index": 0,
+                        "type": "normal",
+                        "weight_kg": 50,
+                        "reps": 5,
+                        "distance_meters": None,
+                        "duration_seconds": None,
+                        "custom_metric": None,
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def exercise_template(i: int) -> dict[str, Any]:
+    return {
+        "id": f"T{i:04d}",
+        "title": f"Exercise {i}",
+        "type": "weight_reps",
+        "primary_muscle_group": "chest",
+        "secondary_muscle_groups": ["triceps", "shoulders"],
+        "equipment": "barbell",
+        "is_custom": False,
+    }
+
+
+def updated_event(item: dict[str, Any]) -> dict[str, Any]:
+    return {"type": "updated", "workout": item}
+
+
+def deleted_event(workout_id: str, deleted_at: str) -> dict[str, Any]:
+    return {"type": "deleted", "id": workout_id, "deleted_at": deleted_at}
+
+
+def page(key: str, items: Sequence[Any], request: httpx.Request, default_size: int = 5) -> httpx.Response:
+    """The page of ``items`` asked for by ``request``, 404 past the last one like the API"""
+    number = int(request.url.params.get("page", 1))
+    size = int(request.url.params.get("pageSize", default_size))
+    page_count = -(-len(items) // size)
+    if number > max(page_count, 1):
+        return httpx.Response(404, json={"error": "Page not found"})
+    return httpx.Response(
+        200, json={"page": number, "page_count": page_count, key: list(items[(number - 1) * size : number * size])}
+    )
+
+
+def client(handler: Handler, **options: Any) -> AuthenticatedClient:
+    """An AuthenticatedClient whose requests are answered by ``handler``"""
+    fake = AuthenticatedClient(base_url=BASE_URL, token=TOKEN, **options)
+    fake.set_httpx_client(httpx.Client(base_url=BASE_URL, transport=httpx.MockTransport(handler)))
+    return fake
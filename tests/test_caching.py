@@ -0,0 +1,166 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+import pytest
+from fakes import TOKEN, client, page, routine
+
+from hevy_api_client import errors
+from hevy_api_client.api.routine_folders import get_v1_routine_folders, post_v1_routine_folders
+from hevy_api_client.api.routines import get_v1_routines
+from hevy_api_client.api.workouts import get_v1_workouts_count
+from hevy_api_client.caching import ResponseCache, data_age
+from hevy_api_client.models import PostRoutineFolderRequestBody, PostRoutineFolderRequestBodyRoutineFolder
+from hevy_api_client.store import LocalStore
+
+
+def unreachable(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("unreachable", request=request)
+
+
+def test_cached_listing_is_served_until_a_write_invalidates_it() -> None:
+    folders = [{"id": 1, "index": 0, "title": "Push"}]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            folders.append({"id": 2, "index": 1, "title": "Pull"})
+            return httpx.Response(201, json={"routine_folder": folders[-1]})
+        return page("routine_folders", folders, request)
+
+    cached = client(handler, cache=ResponseCache())
+
+    first = get_v1_routine_folders.sync(client=cached, api_key=TOKEN)
+    body = PostRoutineFolderRequestBody(routine_folder=PostRoutineFolderRequestBodyRoutineFolder("Pull"))
+    post_v1_routine_folders.sync(client=cached, body=body, api_key=TOKEN)
+    second = get_v1_routine_folders.sync(client=cached, api_key=TOKEN)
+
+    assert [f.title for f in first.routine_folders] == ["Push"]
+    assert [f.title for f in second.routine_folders] == ["Push", "Pull"]
+    assert cached.cache.hits == 0
+
+
+def test_cache_is_keyed_by_account() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return page("routines", [routine(0, title=request.headers["api-key"])], request)
+
+    cache = ResponseCache()
+    first = get_v1_routines.sync(client=client(handler, cache=cache), api_key="account-a")
+    second = get_v1_routines.sync(client=client(handler, cache=cache), api_key="account-b")
+
+    assert (first.routines[0].title, second.routines[0].title) == ("account-a", "account-b")
+
+
+def test_workout_count_is_never_cached() -> None:
+    counts = iter(range(1, 10))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"workout_count": next(counts)})
+
+    cached = client(handler, cache=ResponseCache(ttl=3600))
+
+    assert [get_v1_workouts_count.sync(client=cached, api_key=TOKEN).workout_count for _ in range(2)] == [1, 2]
+
+
+def test_with_ttl_shares_an_in_memory_cache() -> None:
+    cache = ResponseCache(ttl=0)
+    get_v1_routines.sync(
+        client=client(lambda request: page("routines", [routine(0)], request), cache=cache), api_key=TOKEN
+    )
+
+    stale = cache.with_ttl(float("inf"))
+    response = get_v1_routines.sync(client=client(unreachable, cache=stale), api_key=TOKEN)
+
+    assert response.routines[0].id == "r0"
+    assert stale.hits == 1
+
+
+def test_offline_age_is_the_time_since_the_last_sync() -> None:
+    store = LocalStore()
+    store.put_many("routines", [routine(i) for i in range(3)])
+    # the rows were last written (changed) two hours ago, the table was last synced ten minutes ago
+    with store._get_conn() as conn:
+        conn.execute("UPDATE routines SET synced_at = ?", (time.time() - 7200,))
+        conn.execute(
+            "INSERT INTO sync_state (name, synced_at, cursor) VALUES ('routines', ?, NULL)", (time.time() - 600,)
+        )
+
+    response = get_v1_routines.sync_detailed(client=client(unreachable, store=store, offline=True), api_key=TOKEN)
+
+    assert len(response.parsed.routines) == 3
+    assert data_age(response) == pytest.approx(600, abs=5)
+
+
+def test_offline_age_of_a_store_never_synced_is_the_oldest_row() -> None:
+    store = LocalStore()
+    store.put("routines", routine(0))
+    with store._get_conn() as conn:
+        conn.execute("UPDATE routines SET synced_at = ?", (time.time() - 7200,))
+
+    response = get_v1_routines.sync_detailed(client=client(unreachable, store=store, offline=True), api_key=TOKEN)
+
+    assert data_age(response) == pytest.approx(7200, abs=5)
+
+
+def test_offline_serves_the_cache_before_the_store() -> None:
+    cache = ResponseCache()
+    get_v1_routines.sync(
+        client=client(lambda request: page("routines", [routine(0, title="Cached")], request), cache=cache),
+        api_key=TOKEN,
+    )
+    store = LocalStore()
+    store.put("routines", routine(0, title="Stored"))
+
+    offline = client(unreachable, cache=cache, store=store, offline=True)
+
+    assert get_v1_routines.sync(client=offline, api_key=TOKEN).routines[0].title == "Cached"
+    assert get_v1_routines.sync(client=offline, api_key=TOKEN, page=2).routines == []
+
+
+def test_offline_without_data_raises() -> None:
+    with pytest.raises(errors.OfflineDataUnavailable):
+        get_v1_routines.sync(client=client(unreachable, store=LocalStore(), offline=True), api_key=TOKEN)
+
+
+def test_fallback_answers_rate_limited_requests() -> None:
+    store = LocalStore()
+    store.put("routines", routine(0))
+    limited = client(lambda request: httpx.Response(429), store=store, offline_fallback=True)
+
+    response = get_v1_routines.sync_detailed(client=limited, api_key=TOKEN)
+
+    assert response.status_code == 200
+    assert response.parsed.routines[0].id == "r0"
+
+
+@pytest.mark.parametrize("parse", [True, False])
+def test_created_entities_are_written_to_the_store(parse: bool) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(201, json={"routine_folder": {"id": 7, "index": 0, "title": "Legs"}})
+
+    store = LocalStore()
+    body = PostRoutineFolderRequestBody(routine_folder=PostRoutineFolderRequestBodyRoutineFolder("Legs"))
+    post_v1_routine_folders.sync(client=client(handler, store=store), body=body, api_key=TOKEN, parse=parse)
+
+    assert store.get("routine_folders", "7") == {"id": 7, "index": 0, "title": "Legs"}
+
+
+def test_concurrent_requests_share_a_file_cache(tmp_path: Path) -> None:
+    routines = [routine(i) for i in range(200)]
+    cache = ResponseCache(path=str(tmp_path / "cache.db"))
+    store = LocalStore(path=str(tmp_path / "store.db"))
+    threaded = client(lambda request: page("routines", routines, request, default_size=1), cache=cache, store=store)
+
+    def fetch(number: int) -> str:
+        res = get_v1_routines.sync(client=threaded, api_key=TOKEN, page=number, page_size=1)
+        store.put_many("routines", [r.to_dict() for r in res.routines])
+        return res.routines[0].id
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        ids = list(pool.map(fetch, range(1, 201)))
+        # the second round is answered by the cache
+        cached_ids = list(pool.map(fetch, range(1, 201)))
+
+    assert ids == cached_ids == [r["id"] for r in routines]
+    assert cache.hits == 200
+    assert store.count("routines") == 200
@@ -0,0 +1,98 @@
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from conftest import Hevy
+from fakes import TOKEN, exercise_template, page
+
+from hevy_api_client import catalogue
+from hevy_api_client.catalogue import index_store, index_templates
+from hevy_api_client.cli.utils import get_cache_path
+from hevy_api_client.store import LocalStore
+
+
+def template(i: int, primary: str, secondary: list[str], equipment: str, **fields: Any) -> dict[str, Any]:
+    return {
+        **exercise_template(i),
+        "primary_muscle_group": primary,
+        "secondary_muscle_groups": secondary,
+        "equipment": equipment,
+        **fields,
+    }
+
+
+TEMPLATES = [
+    template(0, "chest", ["triceps", "shoulders"], "barbell"),
+    template(1, "triceps", ["chest"], "dumbbell"),
+    template(2, "quadriceps", ["glutes"], "barbell"),
+    template(3, "chest", [], "machine", is_custom=True),
+    template(4, "cardio", [], "none", type="duration"),
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_indexes() -> Iterator[None]:
+    catalogue._indexes.clear()
+    yield
+    catalogue._indexes.clear()
+
+
+def ids(templates: list[dict[str, Any]]) -> list[str]:
+    return [t["id"] for t in templates]
+
+
+def test_muscle_group_matches_primary_or_secondary() -> None:
+    index = index_templates(TEMPLATES)
+
+    assert ids(index.query(muscle_group="chest")) == ["T0000", "T0001", "T0003"]
+    assert ids(index.query(primary_muscle_group="chest")) == ["T0000", "T0003"]
+    assert ids(index.query(muscle_group="triceps", primary_muscle_group="chest")) == ["T0000"]
+
+
+def test_filters_are_intersected() -> None:
+    index = index_templates(TEMPLATES)
+
+    assert ids(index.query(muscle_group="chest", equipment="barbell")) == ["T0000"]
+    assert ids(index.query(is_custom=False, equipment="barbell")) == ["T0000", "T0002"]
+    assert ids(index.query(type_="duration")) == ["T0004"]
+    assert index.query(muscle_group="chest", equipment="none") == []
+    assert index.query() == TEMPLATES
+    assert sorted(index.values("equipment")) == ["barbell", "dumbbell", "machine", "none"]
+
+
+def test_store_index_is_rebuilt_only_when_the_catalogue_changes() -> None:
+    store = LocalStore()
+    store.put_many("exercise_templates", TEMPLATES)
+
+    first = index_store(store)
+    assert index_store(store) is first
+
+    store.put("exercise_templates", {**TEMPLATES[2], "secondary_muscle_groups": ["glutes", "chest"]})
+    second = index_store(store)
+
+    assert second is not first
+    assert sorted(ids(second.query(muscle_group="chest"))) == ["T0000", "T0001", "T0002", "T0003"]
+
+
+def test_cli_filters_the_templates_of_the_api(hevy: Hevy) -> None:
+    run = hevy(lambda request: page("exercise_templates", TEMPLATES, request))
+    # a store synced before the templates changed
+    store = LocalStore(path=get_cache_path(TOKEN, "store"))
+    store.put_many("exercise_templates", [exercise_template(9)])
+    store.set_sync_state("exercise_templates")
+    store.close()
+
+    result = run("exercise_templates", "list", "-m", "chest", "-o", "json")
+
+    assert sorted(ids(json.loads(result.output))) == ["T0000", "T0001", "T0003"]
+
+
+def test_cli_custom_and_equipment_filters(hevy: Hevy) -> None:
+    run = hevy(lambda request: page("exercise_templates", TEMPLATES, request))
+
+    custom = run("exercise_templates", "list", "--custom", "-o", "json")
+    barbell = run("exercise_templates", "list", "-e", "barbell", "--built-in", "-o", "json")
+
+    assert ids(json.loads(custom.output)) == ["T0003"]
+    assert sorted(ids(json.loads(barbell.output))) == ["T0000", "T0002"]
@@ -0,0 +1,66 @@
+import csv
+import io
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+import pytest
+from conftest import Hevy
+from fakes import page, workout
+
+from hevy_api_client.cli.utils import OutputFormat, write_records
+
+WORKOUTS = [workout(i) for i in range(23)]
+
+
+def api(request: httpx.Request) -> httpx.Response:
+    return page("workouts", WORKOUTS, request)
+
+
+def test_json_is_one_array(hevy: Hevy) -> None:
+    result = hevy(api)("workouts", "list", "-o", "json")
+
+    assert json.loads(result.output) == WORKOUTS
+
+
+def test_ndjson_is_one_object_per_line(hevy: Hevy) -> None:
+    result = hevy(api)("workouts", "list", "-o", "ndjson")
+
+    assert [json.loads(line) for line in result.output.splitlines()] == WORKOUTS
+
+
+def test_csv_has_a_header_and_nested_values_as_json(hevy: Hevy) -> None:
+    result = hevy(api)("workouts", "list", "-o", "csv")
+    rows = list(csv.DictReader(io.StringIO(result.output)))
+
+    assert list(rows[0]) == list(WORKOUTS[0])
+    assert [row["id"] for row in rows] == [w["id"] for w in WORKOUTS]
+    assert json.loads(rows[0]["exercises"]) == WORKOUTS[0]["exercises"]
+
+
+@pytest.mark.parametrize(("output_format", "expected"), [("json", "[]\n"), ("ndjson", ""), ("csv", "")])
+def test_no_records(hevy: Hevy, output_format: str, expected: str) -> None:
+    result = hevy(lambda request: page("workouts", [], request))("workouts", "list", "-o", output_format)
+
+    assert result.output == expected
+
+
+def test_each_page_is_written_before_the_next_is_fetched(capsys: pytest.CaptureFixture[str]) -> None:
+    written: list[str] = []
+
+    def pages() -> Iterator[list[dict[str, Any]]]:
+        for number in range(3):
+            written.append(capsys.readouterr().out)
+            yield [{"page": number, "value": None}]
+
+    write_records(pages(), OutputFormat.csv)
+
+    assert written == ["", "page,value\n0,\n", "1,\n"]
+    assert capsys.readouterr().out == "2,\n"
+
+
+def test_keys_missing_from_the_csv_header_are_dropped(capsys: pytest.CaptureFixture[str]) -> None:
+    write_records([[{"a": 1}], [{"b": 2, "a": 3}]], OutputFormat.csv)
+
+    assert capsys.readouterr().out == "a\n1\n3\n"
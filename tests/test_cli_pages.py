@@ -0,0 +1,56 @@
+import json
+import sys
+
+import httpx
+import pytest
+from conftest import Hevy
+from fakes import Handler, page, routine
+
+from hevy_api_client import errors
+from hevy_api_client.cli import cli_entrypoint, utils
+
+ROUTINES = [routine(i) for i in range(23)]
+
+
+def failing_on(number: int, status: int = 429) -> Handler:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["page"] == str(number):
+            return httpx.Response(status, json={"error": "Too many requests"})
+        return page("routines", ROUTINES, request)
+
+    return handler
+
+
+def test_pages_are_listed_in_order(hevy: Hevy) -> None:
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.params["page"])
+        return page("routines", ROUTINES, request)
+
+    result = hevy(handler)("routines", "list", "-o", "json", "--concurrency", "2")
+
+    assert [r["id"] for r in json.loads(result.output)] == [r["id"] for r in ROUTINES]
+    assert sorted(requested) == ["1", "2", "3"]
+
+
+@pytest.mark.parametrize("status", [429, 500])
+def test_a_failed_page_fails_the_listing(hevy: Hevy, status: int) -> None:
+    with pytest.raises(errors.UnexpectedStatus) as raised:
+        hevy(failing_on(2, status))("routines", "list", "-o", "json")
+
+    assert raised.value.status_code == status
+
+
+def test_a_failed_page_exits_with_an_error(
+    hevy: Hevy, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    # the hevy fixture sets up the environment, the command runs through the entry point
+    monkeypatch.setattr(utils, "_client_options", {"httpx_args": {"transport": httpx.MockTransport(failing_on(2))}})
+    monkeypatch.setattr(sys, "argv", ["hevy", "routines", "list", "-o", "json"])
+
+    with pytest.raises(SystemExit) as exited:
+        cli_entrypoint()
+
+    assert exited.value.code == 1
+    assert "Unexpected status code: 429" in capsys.readouterr().out
@@ -0,0 +1,46 @@
+import json
+
+import httpx
+from conftest import Hevy
+from fakes import TOKEN, client, page, routine
+
+from hevy_api_client.caching import ResponseCache
+from hevy_api_client.cli.utils import with_cache_ttl
+
+
+def test_stale_listing_renders_the_cache_then_revalidates(hevy: Hevy) -> None:
+    routines = [routine(0), routine(1)]
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return page("routines", routines, request)
+
+    run = hevy(handler)
+
+    # nothing cached yet: fetched once, nothing to revalidate
+    first = run("routines", "list", "--stale", "-o", "json")
+    assert [r["id"] for r in json.loads(first.output)] == ["r0", "r1"]
+    assert len(requests) == 1
+
+    routines.append(routine(2))
+    second = run("routines", "list", "--stale", "--rerender", "-o", "json")
+    cached, _, refreshed = second.output.partition("Data changed since the cached copy, refreshed results:\n")
+
+    assert [r["id"] for r in json.loads(cached)] == ["r0", "r1"]
+    assert [r["id"] for r in json.loads(refreshed)] == ["r0", "r1", "r2"]
+    assert len(requests) == 2
+
+    # the refresh landed in the cache
+    third = run("routines", "list", "--stale", "-o", "json")
+    assert [r["id"] for r in json.loads(third.output)] == ["r0", "r1", "r2"]
+
+
+def test_cache_ttl_copies_share_the_httpx_client() -> None:
+    parent = client(lambda request: page("routines", [routine(0)], request), cache=ResponseCache())
+
+    stale = with_cache_ttl(parent, float("inf"))
+
+    assert stale.get_httpx_client() is parent.get_httpx_client()
+    assert stale.cache is not parent.cache
+    assert stale.token == TOKEN
@@ -0,0 +1,46 @@
+import json
+import os
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+# runs the CLI in a fresh interpreter, then prints the hevy_api_client modules it imported
+SCRIPT = """
+import json, sys
+from typer.testing import CliRunner
+from hevy_api_client.cli import app
+
+result = CliRunner().invoke(app, sys.argv[1:])
+print(json.dumps({
+    "output": result.output,
+    "modules": sorted(m for m in sys.modules if m.startswith("hevy_api_client")),
+}))
+"""
+
+
+def run_fresh(*args: str) -> dict[str, Any]:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    env.pop("HEVY_API_TOKEN", None)
+    process = subprocess.run([sys.executable, "-c", SCRIPT, *args], env=env, capture_output=True, check=True)
+    return json.loads(process.stdout)
+
+
+def test_help_lists_every_subcommand_without_loading_them() -> None:
+    result = run_fresh("--help")
+
+    for name in ("routine_folders", "routines", "exercise_templates", "workouts", "sync"):
+        assert name in result["output"]
+    assert "List and count workouts and their events" in result["output"]
+    assert result["modules"] == ["hevy_api_client", "hevy_api_client.cli", "hevy_api_client.errors"]
+
+
+@pytest.mark.parametrize("name", ["routines", "workouts"])
+def test_a_subcommand_only_loads_its_own_module(name: str) -> None:
+    result = run_fresh(name, "--help")
+
+    assert "list" in result["output"]
+    assert f"hevy_api_client.cli.{name}" in result["modules"]
+    others = {"routines", "workouts", "routine_folders", "exercise_templates"} - {name}
+    assert not any(f"hevy_api_client.cli.{other}" in result["modules"] for other in others)
@@ -0,0 +1,65 @@
+import json
+from typing import Any
+
+import httpx
+from conftest import Hevy
+from fakes import TOKEN, Handler, page, workout
+
+from hevy_api_client.cli.utils import get_cache_path
+from hevy_api_client.store import LocalStore
+
+# newest first like the API, started from 2024-11-23 back to 2024-11-01
+WORKOUTS = [workout(i) for i in reversed(range(23))]
+
+
+def api(requested: list[str], workouts: list[dict[str, Any]] = WORKOUTS) -> Handler:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if request.url.path == "/v1/workouts/count":
+            return httpx.Response(200, json={"workout_count": len(workouts)})
+        return page("workouts", workouts, request)
+
+    return handler
+
+
+def listed(output: str) -> list[str]:
+    return [w["id"] for w in json.loads(output)]
+
+
+def test_since_stops_at_the_first_older_page(hevy: Hevy) -> None:
+    requested: list[str] = []
+
+    result = hevy(api(requested))("workouts", "list", "--since", "2024-11-20", "-o", "json")
+
+    assert listed(result.output) == ["w22", "w21", "w20", "w19"]
+    assert requested == ["/v1/workouts"]
+
+
+def test_until_excludes_its_date(hevy: Hevy) -> None:
+    result = hevy(api([]))("workouts", "list", "--until", "2024-11-03", "-o", "json")
+
+    assert listed(result.output) == ["w1", "w0"]
+
+
+def test_exercise_matches_a_template_id_or_a_title(hevy: Hevy) -> None:
+    workouts = [workout(i) for i in reversed(range(23))]
+    workouts[3]["exercises"][0].update(exercise_template_id="79D0BB3A", title="Bench Press (Barbell)")
+
+    run = hevy(api([], workouts))
+    by_id = run("workouts", "list", "-e", "79D0BB3A", "-o", "json")
+    by_title = run("workouts", "list", "-e", "bench press", "-o", "json")
+
+    assert listed(by_id.output) == listed(by_title.output) == ["w19"]
+
+
+def test_filtered_counts_come_from_the_api(hevy: Hevy) -> None:
+    run = hevy(api([]))
+    # a store synced before the last workouts were logged
+    store = LocalStore(path=get_cache_path(TOKEN, "store"))
+    store.put_many("workouts", WORKOUTS[5:])
+    store.set_sync_state("workouts")
+    store.close()
+
+    assert run("workouts", "count").output == "23\n"
+    assert run("workouts", "count", "--since", "2024-11-01").output == "23\n"
+    assert run("workouts", "count", "--since", "2024-11-20").output == "4\n"
@@ -0,0 +1,62 @@
+import asyncio
+
+import httpx
+import pytest
+from conftest import Hevy
+from fakes import BASE_URL, TOKEN, page, routine
+
+from hevy_api_client import AuthenticatedClient
+from hevy_api_client.cli import utils
+
+
+def test_close_closes_the_sync_client() -> None:
+    client = AuthenticatedClient(base_url=BASE_URL, token=TOKEN)
+    httpx_client = client.get_httpx_client()
+
+    client.close()
+
+    assert httpx_client.is_closed
+    assert client.get_httpx_client() is not httpx_client
+
+
+def test_aclose_closes_both_clients() -> None:
+    client = AuthenticatedClient(base_url=BASE_URL, token=TOKEN)
+    httpx_client = client.get_httpx_client()
+    async_client = client.get_async_httpx_client()
+
+    asyncio.run(client.aclose())
+
+    assert httpx_client.is_closed
+    assert async_client.is_closed
+    assert client.get_async_httpx_client() is not async_client
+
+
+def test_cli_commands_share_one_client(hevy: Hevy) -> None:
+    run = hevy(lambda request: page("routines", [routine(0)], request))
+    run("routines", "list")  # sets up the environment and the test transport
+
+    client = utils.get_client()
+    httpx_client = client.get_httpx_client()
+
+    assert utils.get_client() is client
+    utils.close_client()
+    assert httpx_client.is_closed
+    assert utils._client is None
+    assert utils.get_client() is not client
+    utils.close_client()
+
+
+def test_cli_closes_the_client_after_a_command(hevy: Hevy, monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: list[httpx.Client] = []
+    close = httpx.Client.close
+
+    def recording_close(self: httpx.Client) -> None:
+        closed.append(self)
+        close(self)
+
+    monkeypatch.setattr(httpx.Client, "close", recording_close)
+    run = hevy(lambda request: page("routines", [routine(0)], request))
+
+    assert run("routines", "list").exit_code == 0
+    assert len(closed) == 1
+    assert utils._client is None
@@ -0,0 +1,75 @@
+import math
+
+import pytest
+from fakes import workout
+
+from hevy_api_client.columnar import METRICS, SetsTable
+from hevy_api_client.models import Workout
+from hevy_api_client.store import LocalStore
+
+
+def test_every_set_is_a_row() -> None:
+    table = SetsTable.from_workouts([workout(0), workout(1)])
+
+    assert len(table) == 12
+    assert table.workout_ids == ["w0", "w1"]
+    assert table.exercise_template_ids == ["T0000", "T0001"]
+    assert table.set_types == ["warmup", "normal"]
+    assert list(table.workout) == [0] * 6 + [1] * 6
+    assert list(table.template) == [0, 0, 0, 1, 1, 1] * 2
+    assert list(table.set_type) == [0, 1, 1] * 4
+    assert set(table.columns) == set(METRICS)
+    assert all(len(column) == len(table) for column in table.columns.values())
+
+
+def test_missing_values_are_nan() -> None:
+    data = workout(0)
+    data["exercises"][0]["sets"][0]["weight_kg"] = None
+    del data["exercises"][0]["sets"][1]["reps"]
+    data["start_time"] = None
+
+    table = SetsTable.from_workouts([data])
+
+    assert math.isnan(table.columns["weight_kg"][0])
+    assert math.isnan(table.columns["reps"][1])
+    assert all(math.isnan(value) for value in table.columns["rpe"])
+    assert all(math.isnan(value) for value in table.start_time)
+
+
+def test_models_and_json_give_the_same_table() -> None:
+    data = [workout(i) for i in range(3)]
+    from_json = SetsTable.from_workouts(data)
+    from_models = SetsTable.from_workouts([Workout.from_dict(item) for item in data])
+
+    for name in METRICS:
+        assert from_models.columns[name].tobytes() == from_json.columns[name].tobytes()
+    assert (from_models.workout, from_models.template, from_models.start_time) == (
+        from_json.workout,
+        from_json.template,
+        from_json.start_time,
+    )
+
+
+def test_totals_ignore_missing_values() -> None:
+    data = workout(0)
+    data["exercises"][1]["sets"][2]["weight_kg"] = None
+    store = LocalStore()
+    store.put("workouts", data)
+
+    table = SetsTable.from_store(store)
+
+    assert table.total("weight_kg") == 60 + 70 + 80 + 60 + 70
+    assert table.total("rpe") == 0
+    assert table.totals_by_template("weight_kg") == {"T0000": 210.0, "T0001": 130.0}
+
+
+def test_numpy_columns_are_views() -> None:
+    np = pytest.importorskip("numpy")
+    table = SetsTable.from_workouts([workout(0)])
+
+    weights = table.numpy("weight_kg")
+    table.columns["weight_kg"][0] = 100.0
+
+    assert weights.dtype == np.float64
+    assert weights[0] == 100.0
+    assert table.numpy("template").tolist() == [0, 0, 0, 1, 1, 1]
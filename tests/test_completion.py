@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pytest
+from fakes import TOKEN, client, exercise_template, page, routine
+
+from hevy_api_client.api.routines import get_v1_routines
+from hevy_api_client.caching import ResponseCache
+from hevy_api_client.cli import completion
+from hevy_api_client.cli.completion import complete_exercise_templates, complete_routine_ids
+from hevy_api_client.cli.utils import get_cache_path
+from hevy_api_client.store import LocalStore
+
+
+@pytest.fixture(autouse=True)
+def environment(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("HEVY_API_TOKEN", TOKEN)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+
+def local_store() -> LocalStore:
+    return LocalStore(path=get_cache_path(TOKEN, "store"))
+
+
+def test_ids_and_titles_come_from_the_store() -> None:
+    store = local_store()
+    store.put_many("routines", [routine(i) for i in range(12)])
+    store.put_many("exercise_templates", [exercise_template(i) for i in range(3)])
+    store.close()
+
+    assert complete_routine_ids("r1") == [("r1", "Routine 1"), ("r10", "Routine 10"), ("r11", "Routine 11")]
+    assert complete_routine_ids("routine 2") == [("r2", "Routine 2")]
+    assert complete_exercise_templates("EXERCISE 0") == [("T0000", "Exercise 0")]
+    assert len(complete_routine_ids("")) == 12
+
+
+def test_cached_listings_are_used_without_a_store() -> None:
+    routines = [routine(i) for i in range(3)]
+    cache = ResponseCache(path=get_cache_path(TOKEN))
+    get_v1_routines.sync(client=client(lambda request: page("routines", routines, request), cache=cache), api_key=TOKEN)
+    cache.close()
+
+    assert complete_routine_ids("r") == [("r0", "Routine 0"), ("r1", "Routine 1"), ("r2", "Routine 2")]
+    assert complete_exercise_templates("T") == []
+
+
+def test_nothing_is_offered_without_a_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = local_store()
+    store.put("routines", routine(0))
+    store.close()
+    monkeypatch.delenv("HEVY_API_TOKEN")
+
+    assert complete_routine_ids("r") == []
+
+
+def test_nothing_is_offered_over_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = local_store()
+    store.put_many("routines", [routine(i) for i in range(2000)])
+    store.close()
+    monkeypatch.setattr(completion, "BUDGET_MS", 0)
+
+    assert complete_routine_ids("r") == []
@@ -0,0 +1,166 @@
+from typing import Any
+
+import pytest
+from fakes import TOKEN, client, deleted_event, exercise_template, page, routine, updated_event, workout
+
+from hevy_api_client.api.workouts import get_v1_workouts
+from hevy_api_client.decoders import decode
+from hevy_api_client.interning import InternTable
+from hevy_api_client.lazy import LazyRoutine, LazyWorkout
+from hevy_api_client.models import (
+    GetV1ExerciseTemplatesResponse200,
+    GetV1RoutinesResponse200,
+    GetV1WorkoutsResponse200,
+    PaginatedWorkoutEvents,
+    Workout,
+)
+from hevy_api_client.types import EMPTY_PROPERTIES
+
+PAGES: list[tuple[type, dict[str, Any]]] = [
+    (GetV1WorkoutsResponse200, {"page": 1, "page_count": 1, "workouts": [workout(i) for i in range(3)]}),
+    (GetV1RoutinesResponse200, {"page": 1, "page_count": 1, "routines": [routine(i) for i in range(3)]}),
+    (
+        GetV1ExerciseTemplatesResponse200,
+        {"page": 1, "page_count": 1, "exercise_templates": [exercise_template(i) for i in range(3)]},
+    ),
+    (
+        PaginatedWorkoutEvents,
+        {
+            "page": 1,
+            "page_count": 1,
+            "events": [updated_event(workout(0)), deleted_event("w1", "2024-12-01T12:00:00Z")],
+        },
+    ),
+]
+
+
+OPTIONS: list[dict[str, Any]] = [{}, {"compact": True}, {"interner": InternTable()}]
+
+
+@pytest.mark.parametrize("options", OPTIONS)
+@pytest.mark.parametrize(("cls", "data"), PAGES)
+def test_decode_matches_from_dict(cls: type, data: dict[str, Any], options: dict[str, Any]) -> None:
+    decoded = decode(cls, data, **options)
+
+    assert decoded == cls.from_dict(data)  # type: ignore[attr-defined]
+    assert decoded.to_dict() == cls.from_dict(data).to_dict() == data  # type: ignore[attr-defined]
+
+
+def test_unknown_keys_are_kept() -> None:
+    data = {"page": 1, "page_count": 1, "workouts": [{**workout(0), "is_private": True}], "next": None}
+
+    decoded = decode(GetV1WorkoutsResponse200, data, compact=True)
+
+    assert decoded.additional_properties == {"next": None}
+    assert decoded.workouts[0]["is_private"] is True
+    assert decoded.to_dict() == data
+
+
+def test_unknown_event_type_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown type 'created'"):
+        decode(PaginatedWorkoutEvents, {"page": 1, "page_count": 1, "events": [{"type": "created"}]})
+
+
+def test_client_uses_the_compiled_decoders(monkeypatch: pytest.MonkeyPatch) -> None:
+    workouts = [workout(i) for i in range(3)]
+    expected = GetV1WorkoutsResponse200.from_dict({"page": 1, "page_count": 1, "workouts": workouts})
+    compiled = client(lambda request: page("workouts", workouts, request), compiled_decoders=True)
+    monkeypatch.setattr(GetV1WorkoutsResponse200, "from_dict", None)
+
+    assert get_v1_workouts.sync(client=compiled, api_key=TOKEN) == expected
+
+
+@pytest.mark.parametrize("options", OPTIONS)
+@pytest.mark.parametrize(("cls", "data"), PAGES[:2])
+def test_lazy_decode_matches_from_dict(cls: type, data: dict[str, Any], options: dict[str, Any]) -> None:
+    lazy = decode(cls, data, lazy=True, **options)
+    eager = cls.from_dict(data)  # type: ignore[attr-defined]
+    key = "workouts" if "workouts" in data else "routines"
+
+    # serialised without parsing the exercises
+    assert lazy.to_dict() == data
+    assert len(getattr(lazy, key)) == len(data[key])
+    for lazy_item, eager_item in zip(getattr(lazy, key), getattr(eager, key)):
+        assert isinstance(lazy_item, (LazyWorkout, LazyRoutine))
+        assert not lazy_item.exercises_loaded
+        assert lazy_item.exercises == eager_item.exercises
+        assert lazy_item.exercises_loaded
+        assert lazy_item.to_dict() == eager_item.to_dict()
+
+
+def test_lazy_from_dict_and_assignment() -> None:
+    lazy = LazyWorkout.from_dict(workout(0))
+
+    assert isinstance(lazy, Workout)
+    assert lazy.to_dict() == workout(0)
+    assert lazy.exercises == Workout.from_dict(workout(0)).exercises
+
+    lazy.exercises = []
+    assert lazy.exercises_loaded
+    assert lazy.to_dict()["exercises"] == []
+
+
+def test_lazy_client_never_parses_exercises_of_listings() -> None:
+    workouts = [workout(i) for i in range(3)]
+    lazy = client(lambda request: page("workouts", workouts, request), lazy_models=True)
+
+    response = get_v1_workouts.sync(client=lazy, api_key=TOKEN)
+
+    assert [w.to_dict() for w in response.workouts] == workouts
+    assert not any(w.exercises_loaded for w in response.workouts)
+
+
+def test_compact_models_share_their_empty_properties() -> None:
+    first, second = decode(GetV1RoutinesResponse200, PAGES[1][1], compact=True).routines[:2]
+
+    assert first.additional_properties is second.additional_properties is EMPTY_PROPERTIES
+    assert first.exercises[0].sets[0].additional_properties is EMPTY_PROPERTIES
+
+
+def test_compact_models_copy_their_properties_on_write() -> None:
+    first, second = decode(GetV1RoutinesResponse200, PAGES[1][1], compact=True).routines[:2]
+
+    first["pinned"] = True
+    assert first.to_dict()["pinned"] is True
+    assert "pinned" not in second
+    del first["pinned"]
+    assert "pinned" not in first
+
+    with pytest.raises(KeyError):
+        del second["pinned"]
+    assert EMPTY_PROPERTIES == {}
+
+
+def test_repeated_strings_are_interned() -> None:
+    data = {"page": 1, "page_count": 1, "workouts": [workout(i) for i in range(2)]}
+    for item in data["workouts"]:
+        for exercise in item["exercises"]:
+            # equal strings that are distinct objects, like those of a JSON decoder
+            exercise["title"] = "".join(["Bench ", "Press"])
+
+    first, second = decode(GetV1WorkoutsResponse200, data, interner=InternTable()).workouts
+
+    assert first.exercises[0].title is second.exercises[0].title
+    assert first.exercises[0].sets[1].type_ is second.exercises[1].sets[2].type_
+
+
+def test_intern_table_stops_growing() -> None:
+    interner = InternTable(max_size=2)
+    a, _, c = (interner("".join([letter, "x"])) for letter in "abc")
+
+    assert len(interner) == 2
+    assert interner("".join(["a", "x"])) is a
+    assert interner("".join(["c", "x"])) is not c
+    assert interner(1) == 1
+
+
+def test_lazy_exercises_use_the_decoder_options() -> None:
+    interner = InternTable()
+
+    lazy = decode(GetV1WorkoutsResponse200, PAGES[0][1], lazy=True, compact=True, interner=interner)
+    assert len(interner) == 0
+    exercises = lazy.workouts[0].exercises
+
+    assert len(interner) > 0
+    assert exercises[0].additional_properties is EMPTY_PROPERTIES
+    assert exercises[0].sets[0].additional_properties is EMPTY_PROPERTIES
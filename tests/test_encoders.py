@@ -0,0 +1,68 @@
+import json
+from typing import Any
+
+import httpx
+import pytest
+from attrs import evolve
+from fakes import TOKEN, client, routine
+
+from hevy_api_client.api.routines import post_v1_routines
+from hevy_api_client.encoders import get_encoder, to_json_bytes
+from hevy_api_client.jsonlib import get_json_backend
+from hevy_api_client.models import PostRoutinesRequestBody, PutRoutinesRequestBody
+from hevy_api_client.types import UNSET
+
+
+def body(cls: type) -> Any:
+    source = routine(0)
+    exercises = [
+        {
+            "exercise_template_id": exercise["exercise_template_id"],
+            "superset_id": None,
+            "rest_seconds": 90,
+            "notes": exercise["notes"],
+            "sets": [{"type": s["type"], "weight_kg": s["weight_kg"], "reps": s["reps"]} for s in exercise["sets"]],
+        }
+        for exercise in source["exercises"]
+    ]
+    return cls.from_dict(  # type: ignore[attr-defined]
+        {"routine": {"title": source["title"], "folder_id": None, "notes": "", "exercises": exercises}}
+    )
+
+
+@pytest.mark.parametrize("cls", [PostRoutinesRequestBody, PutRoutinesRequestBody])
+def test_encoder_matches_to_dict(cls: type) -> None:
+    request_body = body(cls)
+
+    assert get_encoder(cls)(request_body) == request_body.to_dict()
+    assert json.loads(to_json_bytes(request_body)) == request_body.to_dict()
+
+
+def test_unset_fields_and_unknown_keys() -> None:
+    request_body = body(PostRoutinesRequestBody)
+    request_body.routine.notes = UNSET
+    request_body["client_version"] = "1.0"
+
+    encoded = get_encoder(PostRoutinesRequestBody)(request_body)
+
+    assert "notes" not in encoded["routine"]
+    assert encoded["client_version"] == "1.0"
+    assert encoded == request_body.to_dict()
+
+
+def test_endpoint_sends_the_body_with_the_client_backend() -> None:
+    sent: list[bytes] = []
+    encoded: list[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.content)
+        return httpx.Response(201, json={"routine": [routine(0)]})
+
+    stdlib = get_json_backend("json")
+    recording = evolve(stdlib, dumps=lambda obj: encoded.append(obj) or stdlib.dumps(obj))
+    request_body = body(PostRoutinesRequestBody)
+
+    post_v1_routines.sync_detailed(client=client(handler, json_backend=recording), body=request_body, api_key=TOKEN)
+
+    assert encoded == [request_body.to_dict()]
+    assert json.loads(sent[0]) == request_body.to_dict()
@@ -0,0 +1,95 @@
+import asyncio
+from itertools import islice
+
+import httpx
+import pytest
+from fakes import BASE_URL, TOKEN, client, deleted_event, page
+
+from hevy_api_client import errors, events
+from hevy_api_client.events import afollow_workout_events, follow_workout_events
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(events.time, "sleep", lambda seconds: None)
+
+
+def unreachable(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("unreachable", request=request)
+
+
+def test_failed_page_leaves_the_cursor_unchanged() -> None:
+    # newest first, like the API
+    feed = [deleted_event(f"w{i}", f"2024-01-01T00:00:0{i}Z") for i in reversed(range(10))]
+    requests: list[tuple[int, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        number = int(request.url.params["page"])
+        requests.append((number, request.url.params["since"]))
+        if number == 2 and len(requests) == 2:
+            return httpx.Response(429, json={"error": "Too many requests"})
+        return page("events", feed, request)
+
+    delivered = list(islice(follow_workout_events(client=client(handler), api_key=TOKEN, page_size=5), 10))
+
+    assert [event.id for event in delivered] == [f"w{i}" for i in range(10)]
+    # the poll that failed on its second page is retried from the same ``since``
+    assert requests[:4] == [(1, "1970-01-01T00:00:00Z"), (2, "1970-01-01T00:00:00Z")] * 2
+
+
+def test_transport_error_counts_as_an_idle_poll() -> None:
+    feed = [deleted_event("w0", "2024-01-01T00:00:00Z")]
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise httpx.ConnectError("unreachable", request=request)
+        return page("events", feed, request)
+
+    delivered = next(follow_workout_events(client=client(handler), api_key=TOKEN, page_size=5))
+
+    assert delivered.id == "w0"
+    assert calls == 2
+
+
+def test_auth_errors_are_raised() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(401, json={"error": "Invalid api key"})
+
+    with pytest.raises(errors.UnexpectedStatus) as raised:
+        next(follow_workout_events(client=client(handler), api_key=TOKEN))
+
+    assert raised.value.status_code == 401
+
+
+def test_server_errors_are_retried() -> None:
+    statuses = iter([500, 503])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if (status := next(statuses, 200)) != 200:
+            return httpx.Response(status)
+        return page("events", [deleted_event("w0", "2024-01-01T00:00:00Z")], request)
+
+    assert next(follow_workout_events(client=client(handler), api_key=TOKEN)).id == "w0"
+
+
+def test_offline_client_does_not_poll() -> None:
+    with pytest.raises(errors.OfflineDataUnavailable):
+        next(follow_workout_events(client=client(unreachable, offline=True), api_key=TOKEN))
+
+
+def test_async_follow_matches_the_sync_one() -> None:
+    feed = [deleted_event(f"w{i}", f"2024-01-01T00:00:0{i}Z") for i in reversed(range(3))]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return page("events", feed, request)
+
+    async def first_events() -> list[str]:
+        fake = client(handler)
+        fake.set_async_httpx_client(httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(handler)))
+        followed = afollow_workout_events(client=fake, api_key=TOKEN)
+        return [(await followed.__anext__()).id for _ in range(3)]
+
+    assert asyncio.run(first_events()) == ["w0", "w1", "w2"]
@@ -0,0 +1,74 @@
+import sys
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+import pytest
+from attrs import evolve
+from fakes import TOKEN, client, page, routine
+
+from hevy_api_client.api.routines import get_v1_routines
+from hevy_api_client.jsonlib import BACKEND_ENV_VAR, get_json_backend
+
+
+@pytest.fixture(autouse=True)
+def fresh_backends(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.delenv(BACKEND_ENV_VAR, raising=False)
+    get_json_backend.cache_clear()
+    yield
+    get_json_backend.cache_clear()
+
+
+def test_fastest_installed_backend_is_picked(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("orjson")
+    pytest.importorskip("msgspec")
+    assert get_json_backend().name == "orjson"
+
+    get_json_backend.cache_clear()
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    assert get_json_backend().name == "msgspec"
+
+    get_json_backend.cache_clear()
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    assert get_json_backend().name == "json"
+
+
+def test_environment_variable_forces_a_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(BACKEND_ENV_VAR, "json")
+
+    assert get_json_backend().name == "json"
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown JSON backend 'simdjson'"):
+        get_json_backend("simdjson")
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgspec", "json"])
+def test_backends_agree(name: str) -> None:
+    if name != "json":
+        pytest.importorskip(name)
+    data = {"page": 1, "page_count": 1, "routines": [routine(0)], "title": "Día de pierna 🦵"}
+    backend = get_json_backend(name)
+
+    assert backend.loads(backend.dumps(data)) == data
+    assert backend.loads(get_json_backend("json").dumps(data)) == data
+
+
+def test_responses_are_decoded_by_the_client_backend() -> None:
+    decoded: list[Any] = []
+    backend = get_json_backend("json")
+
+    def loads(content: Any) -> Any:
+        decoded.append(content)
+        return backend.loads(content)
+
+    fake = client(lambda request: page("routines", [routine(0)], request), json_backend=evolve(backend, loads=loads))
+
+    assert get_v1_routines.sync(client=fake, api_key=TOKEN).routines[0].id == "r0"
+    assert len(decoded) == 1
+
+
+def test_backend_is_picked_once() -> None:
+    assert get_json_backend() is get_json_backend()
+    assert client(lambda request: httpx.Response(200)).json_backend is get_json_backend()
@@ -0,0 +1,41 @@
+import asyncio
+
+import httpx
+import pytest
+from fakes import BASE_URL, TOKEN, client, page, routine, workout
+
+from hevy_api_client.api.routines import get_v1_routines
+from hevy_api_client.api.workouts import get_v1_workouts, get_v1_workouts_count
+from hevy_api_client.models import GetV1RoutinesResponse200, GetV1WorkoutsResponse200
+
+
+@pytest.mark.parametrize("options", [{}, {"compiled_decoders": True}, {"lazy_models": True, "compact_models": True}])
+def test_parse_false_returns_the_decoded_json(monkeypatch: pytest.MonkeyPatch, options: dict[str, bool]) -> None:
+    workouts = [workout(i) for i in range(3)]
+    raw = client(lambda request: page("workouts", workouts, request), **options)
+    monkeypatch.setattr(GetV1WorkoutsResponse200, "from_dict", None)
+
+    response = get_v1_workouts.sync_detailed(client=raw, api_key=TOKEN, parse=False)
+
+    assert response.parsed == {"page": 1, "page_count": 1, "workouts": workouts}
+
+
+def test_parse_false_of_an_endpoint_without_pages() -> None:
+    raw = client(lambda request: httpx.Response(200, json={"workout_count": 42}))
+
+    assert get_v1_workouts_count.sync(client=raw, api_key=TOKEN, parse=False) == {"workout_count": 42}
+    assert get_v1_workouts_count.sync(client=raw, api_key=TOKEN).workout_count == 42
+
+
+def test_async_parse_false() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return page("routines", [routine(0)], request)
+
+    raw = client(handler)
+    raw.set_async_httpx_client(httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(handler)))
+
+    parsed = asyncio.run(get_v1_routines.asyncio(client=raw, api_key=TOKEN, parse=False))
+    model = asyncio.run(get_v1_routines.asyncio(client=raw, api_key=TOKEN))
+
+    assert parsed == {"page": 1, "page_count": 1, "routines": [routine(0)]}
+    assert model == GetV1RoutinesResponse200.from_dict(parsed)
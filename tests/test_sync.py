@@ -0,0 +1,155 @@
+from typing import Any
+
+import httpx
+import pytest
+from conftest import Hevy
+from fakes import TOKEN, client, deleted_event, page, routine, updated_event, workout
+
+from hevy_api_client import errors
+from hevy_api_client.api.routines import get_v1_routines
+from hevy_api_client.caching import ResponseCache
+from hevy_api_client.store import LocalStore
+from hevy_api_client.sync import sync_routines, sync_workouts
+
+
+class FakeApi:
+    """Serves ``routines``, ``workouts`` and ``events`` (newest first), counting the requests by path"""
+
+    def __init__(self) -> None:
+        self.routines: list[dict[str, Any]] = []
+        self.workouts: list[dict[str, Any]] = []
+        self.events: list[dict[str, Any]] = []
+        self.requests: dict[str, int] = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests[request.url.path] = self.requests.get(request.url.path, 0) + 1
+        if request.url.path == "/v1/routines":
+            return page("routines", self.routines, request)
+        if request.url.path == "/v1/workouts":
+            return page("workouts", self.workouts, request)
+        if request.url.path == "/v1/workouts/events":
+            return page("events", self.events, request)
+        return httpx.Response(404)
+
+
+def test_routines_change_detection() -> None:
+    api = FakeApi()
+    api.routines = [routine(i) for i in range(3)]
+    store = LocalStore()
+
+    first = sync_routines(client=client(api), store=store, api_key=TOKEN)
+    assert (first.added, first.updated, first.deleted, first.unchanged) == (3, 0, 0, 0)
+    assert sorted(first.changed) == ["r0", "r1", "r2"]
+
+    api.routines = [
+        routine(0),
+        routine(1, title="Push day", updated_at="2024-02-01T12:00:00Z"),
+        routine(3),
+    ]
+    second = sync_routines(client=client(api), store=store, api_key=TOKEN)
+    assert (second.added, second.updated, second.deleted, second.unchanged) == (1, 1, 1, 1)
+    assert sorted(second.changed) == ["r1", "r3"]
+    assert store.get("routines", "r1")["title"] == "Push day"
+    assert store.get("routines", "r2") is None
+
+    third = sync_routines(client=client(api), store=store, api_key=TOKEN)
+    assert (third.added, third.updated, third.deleted, third.unchanged) == (0, 0, 0, 3)
+    assert third.changed == []
+    assert store.sync_state("routines") is not None
+
+
+def test_content_change_without_a_new_updated_at_is_detected() -> None:
+    api = FakeApi()
+    api.routines = [routine(0)]
+    store = LocalStore()
+    sync_routines(client=client(api), store=store, api_key=TOKEN)
+
+    api.routines = [routine(0, title="Renamed")]
+    result = sync_routines(client=client(api), store=store, api_key=TOKEN)
+
+    assert (result.updated, result.unchanged) == (1, 0)
+
+
+def test_workouts_apply_event_deltas() -> None:
+    api = FakeApi()
+    api.workouts = [workout(i) for i in range(4)]
+    store = LocalStore()
+
+    first = sync_workouts(client=client(api), store=store, api_key=TOKEN)
+    assert (first.added, first.unchanged) == (4, 0)
+    assert "/v1/workouts/events" not in api.requests
+    cursor = store.sync_state("workouts").cursor
+
+    api.events = [
+        updated_event(workout(1, title="Edited", updated_at="2024-12-02T12:00:00Z")),
+        deleted_event("w2", "2024-12-01T12:00:00Z"),
+        updated_event(workout(9, updated_at="2024-11-30T12:00:00Z")),
+        # an older event of the same workout is ignored
+        updated_event(workout(1, updated_at="2024-11-29T12:00:00Z")),
+        # replayed: matches the stored copy
+        updated_event(workout(3)),
+    ]
+    second = sync_workouts(client=client(api), store=store, api_key=TOKEN)
+
+    assert (second.added, second.updated, second.deleted, second.unchanged) == (1, 1, 1, 1)
+    assert sorted(second.changed) == ["w1", "w9"]
+    assert second.requests == 1
+    assert api.requests["/v1/workouts"] == 1
+    assert store.get("workouts", "w1")["title"] == "Edited"
+    assert store.get("workouts", "w2") is None
+    # every event predates the first sync, the cursor does not move back
+    assert store.sync_state("workouts").cursor == cursor
+
+
+def test_a_404_past_the_last_page_ends_the_listing() -> None:
+    api = FakeApi()
+    api.routines = [routine(i) for i in range(3)]
+    store = LocalStore()
+    sync_routines(client=client(api), store=store, api_key=TOKEN)
+
+    # the API answers 404 rather than an empty first page once every routine is gone
+    result = sync_routines(client=client(lambda request: httpx.Response(404)), store=store, api_key=TOKEN)
+
+    assert (result.deleted, result.requests) == (3, 1)
+    assert store.count("routines") == 0
+
+
+def test_a_failed_page_leaves_the_store_untouched() -> None:
+    api = FakeApi()
+    api.routines = [routine(i) for i in range(3)]
+    store = LocalStore()
+    sync_routines(client=client(api), store=store, api_key=TOKEN)
+
+    def rate_limited(request: httpx.Request) -> httpx.Response:
+        if request.url.params["page"] == "2":
+            return httpx.Response(429, json={"error": "Too many requests"})
+        return page("routines", [routine(0, title="Renamed")] * 11, request)
+
+    # the store is not used as a fallback for itself
+    with pytest.raises(errors.UnexpectedStatus):
+        sync_routines(client=client(rate_limited, offline_fallback=True), store=store, api_key=TOKEN, page_size=10)
+
+    assert store.count("routines") == 3
+    assert store.get("routines", "r0")["title"] == "Routine 0"
+
+
+def test_sync_asks_the_api_and_refreshes_the_cache() -> None:
+    api = FakeApi()
+    api.routines = [routine(0)]
+    cached = client(api, cache=ResponseCache(ttl=3600), store=LocalStore())
+    get_v1_routines.sync(client=cached, api_key=TOKEN, page_size=10)
+
+    api.routines = [routine(0), routine(1)]
+    result = sync_routines(client=cached, store=cached.store, api_key=TOKEN)
+
+    assert result.added == 2
+    assert api.requests["/v1/routines"] == 2
+    assert len(get_v1_routines.sync(client=cached, api_key=TOKEN, page_size=10).routines) == 2
+    assert cached.cache.hits == 1
+
+
+def test_cli_reports_a_failed_sync(hevy: Hevy) -> None:
+    result = hevy(lambda request: httpx.Response(401, json={"error": "Invalid api-key"}))("sync")
+
+    assert result.exit_code != 0
+    assert "Could not sync the local store: Unexpected status code: 401" in result.output
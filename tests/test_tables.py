@@ -0,0 +1,79 @@
+import shlex
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+
+import pytest
+
+from hevy_api_client.cli import utils
+from hevy_api_client.cli.utils import print_plain_table, print_table
+
+
+def python_pager(code: str) -> str:
+    return shlex.join([sys.executable, "-c", code])
+
+
+def test_columns_are_aligned(capsys: pytest.CaptureFixture[str]) -> None:
+    print_plain_table([{"id": "r1", "title": "Push"}, {"id": "r10", "title": "Pull\nday"}])
+
+    assert capsys.readouterr().out == "id   title\n---  --------\nr1   Push\nr10  Pull day\nTotal: 2\n"
+
+
+def test_long_values_are_shortened_and_counted(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(utils, "_SAMPLE_ROWS", 1)
+    rows = [{"id": "1", "notes": "x" * 60}, {"id": "2", "notes": "short"}, {"id": "345", "notes": ""}]
+
+    print_plain_table(rows)
+    lines = capsys.readouterr().out.splitlines()
+
+    # widths come from the sampled rows, capped at 40 characters
+    assert lines[2] == "1   " + "x" * 39 + "…"
+    assert lines[4] == "3…  "
+    assert lines[-1] == "Total: 3 (2 values shortened, see --format)"
+
+
+def test_large_or_redirected_tables_are_plain(capsys: pytest.CaptureFixture[str]) -> None:
+    print_table([{"id": "r1"}])
+
+    assert capsys.readouterr().out == "id\n--\nr1\nTotal: 1\n"
+
+
+def test_terminals_get_a_pager(capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    paged: list[str] = []
+
+    def page(lines: Iterable[str]) -> None:
+        paged.extend(lines)
+
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+    monkeypatch.setattr(utils, "_page", page)
+    print_plain_table([{"id": str(i)} for i in range(3)])
+
+    assert paged == ["id\n", "--\n", "0\n", "1\n", "2\n", "Total: 3\n"]
+    assert capsys.readouterr().out == ""
+
+
+def test_lines_are_streamed_through_the_pager(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    output = tmp_path / "paged.txt"
+    monkeypatch.setenv("PAGER", python_pager(f"import sys; open({str(output)!r}, 'w').write(sys.stdin.read())"))
+
+    utils._page(f"{i}\n" for i in range(1000))
+
+    assert output.read_text().splitlines() == [str(i) for i in range(1000)]
+
+
+def test_quitting_the_pager_early_is_not_an_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PAGER", python_pager("import sys; sys.stdin.readline()"))
+
+    utils._page("x" * 100 + "\n" for _ in range(100_000))
+
+
+def test_without_a_pager_lines_go_to_stdout(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PAGER", "/nonexistent/pager")
+
+    utils._page(["a\n", "b\n"])
+
+    assert capsys.readouterr().out == "a\nb\n"
@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fakes import workout
+
+from hevy_api_client.models import Workout
+from hevy_api_client.timestamps import MIN_DATETIME, parse_timestamp, sort_key, to_datetime
+from hevy_api_client.types import UNSET
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2024-11-01T12:00:00Z", datetime(2024, 11, 1, 12, tzinfo=timezone.utc)),
+        ("2024-11-01T12:00:00.250Z", datetime(2024, 11, 1, 12, 0, 0, 250000, tzinfo=timezone.utc)),
+        ("2024-11-01T14:00:00+02:00", datetime(2024, 11, 1, 14, tzinfo=timezone(timedelta(hours=2)))),
+        ("2024-11-01T12:00:00", datetime(2024, 11, 1, 12, tzinfo=timezone.utc)),
+        # the basic format, which fromisoformat only understands from Python 3.11
+        ("20241101T120000Z", datetime(2024, 11, 1, 12, tzinfo=timezone.utc)),
+    ],
+)
+def test_timestamps_are_parsed_as_aware_datetimes(value: str, expected: datetime) -> None:
+    parsed = parse_timestamp(value)
+
+    assert parsed == expected
+    assert parsed.tzinfo is not None
+
+
+def test_each_timestamp_is_parsed_once() -> None:
+    parse_timestamp.cache_clear()
+
+    assert parse_timestamp("2024-11-02T12:00:00Z") is parse_timestamp("2024-11-02T12:00:00Z")
+    assert parse_timestamp.cache_info().hits == 1
+
+
+@pytest.mark.parametrize("value", [UNSET, None, ""])
+def test_missing_timestamps(value: object) -> None:
+    assert to_datetime(value) is None
+    assert sort_key(value) == MIN_DATETIME
+
+
+def test_missing_timestamps_sort_first() -> None:
+    values = ["2024-11-02T12:00:00Z", None, "2024-11-01T12:00:00+01:00", UNSET]
+
+    assert sorted(values, key=sort_key)[2:] == ["2024-11-01T12:00:00+01:00", "2024-11-02T12:00:00Z"]
+
+
+def test_model_datetime_properties() -> None:
+    model = Workout.from_dict(workout(0))
+
+    assert model.start_datetime == datetime(2024, 11, 1, 12, tzinfo=timezone.utc)
+    assert model.updated_datetime == model.start_datetime
@@ -0,0 +1,60 @@
+import httpx
+import pytest
+from conftest import Hevy
+from fakes import TOKEN, client, page, routine
+
+from hevy_api_client import decoders
+from hevy_api_client.api.routines import get_v1_routines
+from hevy_api_client.caching import ResponseCache
+from hevy_api_client.cli import utils
+from hevy_api_client.cli.timings import Timings
+
+
+@pytest.fixture(autouse=True)
+def fresh_hooks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(decoders, "_parse_hooks", [])
+    monkeypatch.setattr(utils, "_render_hooks", [])
+
+
+def api(request: httpx.Request) -> httpx.Response:
+    return page("routines", [routine(i) for i in range(12)], request)
+
+
+def test_requests_decoding_and_rendering_are_timed(hevy: Hevy) -> None:
+    result = hevy(api)("--timings", "routines", "list")
+
+    rows = {tuple(cell.strip() for cell in line.split("│")[1:3]) for line in result.output.splitlines()}
+
+    assert result.exit_code == 0
+    assert "Timings (ms)" in result.output
+    for phase in ("headers", "decode", "models"):
+        assert ("GET /v1/routines", phase) in rows
+    assert ("print_table", "render") in rows
+
+
+def test_every_parsed_response_is_recorded_once() -> None:
+    timings = Timings()
+    timings.instrument()
+    cached = client(api, cache=ResponseCache(ttl=3600))
+
+    for _ in range(2):
+        get_v1_routines.sync(client=cached, api_key=TOKEN)
+
+    assert len(timings.samples[("GET /v1/routines", "decode")]) == 1
+    # the second one was served from the cache
+    assert len(timings.samples[("GetV1RoutinesResponse200 (local)", "models")]) == 1
+
+
+def test_timings_leave_the_endpoint_modules_untouched() -> None:
+    parse_response = get_v1_routines._parse_response
+
+    Timings().instrument()
+
+    assert get_v1_routines._parse_response is parse_response
+
+
+def test_no_timings_without_the_flag(hevy: Hevy) -> None:
+    result = hevy(api)("routines", "list")
+
+    assert "Timings (ms)" not in result.output
+    assert decoders._parse_hooks == []